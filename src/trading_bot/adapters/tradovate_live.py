@@ -149,6 +149,7 @@ class TradovateLiveAdapter:
 
         # Position tracking
         self._position: int = 0
+        self._position_symbol: str = "MESZ4"  # instrument of the last entry; flatten targets it
         self._last_fill_price: Optional[float] = None
         self._realized_pnl: float = 0.0
 
@@ -348,12 +349,15 @@ class TradovateLiveAdapter:
         # Get limit price
         limit_price = float(meta.get("limit_price", float(last_price)))
 
+        # Entry, bracket and flatten orders all go to the intent's instrument
+        symbol = meta.get("instrument", "MESZ4")  # Default to current MES
+
         # Build order payload
         order_payload = {
             "accountSpec": self._account_spec,
             "accountId": self._account_id,
             "action": action,
-            "symbol": meta.get("instrument", "MESZ4"),  # Default to current MES
+            "symbol": symbol,
             "orderQty": contracts,
             "orderType": "Limit",
             "price": limit_price,
@@ -380,6 +384,7 @@ class TradovateLiveAdapter:
                 )
                 self._orders[order_id] = order_state
                 self._client_to_order_id[client_order_id] = order_id
+                self._position_symbol = symbol
 
                 # Place bracket orders (OSO - One Sends Other)
                 self._place_bracket_orders(
@@ -388,6 +393,7 @@ class TradovateLiveAdapter:
                     contracts=contracts,
                     stop_price=bracket["stop_price"],
                     target_price=bracket.get("target_price"),
+                    symbol=symbol,
                 )
 
                 logger.info(f"Order placed: {order_id} ({direction} {contracts} @ {limit_price})")
@@ -423,8 +429,9 @@ class TradovateLiveAdapter:
         contracts: int,
         stop_price: float,
         target_price: Optional[float],
+        symbol: str = "MESZ4",
     ) -> None:
-        """Place stop-loss and take-profit bracket orders."""
+        """Place stop-loss and take-profit bracket orders on the entry's symbol."""
         try:
             # Stop loss - opposite direction
             stop_action = "Sell" if direction == "LONG" else "Buy"
@@ -433,7 +440,7 @@ class TradovateLiveAdapter:
                 "accountSpec": self._account_spec,
                 "accountId": self._account_id,
                 "action": stop_action,
-                "symbol": "MESZ4",
+                "symbol": symbol,
                 "orderQty": contracts,
                 "orderType": "Stop",
                 "stopPrice": stop_price,
@@ -451,7 +458,7 @@ class TradovateLiveAdapter:
                     "accountSpec": self._account_spec,
                     "accountId": self._account_id,
                     "action": stop_action,
-                    "symbol": "MESZ4",
+                    "symbol": symbol,
                     "orderQty": contracts,
                     "orderType": "Limit",
                     "price": target_price,
@@ -507,7 +514,7 @@ class TradovateLiveAdapter:
                 "accountSpec": self._account_spec,
                 "accountId": self._account_id,
                 "action": action,
-                "symbol": "MESZ4",
+                "symbol": self._position_symbol,
                 "orderQty": qty,
                 "orderType": "Market",
                 "isAutomated": True,
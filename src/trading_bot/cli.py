@@ -1,37 +1,79 @@
 from __future__ import annotations
 import argparse
+import functools
 import json
 import os
 import sys
-import logging
 from pathlib import Path
-from trading_bot.log.event_store import EventStore
-from trading_bot.core.runner import BotRunner
-from trading_bot.tools.replay_runner import replay_stream, replay_json
-from trading_bot.core.types import Event
-from trading_bot.core.types import stable_json, sha256_hex
-from trading_bot.core.config import load_yaml_contract
-from trading_bot.core.adapter_factory import create_adapter
-from decimal import Decimal
-from datetime import datetime, timedelta, timezone
-from zoneinfo import ZoneInfo
-
-
-def main():
-    p = argparse.ArgumentParser("trading-bot")
-    sub = p.add_subparsers(dest="cmd", required=True)
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_SIDE = {"LONG": 1, "SHORT": -1}
+# Longest the live log file lags behind buffered INFO records
+LOG_FLUSH_INTERVAL_S = 5.0
+
+
+def _loads(data: Any) -> Any:
+    """Parse JSON text or bytes; orjson when installed, stdlib for what it rejects (NaN/Infinity)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> str:
+    """Pretty-print JSON with two-space indent, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. Decimal or other types orjson rejects; let stdlib decide
+    return json.dumps(obj, indent=2)
 
-    # init-db
+
+class _Intent(NamedTuple):
+    """Order intent fields read by the adapters' place_order (adapter-demo)."""
+    timestamp: datetime
+    direction: str
+    contracts: int
+    stop_ticks: int
+    target_ticks: int
+    entry_type: str
+    metadata: Dict[str, Any]
+
+
+_ADAPTERS = ("tradovate", "ninjatrader")
+_FILL_MODES = ("IMMEDIATE", "DELAYED", "PARTIAL", "TIMEOUT")
+
+
+def _add_exec_args(p, adapter_help: Optional[str] = None, fill_mode_help: Optional[str] = None) -> None:
+    """Register the --adapter/--fill-mode pair shared by the execution commands."""
+    p.add_argument("--adapter", default="tradovate", choices=_ADAPTERS, help=adapter_help)
+    p.add_argument("--fill-mode", default="IMMEDIATE", choices=_FILL_MODES, help=fill_mode_help)
+
+
+def _add_init_db(sub) -> None:
     s_init = sub.add_parser("init-db")
     s_init.add_argument("--db", default="data/events.sqlite")
     s_init.add_argument("--schema", default="src/trading_bot/log/schema.sql")
 
+
+def _add_run_once(sub) -> None:
     # run-once from bar JSON
     s_run = sub.add_parser("run-once")
     s_run.add_argument("--bar-json", required=True, help="Path to JSON file with bar payload {ts,o,h,l,c,v}")
     s_run.add_argument("--db", default="data/events.sqlite")
-    s_run.add_argument("--adapter", default="tradovate", choices=["tradovate", "ninjatrader"], help="Execution adapter")
-    s_run.add_argument("--fill-mode", default="IMMEDIATE", choices=["IMMEDIATE", "DELAYED", "PARTIAL", "TIMEOUT"], help="SIM fill mode (Tradovate)")
+    _add_exec_args(s_run, adapter_help="Execution adapter", fill_mode_help="SIM fill mode (Tradovate)")
     # LIVE adapter options
     s_run.add_argument("--live", action="store_true", help="Use live Tradovate adapter")
     s_run.add_argument("--account-id", type=int, help="Broker account id (LIVE)")
@@ -42,23 +84,27 @@ def main():
     s_run.add_argument("--reconnect-interval", type=int, default=20)
     s_run.add_argument("--poll-interval", type=int, default=5)
 
+
+def _add_replay_stream(sub) -> None:
     # replay from DB stream of BAR_1M
     s_replay_stream = sub.add_parser("replay-stream")
     s_replay_stream.add_argument("--db", default="data/events.sqlite")
     s_replay_stream.add_argument("--stream", required=True)
     s_replay_stream.add_argument("--contracts", default="src/trading_bot/contracts")
-    s_replay_stream.add_argument("--adapter", default="tradovate", choices=["tradovate", "ninjatrader"])
-    s_replay_stream.add_argument("--fill-mode", default="IMMEDIATE", choices=["IMMEDIATE", "DELAYED", "PARTIAL", "TIMEOUT"])
+    _add_exec_args(s_replay_stream)
+
 
+def _add_replay_json(sub) -> None:
     # replay from JSON array of bars
     s_replay_json = sub.add_parser("replay-json")
     s_replay_json.add_argument("--bars", required=True)
     s_replay_json.add_argument("--db", default="data/events.sqlite")
     s_replay_json.add_argument("--stream", default="MES_RTH")
     s_replay_json.add_argument("--contracts", default="src/trading_bot/contracts")
-    s_replay_json.add_argument("--adapter", default="tradovate", choices=["tradovate", "ninjatrader"])
-    s_replay_json.add_argument("--fill-mode", default="IMMEDIATE", choices=["IMMEDIATE", "DELAYED", "PARTIAL", "TIMEOUT"])
+    _add_exec_args(s_replay_json)
 
+
+def _add_seed_demo_bars(sub) -> None:
     # seed demo BAR_1M events into DB
     s_seed = sub.add_parser("seed-demo-bars")
     s_seed.add_argument("--db", default="data/events.sqlite")
@@ -66,21 +112,27 @@ def main():
     s_seed.add_argument("--start-iso", default="2025-12-18T09:31:00-05:00")
     s_seed.add_argument("--count", type=int, default=30)
 
+
+def _add_report(sub) -> None:
     # simple report dashboard
     s_report = sub.add_parser("report")
     s_report.add_argument("--db", default="data/events.sqlite")
     s_report.add_argument("--stream", required=True)
 
+
+def _add_adapter_demo(sub) -> None:
     # adapter demo (SIM): exercise TTL and modification budget
     s_demo = sub.add_parser("adapter-demo")
-    s_demo.add_argument("--fill-mode", default="TIMEOUT", choices=["IMMEDIATE", "DELAYED", "PARTIAL", "TIMEOUT"], help="SIM fill mode")
+    s_demo.add_argument("--fill-mode", default="TIMEOUT", choices=_FILL_MODES, help="SIM fill mode")
     s_demo.add_argument("--limit-price", type=float, default=5600.50)
     s_demo.add_argument("--contracts", type=int, default=1)
     s_demo.add_argument("--direction", choices=["LONG", "SHORT"], default="LONG")
     s_demo.add_argument("--ttl-seconds", type=int, default=90)
 
-    # ==================== LIVE TRADING ====================
 
+# ==================== LIVE TRADING ====================
+
+def _add_live(sub) -> None:
     # live - Start live trading
     s_live = sub.add_parser("live", help="Start live trading")
     s_live.add_argument("--symbol", default="MESZ4", help="Symbol to trade")
@@ -91,22 +143,32 @@ def main():
     s_live.add_argument("--stream", default="MES_LIVE")
     s_live.add_argument("--verbose", "-v", action="store_true", help="Verbose logging")
 
+
+def _add_status(sub) -> None:
     # status - Get runner status
     s_status = sub.add_parser("status", help="Get trading bot status")
     s_status.add_argument("--db", default="data/events.sqlite")
 
+
+def _add_kill(sub) -> None:
     # kill - Activate kill switch
     s_kill = sub.add_parser("kill", help="Activate kill switch (flatten and stop)")
     s_kill.add_argument("--reason", default="MANUAL_KILL", help="Kill switch reason")
     s_kill.add_argument("--db", default="data/events.sqlite")
 
+
+def _add_sync(sub) -> None:
     # sync - Force sync to Supabase
     s_sync = sub.add_parser("sync", help="Force sync events to Supabase")
     s_sync.add_argument("--db", default="data/events.sqlite")
 
+
+def _add_verify_config(sub) -> None:
     # verify-config - Verify Tradovate and Supabase credentials
-    s_verify = sub.add_parser("verify-config", help="Verify API credentials")
+    sub.add_parser("verify-config", help="Verify API credentials")
 
+
+def _add_evolve(sub) -> None:
     # evolve - Run evolution engine to learn from trades
     s_evolve = sub.add_parser("evolve", help="Run evolution engine to learn from trades")
     s_evolve.add_argument("--db", default="data/events.sqlite")
@@ -114,408 +176,576 @@ def main():
     s_evolve.add_argument("--force", action="store_true", help="Override weekly cadence check")
     s_evolve.add_argument("--dry-run", action="store_true", help="Show proposed changes without applying")
 
-    # show-params - Show current learned parameters
-    s_params = sub.add_parser("show-params", help="Show current learned parameters")
 
-    args = p.parse_args()
+def _add_show_params(sub) -> None:
+    # show-params - Show current learned parameters
+    sub.add_parser("show-params", help="Show current learned parameters")
 
-    if args.cmd == "init-db":
-        store = EventStore(args.db)
-        store.init_schema(args.schema)
-        print(f"Initialized DB at {args.db}")
-        return
 
-    if args.cmd == "run-once":
-        with open(args.bar_json, "r", encoding="utf-8") as f:
-            bar = json.load(f)
-        adapter_kwargs = {}
-        if args.live and args.adapter == "tradovate":
-            adapter_kwargs = {
-                "mode": "LIVE",
-                "account_id": args.account_id,
-                "access_token": args.access_token,
-                "ws_url": args.ws_url,
-                "instrument": args.instrument,
-                "heartbeat_interval": args.heartbeat_interval,
-                "reconnect_interval": args.reconnect_interval,
-                "poll_interval": args.poll_interval,
-            }
-        runner = BotRunner(db_path=args.db, adapter=args.adapter, fill_mode=args.fill_mode, adapter_kwargs=adapter_kwargs)
-        decision = runner.run_once(bar)
-        print(json.dumps(decision, indent=2))
-        return
+def _add_completion(sub) -> None:
+    # completion - Print a static bash completion script
+    sub.add_parser("completion", help="Print a bash completion script (source it from your shell rc)")
 
-    if args.cmd == "replay-stream":
-        # pass-through adapter is not yet supported by replay helpers; run via CLI run-once/replay-json for adapter control
-        replay_stream(args.db, args.stream, contracts_path=args.contracts)
-        return
 
-    if args.cmd == "replay-json":
-        # replay_json builds its own runner internally today; for adapter control use run-once path or extend replay helpers
-        replay_json(args.bars, args.db, stream_id=args.stream, contracts_path=args.contracts)
-        return
+class _NamesOnly:
+    """Subparsers stand-in that registers each command's name and help but drops its arguments."""
 
-    if args.cmd == "seed-demo-bars":
-        ET = ZoneInfo("America/New_York")
-        store = EventStore(args.db)
-        # derive config hash similar to runner
-        try:
-            constitution = load_yaml_contract("src/trading_bot/contracts", "constitution.yaml")
-            session = load_yaml_contract("src/trading_bot/contracts", "session.yaml")
-            strategy_templates = load_yaml_contract("src/trading_bot/contracts", "strategy_templates.yaml")
-            risk_model = load_yaml_contract("src/trading_bot/contracts", "risk_model.yaml")
-        except Exception:
-            constitution = {"missing": True}
-            session = {"missing": True}
-            strategy_templates = {"missing": True}
-            risk_model = {"missing": True}
-        cfg_sources = {
-            "constitution": constitution,
-            "session": session,
-            "strategy_templates": strategy_templates,
-            "risk_model": risk_model,
-            "signal_params": {"tick_size": str(Decimal("0.25"))},
+    def __init__(self, sub):
+        self._sub = sub
+
+    def add_parser(self, name: str, **kwargs: Any) -> "_NamesOnly":
+        self._sub.add_parser(name, **kwargs)
+        return self
+
+    def add_argument(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def _et():
+    """America/New_York, resolved once per process."""
+    from zoneinfo import ZoneInfo
+
+    return ZoneInfo("America/New_York")
+
+
+_MINUTE_STRS = tuple(f"{m:02d}" for m in range(60))
+
+
+def _minute_isoformats(start: datetime, count: int) -> List[str]:
+    """`(start + k * 1min).isoformat()` for k in range(count), one datetime per hour.
+
+    Within an hour only the minute field changes, so each hour's strings are built by
+    splicing the minute into that hour's isoformat. Wall-clock arithmetic and UTC
+    offsets stay exactly as datetime computes them, since ET (and any fixed offset)
+    only changes offset on the hour.
+    """
+    from datetime import timedelta
+
+    one_minute = timedelta(minutes=1)
+    out: List[str] = []
+    k = 0
+    while k < count:
+        wall = start + k * one_minute
+        iso = wall.isoformat()
+        head, tail = iso[:14], iso[16:]  # "YYYY-MM-DDTHH:" | ":SS[.ffffff][+HH:MM]"
+        first = wall.minute
+        n = min(count - k, 60 - first)
+        out.extend([head + _MINUTE_STRS[m] + tail for m in range(first, first + n)])
+        k += n
+    return out
+
+
+def _completion_script() -> str:
+    """Bash completion with every subcommand's options baked in as a literal case table.
+
+    Generated once from the parsers, so completing never starts Python.
+    """
+    lines = [
+        "# bash completion for trading-bot; generated by `trading-bot completion`",
+        "_trading_bot() {",
+        '    local cur="${COMP_WORDS[COMP_CWORD]}"',
+        "    if [ \"$COMP_CWORD\" -eq 1 ]; then",
+        f'        COMPREPLY=($(compgen -W "{" ".join(_COMMANDS)}" -- "$cur"))',
+        "        return",
+        "    fi",
+        '    case "${COMP_WORDS[1]}" in',
+    ]
+    for name in _COMMANDS:
+        sub = next(a for a in _build_parser(name)._actions if a.dest == "cmd")
+        opts = [o for a in sub.choices[name]._actions for o in a.option_strings]
+        lines.append(f'        {name}) COMPREPLY=($(compgen -W "{" ".join(opts)}" -- "$cur")) ;;')
+    lines += [
+        "    esac",
+        "}",
+        "complete -o default -F _trading_bot trading-bot",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _format_change(key: str, change: Any) -> str:
+    """One `evolve` change line: old -> new (delta) for numeric updates, else the raw value."""
+    if isinstance(change, dict) and "old" in change:
+        return f"  {key}: {change['old']:.4f} -> {change['new']:.4f} (Δ{change['delta']:+.4f})"
+    return f"  {key}: {change}"
+
+
+def _cmd_init_db(args) -> None:
+    from trading_bot.log.event_store import EventStore
+
+    store = EventStore(args.db)
+    store.init_schema(args.schema)
+    print(f"Initialized DB at {args.db}")
+
+
+def _cmd_run_once(args) -> None:
+    from trading_bot.core.runner import BotRunner
+
+    with open(args.bar_json, "rb") as f:
+        bar = _loads(f.read())
+    adapter_kwargs = {}
+    if args.live and args.adapter == "tradovate":
+        adapter_kwargs = {
+            "mode": "LIVE",
+            "account_id": args.account_id,
+            "access_token": args.access_token,
+            "ws_url": args.ws_url,
+            "instrument": args.instrument,
+            "heartbeat_interval": args.heartbeat_interval,
+            "reconnect_interval": args.reconnect_interval,
+            "poll_interval": args.poll_interval,
         }
-        config_hash = sha256_hex(stable_json(cfg_sources))
+    runner = BotRunner(db_path=args.db, adapter=args.adapter, fill_mode=args.fill_mode, adapter_kwargs=adapter_kwargs)
+    decision = runner.run_once(bar)
+    print(_dumps(decision))
 
-        # build bars
-        try:
-            start_dt = datetime.fromisoformat(args.start_iso)
-        except Exception:
-            start_dt = datetime(2025, 12, 18, 9, 31, tzinfo=ET)
-        if start_dt.tzinfo is None:
-            start_dt = start_dt.replace(tzinfo=ET)
-
-        events = []
-        cur = start_dt
-        price = Decimal("5000.00")
-        for i in range(args.count):
-            # deterministic gentle move
-            drift = Decimal(str(((i % 10) - 5)))  # -5..+4
-            o = price + drift
-            h = o + Decimal("3.00")
-            l = o - Decimal("3.50")
-            c = o + Decimal(str((i % 3) - 1))  # -1,0,1 pattern
-            v = 1000 + (i * 50)
-            payload = {"o": float(o), "h": float(h), "l": float(l), "c": float(c), "v": v}
-            ts = cur.isoformat()
-            e = Event.make(args.stream, ts, "BAR_1M", payload, config_hash)
-            events.append(e)
-            cur += timedelta(minutes=1)
-        added = store.append_many(events)
-        print(f"Seeded {added} BAR_1M events into stream {args.stream} at {args.db}")
-        return
 
-    if args.cmd == "report":
-        store = EventStore(args.db)
-        events = store.read_stream(args.stream)
-        recon = 0
-        desync = 0
-        cancels = 0
-        skip_hist = {}
-        kill_hist = {}
-        for e in events:
-            if e.type == "RECONCILIATION":
-                recon += 1
-                if e.payload.get("kill_switch"):
-                    desync += 1
-                    reason = e.payload.get("kill_reason", "UNKNOWN")
-                    kill_hist[reason] = kill_hist.get(reason, 0) + 1
-                for a in e.payload.get("actions", []) or []:
-                    if a.get("action") == "CANCEL":
-                        cancels += 1
-            if e.type == "DECISION_RECORD":
-                rc = (e.payload.get("reasons") or {}).get("reason_code")
-                if rc:
-                    skip_hist[rc] = skip_hist.get(rc, 0) + 1
-        print("Reconciliation summary:")
-        print(f"  events: {recon}")
-        print(f"  desync_kills: {desync}")
-        print(f"  ttl_cancels: {cancels}")
-        print("Skip reasons (top 10):")
-        for k, v in sorted(skip_hist.items(), key=lambda kv: kv[1], reverse=True)[:10]:
-            print(f"  {k}: {v}")
-        print("Kill causes:")
-        for k, v in sorted(kill_hist.items(), key=lambda kv: kv[1], reverse=True):
-            print(f"  {k}: {v}")
-        return
+def _cmd_replay_stream(args) -> None:
+    from trading_bot.tools.replay_runner import replay_stream
 
-    if args.cmd == "adapter-demo":
-        # Construct SIM adapter with TIMEOUT to avoid immediate fills
-        adapter = create_adapter("tradovate", fill_mode=args.fill_mode)
-
-        class _IntentObj:
-            def __init__(self, d):
-                for k, v in d.items():
-                    setattr(self, k, v)
-
-        # Build a simple intent with bracket
-        ts = datetime.now(timezone.utc)
-        tick_size = 0.25
-        stop_ticks = 8
-        target_ticks = 12
-        side = 1 if args.direction == "LONG" else -1
-        stop_price = args.limit_price - side * stop_ticks * tick_size
-        target_price = args.limit_price + side * target_ticks * tick_size
-        intent = _IntentObj({
-            "timestamp": ts,
-            "direction": args.direction,
-            "contracts": args.contracts,
-            "stop_ticks": stop_ticks,
-            "target_ticks": target_ticks,
-            "entry_type": "LIMIT",
-            "metadata": {
-                "limit_price": args.limit_price,
-                "bracket": {
-                    "stop_price": round(stop_price, 2),
-                    "target_price": round(target_price, 2),
-                    "target_qty": max(1, args.contracts),
-                }
-            }
-        })
-
-        print("Placing order...")
+    # pass-through adapter is not yet supported by replay helpers; run via CLI run-once/replay-json for adapter control
+    replay_stream(args.db, args.stream, contracts_path=args.contracts)
+
+
+def _cmd_replay_json(args) -> None:
+    from trading_bot.tools.replay_runner import replay_json
+
+    # replay_json builds its own runner internally today; for adapter control use run-once path or extend replay helpers
+    replay_json(args.bars, args.db, stream_id=args.stream, contracts_path=args.contracts)
+
+
+def _cmd_seed_demo_bars(args) -> None:
+    from datetime import datetime
+    from trading_bot.core.config import compute_config_hash
+    from trading_bot.core.types import Event
+    from trading_bot.log.event_store import EventStore
+
+    ET = _et()
+    store = EventStore(args.db)
+    # derive config hash similar to runner
+    config_hash = compute_config_hash("src/trading_bot/contracts")
+
+    # build bars
+    start_dt = None
+    if args.start_iso:
+        try:
+            start_dt = datetime.fromisoformat(args.start_iso)
+        except ValueError:
+            print(f"warning: bad --start-iso {args.start_iso!r}, using default", file=sys.stderr)
+    if start_dt is None:
+        start_dt = datetime(2025, 12, 18, 9, 31, tzinfo=ET)
+    elif start_dt.tzinfo is None:
+        start_dt = start_dt.replace(tzinfo=ET)
+
+    stream = args.stream
+    make_event = Event.make
+    timestamps = _minute_isoformats(start_dt, args.count)
+    # Plain floats: every value is a multiple of 0.5 and exact in binary.
+    # Deterministic gentle move: open cycles 5000 + (-5..+4), close offset cycles -1,0,1.
+    opens = tuple(5000.0 + drift for drift in range(-5, 5))
+    close_offsets = (-1.0, 0.0, 1.0)
+
+    def bars():
+        for i, ts in enumerate(timestamps):
+            o = opens[i % 10]
+            c = o + close_offsets[i % 3]
+            payload = {"o": o, "h": o + 3.0, "l": o - 3.5, "c": c, "v": 1000 + (i * 50)}
+            yield make_event(stream, ts, "BAR_1M", payload, config_hash)
+
+    # Events are built as the single insert transaction consumes them
+    added = store.append_many(bars())
+    print(f"Seeded {added} BAR_1M events into stream {args.stream} at {args.db}")
+
+
+def _cmd_report(args) -> None:
+    import sqlite3
+    from trading_bot.log.event_store import EventStore
+
+    store = EventStore(args.db)
+    try:
+        summary = store.summarize_reconciliation(args.stream)
+    except sqlite3.OperationalError:
+        # SQLite built without JSON1: stream the events through the Python summarizer
+        from trading_bot.log.exporters import summarize_reconciliation
+
+        summary = summarize_reconciliation(store.iter_stream(args.stream))
+    print("Reconciliation summary:")
+    print(f"  events: {summary['reconciliations']}")
+    print(f"  desync_kills: {summary['desync_kills']}")
+    print(f"  ttl_cancels: {summary['ttl_cancels']}")
+    print("Skip reasons (top 10):")
+    for k, v in summary["skip_reasons"].most_common(10):
+        print(f"  {k}: {v}")
+    print("Kill causes:")
+    for k, v in summary["kill_causes"].most_common():
+        print(f"  {k}: {v}")
+
+
+def _cmd_adapter_demo(args) -> None:
+    import io
+    from datetime import datetime, timedelta, timezone
+    from decimal import Decimal
+    from trading_bot.core.adapter_factory import create_adapter
+
+    # Construct SIM adapter with TIMEOUT to avoid immediate fills
+    adapter = create_adapter("tradovate", fill_mode=args.fill_mode)
+
+    # Build a simple intent with bracket
+    ts = datetime.now(timezone.utc)
+    tick_size = 0.25
+    stop_ticks = 8
+    target_ticks = 12
+    side = _SIDE[args.direction]
+    stop_price = args.limit_price - side * stop_ticks * tick_size
+    target_price = args.limit_price + side * target_ticks * tick_size
+    intent = _Intent(
+        timestamp=ts,
+        direction=args.direction,
+        contracts=args.contracts,
+        stop_ticks=stop_ticks,
+        target_ticks=target_ticks,
+        entry_type="LIMIT",
+        metadata={
+            "limit_price": args.limit_price,
+            "bracket": {
+                "stop_price": round(stop_price, 2),
+                "target_price": round(target_price, 2),
+                "target_qty": max(1, args.contracts),
+            },
+        },
+    )
+
+    # Collect the transcript and write it to stdout in one call
+    out = io.StringIO()
+    emit = functools.partial(print, file=out)
+    try:
+        emit("Placing order...")
         res = adapter.place_order(intent, Decimal(str(args.limit_price)))
-        print(json.dumps(res, indent=2))
+        emit(_dumps(res))
         oid = res.get("order_id")
 
         if not oid:
-            print("No order_id returned; demo aborted.")
+            emit("No order_id returned; demo aborted.")
             return
 
-        print("Replace #1 (limit +0.50)...")
+        emit("Replace #1 (limit +0.50)...")
         r1 = adapter.replace_order(oid, {"limit_price": args.limit_price + 0.50})
-        print(json.dumps(r1, indent=2))
+        emit(_dumps(r1))
 
-        print("Replace #2 (limit -0.25)...")
+        emit("Replace #2 (limit -0.25)...")
         r2 = adapter.replace_order(oid, {"limit_price": args.limit_price + 0.25})
-        print(json.dumps(r2, indent=2))
+        emit(_dumps(r2))
 
-        print("Replace #3 (should fail due to cap)...")
+        emit("Replace #3 (should fail due to cap)...")
         r3 = adapter.replace_order(oid, {"limit_price": args.limit_price})
-        print(json.dumps(r3, indent=2))
+        emit(_dumps(r3))
 
-        print("Attempt cancel (may fail if cap reached)...")
+        emit("Attempt cancel (may fail if cap reached)...")
         ok = adapter.cancel_order(oid)
-        print(json.dumps({"cancel_ok": ok}, indent=2))
+        emit(_dumps({"cancel_ok": ok}))
 
-        print("Advancing time to enforce TTL...")
+        emit("Advancing time to enforce TTL...")
         future = ts + timedelta(seconds=max(1, args.ttl_seconds + 1))
         adapter.on_cycle(future, ttl_seconds=args.ttl_seconds)
 
-        print("Open orders snapshot:")
-        print(json.dumps(adapter.get_open_orders(), indent=2))
-        return
-
-    # ==================== LIVE TRADING COMMANDS ====================
-
-    if args.cmd == "live":
-        # Set up logging
-        log_level = logging.DEBUG if args.verbose else logging.INFO
-        logging.basicConfig(
-            level=log_level,
-            format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                logging.FileHandler("data/trading.log"),
-            ],
-        )
-
-        # Check required environment variables
-        required_vars = ["TRADOVATE_USERNAME", "TRADOVATE_PASSWORD"]
-        missing = [v for v in required_vars if not os.environ.get(v)]
-        if missing:
-            print(f"Error: Missing environment variables: {', '.join(missing)}")
-            print("\nSet these before running live trading:")
-            print("  export TRADOVATE_USERNAME='your_username'")
-            print("  export TRADOVATE_PASSWORD='your_password'")
-            sys.exit(1)
-
-        # Import and run
-        from trading_bot.core.live_runner import LiveRunner, TradovateConfig, TradovateEnvironment
-
-        config = TradovateConfig(
-            username=os.environ["TRADOVATE_USERNAME"],
-            password=os.environ["TRADOVATE_PASSWORD"],
-            environment=TradovateEnvironment(args.environment),
-        )
-
-        def alert_callback(level: str, message: str):
-            print(f"\n[ALERT:{level.upper()}] {message}")
-
-        runner = LiveRunner(
-            tradovate_config=config,
-            symbol=args.symbol,
-            stream_id=args.stream,
-            contracts_path=args.contracts,
-            db_path=args.db,
-            on_alert=alert_callback,
-        )
-
-        print(f"Starting live trading: {args.symbol} on {args.environment}")
-        print("Press Ctrl+C to stop\n")
-
-        if runner.start():
-            runner.run()
-        else:
-            print("Failed to start live runner")
-            sys.exit(1)
-        return
-
-    if args.cmd == "status":
-        # Show recent trading activity
-        store = EventStore(args.db)
-        print("Trading Bot Status")
-        print("-" * 40)
-
-        # Get recent events
-        recent = store.query(limit=10)
-        if recent:
-            print(f"\nLast {len(recent)} events:")
-            for event in recent:
-                print(f"  {event['timestamp']} | {event['event_type']}")
-        else:
-            print("\nNo events found")
-
-        # Check for Supabase connection
-        url = os.environ.get("SUPABASE_URL")
-        if url:
-            print(f"\nSupabase: {url[:40]}...")
-        else:
-            print("\nSupabase: Not configured")
-
-        return
-
-    if args.cmd == "kill":
-        print(f"Kill switch activated: {args.reason}")
-        print("Note: This command only logs the kill. For live trading,")
-        print("the kill switch in the runner will flatten and stop.")
-
-        store = EventStore(args.db)
-        ts = datetime.now(ZoneInfo("America/New_York")).isoformat()
-        event = Event.make("SYSTEM", ts, "KILL_SWITCH", {
-            "reason": args.reason,
-            "source": "CLI",
-        }, "manual")
-        store.append(event)
-        print(f"Kill event logged at {ts}")
-        return
-
-    if args.cmd == "sync":
-        print("Force syncing events to Supabase...")
-        from trading_bot.log.event_publisher import EventPublisher
-
-        publisher = EventPublisher(sqlite_path=args.db)
-        if publisher.start():
-            synced = publisher.force_sync()
-            print(f"Synced {synced} events")
-            publisher.stop()
-        else:
-            print("Failed to start publisher (check SUPABASE_URL and SUPABASE_KEY)")
-        return
-
-    if args.cmd == "verify-config":
-        print("Verifying configuration...")
-        print("-" * 40)
-
-        # Check Tradovate
-        tv_user = os.environ.get("TRADOVATE_USERNAME")
-        tv_pass = os.environ.get("TRADOVATE_PASSWORD")
-        if tv_user and tv_pass:
-            print(f"✓ Tradovate credentials set (user: {tv_user})")
-        else:
-            print("✗ Tradovate credentials missing")
-            print("  Set TRADOVATE_USERNAME and TRADOVATE_PASSWORD")
-
-        # Check Supabase
-        sb_url = os.environ.get("SUPABASE_URL")
-        sb_key = os.environ.get("SUPABASE_KEY")
-        if sb_url and sb_key:
-            print(f"✓ Supabase configured ({sb_url[:40]}...)")
-        else:
-            print("✗ Supabase not configured")
-            print("  Set SUPABASE_URL and SUPABASE_KEY")
-
-        # Check contracts
-        contracts_dir = "src/trading_bot/contracts"
-        required_files = ["risk_model.yaml", "data_contract.yaml", "execution_contract.yaml"]
-        contracts_path = Path(contracts_dir)
-        if contracts_path.exists():
-            found = [f for f in required_files if (contracts_path / f).exists()]
-            print(f"✓ Contracts directory: {len(found)}/{len(required_files)} files found")
-            for f in required_files:
-                status = "✓" if (contracts_path / f).exists() else "✗"
-                print(f"  {status} {f}")
-        else:
-            print(f"✗ Contracts directory not found: {contracts_dir}")
-
+        emit("Open orders snapshot:")
+        emit(_dumps(adapter.get_open_orders()))
+    finally:
+        sys.stdout.write(out.getvalue())
+
+
+# ==================== LIVE TRADING COMMANDS ====================
+
+def _cmd_live(args) -> None:
+    # Set up logging; handlers run on a listener thread so the trading loop never blocks on disk I/O
+    import logging
+    import queue
+    import threading
+    from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+
+    log_level = logging.DEBUG if args.verbose else logging.INFO
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    console = logging.StreamHandler(sys.stdout)
+    log_file = logging.FileHandler("data/trading.log")
+    for handler in (console, log_file):
+        handler.setFormatter(formatter)
+    # The file gets records in batches of 256, immediately from WARNING up, and at
+    # least every LOG_FLUSH_INTERVAL_S so a hard crash loses only seconds of INFO lines
+    file_buffer = MemoryHandler(capacity=256, flushLevel=logging.WARNING, target=log_file)
+    flush_stop = threading.Event()
+
+    def _flush_log_file() -> None:
+        while not flush_stop.wait(LOG_FLUSH_INTERVAL_S):
+            file_buffer.flush()
+
+    log_flusher = threading.Thread(target=_flush_log_file, name="log-flusher", daemon=True)
+    log_queue = queue.SimpleQueue()
+    log_listener = QueueListener(log_queue, console, file_buffer)
+    queue_handler = QueueHandler(log_queue)
+    # QueueHandler bakes its own formatting into the record before enqueueing;
+    # keep it to the bare message so the listener's handlers apply the real format.
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=log_level, handlers=[queue_handler])
+    log_listener.start()
+    log_flusher.start()
+    try:
+        _run_live(args)
+    finally:
+        log_listener.stop()
+        flush_stop.set()
+        log_flusher.join()
+        file_buffer.close()  # flushes whatever is still buffered
+        log_file.close()
+
+
+def _run_live(args) -> None:
+    """Body of the `live` command, run while the queued log listener is active."""
+    # Check required environment variables (read once; reused for the config below)
+    username = os.environ.get("TRADOVATE_USERNAME")
+    password = os.environ.get("TRADOVATE_PASSWORD")
+    missing = [name for name, value in (("TRADOVATE_USERNAME", username), ("TRADOVATE_PASSWORD", password)) if not value]
+    if missing:
+        print(f"Error: Missing environment variables: {', '.join(missing)}")
+        print("\nSet these before running live trading:")
+        print("  export TRADOVATE_USERNAME='your_username'")
+        print("  export TRADOVATE_PASSWORD='your_password'")
+        sys.exit(1)
+
+    # Import and run
+    from trading_bot.core.live_runner import LiveRunner, TradovateConfig, TradovateEnvironment
+
+    config = TradovateConfig(
+        username=username,
+        password=password,
+        environment=TradovateEnvironment(args.environment),
+    )
+
+    def alert_callback(level: str, message: str):
+        print(f"\n[ALERT:{level.upper()}] {message}")
+
+    runner = LiveRunner(
+        tradovate_config=config,
+        symbol=args.symbol,
+        stream_id=args.stream,
+        contracts_path=args.contracts,
+        db_path=args.db,
+        on_alert=alert_callback,
+    )
+
+    print(f"Starting live trading: {args.symbol} on {args.environment}")
+    print("Press Ctrl+C to stop\n")
+
+    if runner.start():
+        runner.run()
+    else:
+        print("Failed to start live runner")
+        sys.exit(1)
+
+
+def _cmd_status(args) -> None:
+    from trading_bot.log.event_store import EventStore
+
+    # Show recent trading activity
+    store = EventStore(args.db)
+    print("Trading Bot Status")
+    print("-" * 40)
+
+    # Get recent events
+    recent = store.tail(10)
+    if recent:
+        print(f"\nLast {len(recent)} events:")
+        for ts, etype in recent:
+            print(f"  {ts} | {etype}")
+    else:
+        print("\nNo events found")
+
+    # Check for Supabase connection
+    url = os.environ.get("SUPABASE_URL")
+    if url:
+        print(f"\nSupabase: {url[:40]}...")
+    else:
+        print("\nSupabase: Not configured")
+
+
+def _cmd_kill(args) -> None:
+    from datetime import datetime
+    from trading_bot.core.types import Event
+    from trading_bot.log.event_store import EventStore
+
+    print(f"Kill switch activated: {args.reason}")
+    print("Note: This command only logs the kill. For live trading,")
+    print("the kill switch in the runner will flatten and stop.")
+
+    store = EventStore(args.db)
+    ts = datetime.now(_et()).isoformat()
+    event = Event.make("SYSTEM", ts, "KILL_SWITCH", {
+        "reason": args.reason,
+        "source": "CLI",
+    }, "manual")
+    store.append(event)
+    print(f"Kill event logged at {ts}")
+
+
+def _cmd_sync(args) -> None:
+    print("Force syncing events to Supabase...")
+    from trading_bot.log.event_publisher import EventPublisher
+
+    publisher = EventPublisher(sqlite_path=args.db)
+    if publisher.start():
+        synced = publisher.force_sync()
+        print(f"Synced {synced} events")
+        publisher.stop()
+    else:
+        print("Failed to start publisher (check SUPABASE_URL and SUPABASE_KEY)")
+
+
+def _cmd_verify_config(args) -> None:
+    print("Verifying configuration...")
+    print("-" * 40)
+
+    # Check Tradovate
+    tv_user = os.environ.get("TRADOVATE_USERNAME")
+    tv_pass = os.environ.get("TRADOVATE_PASSWORD")
+    if tv_user and tv_pass:
+        print(f"✓ Tradovate credentials set (user: {tv_user})")
+    else:
+        print("✗ Tradovate credentials missing")
+        print("  Set TRADOVATE_USERNAME and TRADOVATE_PASSWORD")
+
+    # Check Supabase
+    sb_url = os.environ.get("SUPABASE_URL")
+    sb_key = os.environ.get("SUPABASE_KEY")
+    if sb_url and sb_key:
+        print(f"✓ Supabase configured ({sb_url[:40]}...)")
+    else:
+        print("✗ Supabase not configured")
+        print("  Set SUPABASE_URL and SUPABASE_KEY")
+
+    # Check contracts
+    contracts_dir = "src/trading_bot/contracts"
+    required_files = ["risk_model.yaml", "data_contract.yaml", "execution_contract.yaml"]
+    contracts_path = Path(contracts_dir)
+    if contracts_path.exists():
+        present = {f: (contracts_path / f).exists() for f in required_files}
+        print(f"✓ Contracts directory: {sum(present.values())}/{len(required_files)} files found")
+        for f, exists in present.items():
+            status = "✓" if exists else "✗"
+            print(f"  {status} {f}")
+    else:
+        print(f"✗ Contracts directory not found: {contracts_dir}")
+
+
+def _cmd_evolve(args) -> None:
+    print("Running Evolution Engine...")
+    print("-" * 40)
+
+    from trading_bot.engines.evolution import create_evolution_engine
+
+    engine = create_evolution_engine(
+        db_path=args.db,
+        contracts_path=args.contracts,
+    )
+
+    result = engine.run_evolution(
+        force=args.force,
+        dry_run=args.dry_run,
+    )
+
+    print(f"\nResult: {result.reason}")
+    print(f"Trades analyzed: {result.trades_analyzed}")
+    print(f"Parameters updated: {result.parameters_updated}")
+
+    if result.changes:
+        lines = ["\nChanges:"]
+        lines += [_format_change(key, change) for key, change in result.changes.items()]
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    if args.dry_run:
+        print("\n(Dry run - no changes applied)")
+
+
+def _cmd_show_params(args) -> None:
+    print("Learned Parameters")
+    print("-" * 40)
+
+    params_path = Path("data/learned_params.json")
+    if not params_path.exists():
+        print("No learned parameters found.")
+        print("Run 'evolve' command to generate parameters from trades.")
         return
 
-    if args.cmd == "evolve":
-        print("Running Evolution Engine...")
-        print("-" * 40)
-
-        from trading_bot.engines.evolution import create_evolution_engine
-
-        engine = create_evolution_engine(
-            db_path=args.db,
-            contracts_path=args.contracts,
-        )
-
-        result = engine.run_evolution(
-            force=args.force,
-            dry_run=args.dry_run,
-        )
-
-        print(f"\nResult: {result.reason}")
-        print(f"Trades analyzed: {result.trades_analyzed}")
-        print(f"Parameters updated: {result.parameters_updated}")
-
-        if result.changes:
-            print("\nChanges:")
-            for key, change in result.changes.items():
-                if isinstance(change, dict) and "old" in change:
-                    print(f"  {key}: {change['old']:.4f} -> {change['new']:.4f} (Δ{change['delta']:+.4f})")
-                else:
-                    print(f"  {key}: {change}")
-
-        if args.dry_run:
-            print("\n(Dry run - no changes applied)")
-
-        return
-
-    if args.cmd == "show-params":
-        print("Learned Parameters")
-        print("-" * 40)
-
-        params_path = Path("data/learned_params.json")
-        if not params_path.exists():
-            print("No learned parameters found.")
-            print("Run 'evolve' command to generate parameters from trades.")
-            return
-
-        with open(params_path, "r") as f:
-            params = json.load(f)
-
-        print(f"\nVersion: {params.get('version', 0)}")
-        print(f"Last updated: {params.get('last_updated', 'Never')}")
-        print(f"Update reason: {params.get('update_reason', 'N/A')}")
-
-        print("\nSignal Weights:")
-        for constraint_id, signals in params.get("signal_weights", {}).items():
-            print(f"  {constraint_id}:")
-            for signal, weight in signals.items():
-                print(f"    {signal}: {weight:.3f}")
-
-        print("\nBelief Thresholds:")
-        for constraint_id, threshold in params.get("belief_thresholds", {}).items():
-            print(f"  {constraint_id}: {threshold:.3f}")
-
-        print("\nDecay Rates:")
-        for constraint_id, rate in params.get("decay_rates", {}).items():
-            print(f"  {constraint_id}: {rate:.3f}")
-
-        return
+    params = _loads(params_path.read_bytes())
+
+    print(f"\nVersion: {params.get('version', 0)}")
+    print(f"Last updated: {params.get('last_updated', 'Never')}")
+    print(f"Update reason: {params.get('update_reason', 'N/A')}")
+
+    print("\nSignal Weights:")
+    for constraint_id, signals in params.get("signal_weights", {}).items():
+        print(f"  {constraint_id}:")
+        for signal, weight in signals.items():
+            print(f"    {signal}: {weight:.3f}")
+
+    print("\nBelief Thresholds:")
+    for constraint_id, threshold in params.get("belief_thresholds", {}).items():
+        print(f"  {constraint_id}: {threshold:.3f}")
+
+    print("\nDecay Rates:")
+    for constraint_id, rate in params.get("decay_rates", {}).items():
+        print(f"  {constraint_id}: {rate:.3f}")
+
+
+def _cmd_completion(args) -> None:
+    sys.stdout.write(_completion_script())
+
+
+# Subcommand name -> (function registering its subparser, handler), in help-listing order.
+_COMMANDS: Dict[str, Tuple[Callable[[Any], None], Callable[[argparse.Namespace], None]]] = {
+    "init-db": (_add_init_db, _cmd_init_db),
+    "run-once": (_add_run_once, _cmd_run_once),
+    "replay-stream": (_add_replay_stream, _cmd_replay_stream),
+    "replay-json": (_add_replay_json, _cmd_replay_json),
+    "seed-demo-bars": (_add_seed_demo_bars, _cmd_seed_demo_bars),
+    "report": (_add_report, _cmd_report),
+    "adapter-demo": (_add_adapter_demo, _cmd_adapter_demo),
+    "live": (_add_live, _cmd_live),
+    "status": (_add_status, _cmd_status),
+    "kill": (_add_kill, _cmd_kill),
+    "sync": (_add_sync, _cmd_sync),
+    "verify-config": (_add_verify_config, _cmd_verify_config),
+    "evolve": (_add_evolve, _cmd_evolve),
+    "show-params": (_add_show_params, _cmd_show_params),
+    "completion": (_add_completion, _cmd_completion),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(cmd: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser, registering only `cmd`'s subparser when it is known.
+
+    Memoized per command; argparse parsers are reusable across parse_args calls.
+    """
+    p = argparse.ArgumentParser("trading-bot")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    if cmd in _COMMANDS:
+        _COMMANDS[cmd][0](sub)
+    else:
+        # No subcommand to run (top-level -h, typo, no args): the listing only
+        # needs names and help strings, so skip every subparser's arguments.
+        names_only = _NamesOnly(sub)
+        for add, _ in _COMMANDS.values():
+            add(names_only)
+    return p
+
+
+def main(argv: Optional[List[str]] = None):
+    if argv is None:
+        argv = sys.argv[1:]
+    # The subcommand is always the first token (the top-level parser only takes -h),
+    # so anything else (-h, typos, no args) falls back to the full parser.
+    cmd = argv[0] if argv and argv[0] in _COMMANDS else None
+    args = _build_parser(cmd).parse_args(argv)
+    _COMMANDS[args.cmd][1](args)
 
 
 if __name__ == "__main__":
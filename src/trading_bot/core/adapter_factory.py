@@ -2,15 +2,31 @@ from __future__ import annotations
 
 from typing import Any
 
-from trading_bot.adapters.tradovate import TradovateSimAdapter, TradovateLiveAdapter
+__all__ = ["create_adapter"]
+
+# Adapter alias -> (adapter kind, alias forces live mode)
+_ALIASES = {
+    "tradovate": ("tradovate", False),
+    "tv": ("tradovate", False),
+    "sim": ("tradovate", False),
+    "tradovate-sim": ("tradovate", False),
+    "tradovate-live": ("tradovate", True),
+    "tv-live": ("tradovate", True),
+    "ninjatrader": ("ninjatrader", False),
+    "nt": ("ninjatrader", False),
+    "bridge": ("ninjatrader", False),
+}
 
 
 def create_adapter(name: str = "tradovate", **kwargs: Any):
-    n = (name or "").strip().lower()
-    mode = (kwargs.get("mode") or "SIMULATED").upper()
+    alias = _ALIASES.get(name) or _ALIASES.get((name or "").strip().lower())
+    if alias is None:
+        raise ValueError(f"Unknown adapter name: {name}")
+    kind, force_live = alias
 
-    if n in ("tradovate", "tv", "sim", "tradovate-sim", "tradovate-live", "tv-live"):
-        if mode == "LIVE" or n in ("tradovate-live", "tv-live"):
+    if kind == "tradovate":
+        from trading_bot.adapters.tradovate import TradovateSimAdapter, TradovateLiveAdapter
+        if force_live or (kwargs.get("mode") or "SIMULATED").upper() == "LIVE":
             return TradovateLiveAdapter(
                 api_url=kwargs.get("api_url") or "https://live.tradovateapi.com/v1",
                 ws_url=kwargs.get("ws_url"),
@@ -24,10 +40,7 @@ def create_adapter(name: str = "tradovate", **kwargs: Any):
         # Pass through optional fill_mode for SIM
         fill_mode = (kwargs.get("fill_mode") or "IMMEDIATE").upper()
         return TradovateSimAdapter(mode="SIMULATED", fill_mode=fill_mode)
-    elif n in ("ninjatrader", "nt", "bridge"):
-        from trading_bot.adapters.ninjatrader_bridge import NinjaTraderBridgeAdapter
-        base_url = kwargs.get("base_url") or "http://127.0.0.1:8123"
-        auth_token = kwargs.get("auth_token") or "changeme"
-        return NinjaTraderBridgeAdapter(base_url=base_url, auth_token=auth_token)
-    else:
-        raise ValueError(f"Unknown adapter name: {name}")
+    from trading_bot.adapters.ninjatrader_bridge import NinjaTraderBridgeAdapter
+    base_url = kwargs.get("base_url") or "http://127.0.0.1:8123"
+    auth_token = kwargs.get("auth_token") or "changeme"
+    return NinjaTraderBridgeAdapter(base_url=base_url, auth_token=auth_token)
@@ -36,6 +36,27 @@ class StrategyClass(str, Enum):
     META = "META"
 
 
+# Value lookups: plain dict hits instead of Enum.__call__ for registry parsing.
+_BIAS_BY_VALUE: Dict[str, BiasCategory] = {c.value: c for c in BiasCategory}
+_STRATEGY_BY_VALUE: Dict[str, StrategyClass] = {c.value: c for c in StrategyClass}
+
+
+def parse_bias_category(value: str) -> BiasCategory:
+    """Same result and ValueError as BiasCategory(value) for string values."""
+    try:
+        return _BIAS_BY_VALUE[value]
+    except (KeyError, TypeError):
+        return BiasCategory(value)
+
+
+def parse_strategy_class(value: str) -> StrategyClass:
+    """Same result and ValueError as StrategyClass(value) for string values."""
+    try:
+        return _STRATEGY_BY_VALUE[value]
+    except (KeyError, TypeError):
+        return StrategyClass(value)
+
+
 @dataclass
 class BiasSpec:
     """Static registry definition of a market bias."""
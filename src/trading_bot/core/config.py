@@ -1,10 +1,18 @@
 from __future__ import annotations
+import copy
+import functools
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # LibYAML-backed, same semantics as safe_load
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from .types import sha256_hex, stable_json
 
 CONTRACT_FILES = [
@@ -36,18 +44,32 @@ def load_yaml_contract(contracts_dir: str, filename: str) -> Dict[str, Any]:
     Returns:
         Parsed YAML contract as a dictionary
     """
-    root = Path(contracts_dir)
-    contract_path = root / filename
-    with contract_path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    contract_path = os.path.abspath(os.path.join(contracts_dir, filename))
+    mtime_ns = os.stat(contract_path).st_mtime_ns
+    # Callers own (and may mutate) the returned dict; hand out a copy of the cached parse.
+    return copy.deepcopy(_parse_yaml_file(contract_path, mtime_ns))
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml_file(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML file; cached per (path, mtime) so edits invalidate the entry."""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)
 
 def load_contracts(contracts_dir: str) -> Contracts:
     root = Path(contracts_dir)
+    paths = tuple(os.path.abspath(root / fn) for fn in CONTRACT_FILES)
+    mtimes = tuple(os.stat(p).st_mtime_ns for p in paths)
+    docs, config_hash = _load_normalized_contracts(paths, mtimes)
+    # Same ownership rule as load_yaml_contract: each caller gets its own docs.
+    return Contracts(root=root, docs=copy.deepcopy(docs), config_hash=config_hash)
+
+@functools.lru_cache(maxsize=8)
+def _load_normalized_contracts(paths: Tuple[str, ...], mtimes: Tuple[int, ...]) -> Tuple[Dict[str, Dict[str, Any]], str]:
+    """Parse, normalize and hash the contract set; cached until any file's mtime changes."""
     docs: Dict[str, Dict[str, Any]] = {}
-    for fn in CONTRACT_FILES:
-        p = root / fn
-        with p.open("r", encoding="utf-8") as f:
-            docs[fn] = yaml.safe_load(f)
+    for fn, path, mtime_ns in zip(CONTRACT_FILES, paths, mtimes):
+        # normalize_* mutate in place, so never hand them the per-file cache entry
+        docs[fn] = copy.deepcopy(_parse_yaml_file(path, mtime_ns))
     
     # Normalize all contracts
     if "execution_contract.yaml" in docs:
@@ -65,7 +87,35 @@ def load_contracts(contracts_dir: str) -> Contracts:
     
     # Hash normalized representation (stable_json)
     config_hash = sha256_hex(stable_json(docs))
-    return Contracts(root=root, docs=docs, config_hash=config_hash)
+    return docs, config_hash
+
+SEED_CONTRACTS = ("constitution", "session", "strategy_templates", "risk_model")
+
+def compute_config_hash(contracts_dir: str) -> str:
+    """Config hash stamped on seeded/demo events: raw SEED_CONTRACTS plus the signal tick size.
+
+    Distinct from Contracts.config_hash (which hashes the normalized full set) and kept
+    byte-stable so re-seeding stays idempotent. Memoized in-process on the files'
+    (path, mtime_ns, size) and, via config_hash_cache, across invocations.
+    """
+    from . import config_hash_cache
+
+    fp = config_hash_cache.fingerprint(os.path.join(contracts_dir, f"{name}.yaml") for name in SEED_CONTRACTS)
+    return _config_hash_for(contracts_dir, fp)
+
+@functools.lru_cache(maxsize=16)
+def _config_hash_for(contracts_dir: str, fp: tuple) -> str:
+    from . import config_hash_cache
+
+    def compute() -> str:
+        try:
+            cfg_sources = {name: load_yaml_contract(contracts_dir, f"{name}.yaml") for name in SEED_CONTRACTS}
+        except Exception:
+            cfg_sources = {name: {"missing": True} for name in SEED_CONTRACTS}
+        cfg_sources["signal_params"] = {"tick_size": "0.25"}
+        return sha256_hex(stable_json(cfg_sources))
+
+    return config_hash_cache.get_hash("seed-demo-bars/v1", fp, compute)
 
 
 def _require(condition: bool, msg: str) -> None:
@@ -74,6 +124,30 @@ def _require(condition: bool, msg: str) -> None:
         raise ValueError(msg)
 
 
+def _index_by_id(
+    items: List[Any], path: str, kind: str, required: Tuple[str, ...] = ()
+) -> Tuple[Dict[str, Any], List[str]]:
+    """Validate a list of objects keyed by unique, non-empty string ids.
+
+    Returns (by_id, ids) with ids stripped and in list order. `path` prefixes
+    per-item errors, `kind` names the item in duplicate-id errors, and every
+    key in `required` must be present on each item.
+    """
+    by_id: Dict[str, Any] = {}
+    ids: List[str] = []
+    for idx, item in enumerate(items):
+        _require(isinstance(item, dict), f"{path}[{idx}] must be an object")
+        item_id = item.get("id")
+        _require(isinstance(item_id, str) and item_id.strip(), f"{path}[{idx}] missing non-empty 'id'")
+        for key in required:
+            _require(key in item, f"{path}[{idx}] missing '{key}'")
+        item_id = item_id.strip()
+        _require(item_id not in by_id, f"duplicate {kind} id: {item_id}")
+        by_id[item_id] = item
+        ids.append(item_id)
+    return by_id, ids
+
+
 def normalize_execution_contract(execution_contract: Dict[str, Any]) -> Dict[str, Any]:
     """
     Normalize execution_contract into a deterministic, validated shape.
@@ -93,18 +167,12 @@ def normalize_execution_contract(execution_contract: Dict[str, Any]) -> Dict[str
     events = eqs.get("degradation_events", [])
     _require(isinstance(events, list), "execution_contract.eqs.degradation_events must be a list")
 
-    by_id: Dict[str, Any] = {}
-    ids: List[str] = []
-    for idx, ev in enumerate(events):
-        _require(isinstance(ev, dict), f"execution_contract.eqs.degradation_events[{idx}] must be an object")
-        _require("id" in ev and isinstance(ev["id"], str) and ev["id"].strip(),
-                 f"execution_contract.eqs.degradation_events[{idx}] missing non-empty 'id'")
-        _require("condition" in ev, f"execution_contract.eqs.degradation_events[{idx}] missing 'condition'")
-
-        ev_id = ev["id"].strip()
-        _require(ev_id not in by_id, f"duplicate execution_contract.eqs.degradation_events id: {ev_id}")
-        by_id[ev_id] = ev
-        ids.append(ev_id)
+    by_id, ids = _index_by_id(
+        events,
+        "execution_contract.eqs.degradation_events",
+        "execution_contract.eqs.degradation_events",
+        required=("condition",),
+    )
 
     eqs["degradation_events"] = events
     eqs["degradation_events_by_id"] = by_id
@@ -120,15 +188,7 @@ def normalize_session_contract(session: Dict[str, Any]) -> Dict[str, Any]:
     no_trade_windows = session.get("no_trade_windows", [])
     _require(isinstance(no_trade_windows, list), "session.no_trade_windows must be a list")
     
-    by_id: Dict[str, Any] = {}
-    for idx, window in enumerate(no_trade_windows):
-        _require(isinstance(window, dict), f"session.no_trade_windows[{idx}] must be an object")
-        _require("id" in window and isinstance(window["id"], str) and window["id"].strip(),
-                 f"session.no_trade_windows[{idx}] missing non-empty 'id'")
-        win_id = window["id"].strip()
-        _require(win_id not in by_id, f"duplicate session.no_trade_windows id: {win_id}")
-        by_id[win_id] = window
-    
+    by_id, _ = _index_by_id(no_trade_windows, "session.no_trade_windows", "session.no_trade_windows")
     session["no_trade_windows_by_id"] = by_id
     return session
 
@@ -143,14 +203,7 @@ def normalize_data_contract(data_contract: Dict[str, Any]) -> Dict[str, Any]:
     events = dvs.get("degradation_events", [])
     _require(isinstance(events, list), "data_contract.dvs.degradation_events must be a list")
     
-    by_id: Dict[str, Any] = {}
-    for idx, ev in enumerate(events):
-        _require(isinstance(ev, dict), f"data_contract.dvs.degradation_events[{idx}] must be an object")
-        _require("id" in ev, f"data_contract.dvs.degradation_events[{idx}] missing 'id'")
-        ev_id = ev["id"].strip()
-        _require(ev_id not in by_id, f"duplicate data_contract.dvs.degradation_events id: {ev_id}")
-        by_id[ev_id] = ev
-    
+    by_id, _ = _index_by_id(events, "data_contract.dvs.degradation_events", "data_contract.dvs.degradation_events")
     dvs["degradation_events_by_id"] = by_id
     data_contract["dvs"] = dvs
     return data_contract
@@ -163,14 +216,7 @@ def normalize_strategy_templates(strategy: Dict[str, Any]) -> Dict[str, Any]:
     templates = strategy.get("strategy_templates", [])
     _require(isinstance(templates, list), "strategy_templates.strategy_templates must be a list")
     
-    by_id: Dict[str, Any] = {}
-    for idx, tmpl in enumerate(templates):
-        _require(isinstance(tmpl, dict), f"strategy_templates[{idx}] must be an object")
-        _require("id" in tmpl, f"strategy_templates[{idx}] missing 'id'")
-        tmpl_id = tmpl["id"].strip()
-        _require(tmpl_id not in by_id, f"duplicate strategy template id: {tmpl_id}")
-        by_id[tmpl_id] = tmpl
-    
+    by_id, _ = _index_by_id(templates, "strategy_templates", "strategy template")
     strategy["strategy_templates_by_id"] = by_id
     return strategy
 
@@ -184,14 +230,7 @@ def normalize_risk_model(risk: Dict[str, Any]) -> Dict[str, Any]:
         triggers = kill_switch.get("triggers", [])
         _require(isinstance(triggers, list), "risk_model.kill_switch.triggers must be a list")
         
-        by_id: Dict[str, Any] = {}
-        for idx, trigger in enumerate(triggers):
-            _require(isinstance(trigger, dict), f"kill_switch.triggers[{idx}] must be an object")
-            _require("id" in trigger, f"kill_switch.triggers[{idx}] missing 'id'")
-            trig_id = trigger["id"].strip()
-            _require(trig_id not in by_id, f"duplicate kill_switch trigger id: {trig_id}")
-            by_id[trig_id] = trigger
-        
+        by_id, _ = _index_by_id(triggers, "kill_switch.triggers", "kill_switch trigger")
         kill_switch["triggers_by_id"] = by_id
         risk["kill_switch"] = kill_switch
     
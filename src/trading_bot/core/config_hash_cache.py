@@ -0,0 +1,72 @@
+"""Disk cache for config hashes derived from contract files.
+
+Computing a config hash means parsing YAML, which dominates short CLI runs. The
+cache maps a fingerprint of the source files ((path, mtime_ns, size) per file)
+plus a caller namespace to the resulting hash, so warm invocations only stat
+the files. Any cache failure falls back to computing the hash directly.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Tuple
+
+from .types import sha256_hex, stable_json
+
+Fingerprint = Tuple[Optional[Tuple[str, int, int]], ...]
+
+
+def cache_path() -> Path:
+    """Cache DB location: $TRADING_BOT_CACHE_DIR, else $XDG_CACHE_HOME/trading-bot, else ~/.cache/trading-bot."""
+    base = os.environ.get("TRADING_BOT_CACHE_DIR")
+    if not base:
+        xdg = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        base = os.path.join(xdg, "trading-bot")
+    return Path(base) / "config_hash.sqlite"
+
+
+def fingerprint(paths: Iterable[str]) -> Fingerprint:
+    """(abspath, mtime_ns, size) for each path, or None for paths that cannot be stat'ed."""
+    out = []
+    for p in paths:
+        path = os.path.abspath(p)
+        try:
+            st = os.stat(path)
+        except OSError:
+            out.append(None)
+            continue
+        out.append((path, st.st_mtime_ns, st.st_size))
+    return tuple(out)
+
+
+def get_hash(namespace: str, fp: Fingerprint, compute: Callable[[], str]) -> str:
+    """Return the cached hash for (namespace, fp), calling `compute` on a miss.
+
+    `namespace` identifies what `compute` hashes; bump it when that changes.
+    """
+    key = sha256_hex(stable_json([namespace, fp]))
+    try:
+        db = cache_path()
+        db.parent.mkdir(parents=True, exist_ok=True)
+        con = sqlite3.connect(str(db))
+    except (OSError, sqlite3.Error):
+        return compute()
+    try:
+        con.execute("PRAGMA synchronous=OFF;")
+        con.execute("CREATE TABLE IF NOT EXISTS config_hashes (key TEXT PRIMARY KEY, config_hash TEXT NOT NULL)")
+        row = con.execute("SELECT config_hash FROM config_hashes WHERE key = ?", (key,)).fetchone()
+        if row:
+            return row[0]
+        value = compute()
+        try:
+            con.execute("INSERT OR REPLACE INTO config_hashes (key, config_hash) VALUES (?, ?)", (key, value))
+            con.commit()
+        except sqlite3.Error:
+            pass  # read-only or locked cache: the value is still good
+        return value
+    except sqlite3.Error:
+        return compute()
+    finally:
+        con.close()
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+from dataclasses import asdict, dataclass, field
 from typing import Optional, Dict, Any, List, Literal
-from pydantic import BaseModel, Field
 
 # Canonical Event Schemas (Section 12)
+# Frozen, slotted, keyword-only dataclasses; constrained fields are checked in
+# __post_init__. Use to_dict() for a JSON-ready mapping.
 
-class MarketBarClosed(BaseModel):
+to_dict = asdict
+
+_SESSION_STATES = frozenset({"PRE", "OPEN", "CLOSED"})
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class MarketBarClosed:
     timestamp: str
     symbol: Literal["MES"]
     timeframe: Literal["1m"]
@@ -14,14 +21,24 @@ class MarketBarClosed(BaseModel):
     low: float
     close: float
     volume: int
-    dvs: float = Field(ge=0.0, le=1.0)
-    dvs_penalties: List[str] = Field(default_factory=list)
+    dvs: float
+    dvs_penalties: List[str] = field(default_factory=list)
 
-class MarketSessionState(BaseModel):
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.dvs <= 1.0:
+            raise ValueError(f"dvs must be within [0, 1], got {self.dvs}")
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class MarketSessionState:
     state: Literal["PRE", "OPEN", "CLOSED"]
     timestamp: str
 
-class DecisionRecordEvent(BaseModel):
+    def __post_init__(self) -> None:
+        if self.state not in _SESSION_STATES:
+            raise ValueError(f"state must be one of PRE/OPEN/CLOSED, got {self.state!r}")
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DecisionRecordEvent:
     timestamp: str
     signals: Dict[str, float]
     beliefs: Dict[str, float]
@@ -29,67 +46,77 @@ class DecisionRecordEvent(BaseModel):
     scores: Dict[str, float]
     decision: Literal["TRADE", "NO_TRADE"]
     reason: str
-    selected_template: Optional[str]
+    selected_template: Optional[str] = None
 
-class OrderIntentCreated(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class OrderIntentCreated:
     intent_id: str
     direction: Literal["LONG", "SHORT"]
     quantity: int
     entry_type: Literal["MARKET", "LIMIT"]
-    limit_price: Optional[float]
+    limit_price: Optional[float] = None
     stop_loss: float
     take_profit: float
     template_id: str
     reason_vector: Dict[str, Any]
 
-class OrderIntentRejected(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class OrderIntentRejected:
     intent_id: str
     reason: str
     constitutional_state: Dict[str, Any]
 
-class OrderSubmitted(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class OrderSubmitted:
     intent_id: str
     broker_order_id: str
     timestamp: str
 
-class OrderAck(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class OrderAck:
     broker_order_id: str
     status: str
     timestamp: str
 
-class OrderRejected(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class OrderRejected:
     broker_order_id: str
     reason: str
     timestamp: str
 
-class FillPartial(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FillPartial:
     broker_order_id: str
     filled_qty: int
     remaining_qty: int
     fill_price: float
     timestamp: str
 
-class FillComplete(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FillComplete:
     broker_order_id: str
     total_qty: int
     avg_fill_price: float
     slippage_ticks: int
     timestamp: str
 
-class AccountSnapshot(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AccountSnapshot:
     equity: float
     buying_power: float
     daily_pnl: float
     timestamp: str
 
-class PositionSnapshotEvent(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PositionSnapshotEvent:
     symbol: str
     quantity: int
     avg_price: float
     unrealized_pnl: float
     timestamp: str
 
-class TradeClosed(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TradeClosed:
     trade_id: str
     entry_price: float
     exit_price: float
@@ -99,14 +126,16 @@ class TradeClosed(BaseModel):
     bars_held: int
     timestamp: str
 
-class AttributionResult(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AttributionResult:
     trade_id: str
     category: str  # A0-A9
     confidence: float
     learning_target: str
     detail: str
 
-class ModelUpdate(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ModelUpdate:
     parameter: str
     old_value: float
     new_value: float
@@ -29,30 +29,39 @@ Recovery goals:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from enum import Enum, auto
-from typing import Any, Dict, List, Optional
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional
 
+from .types import mono_to_utc, utc_to_mono
 
-class ParentState(Enum):
-    CREATED = auto()
-    SUBMITTING = auto()
-    ACKED = auto()
-    PARTIAL = auto()
-    FILLED = auto()
-    CANCELED = auto()
-    REJECTED = auto()
-    ERROR = auto()
-    DONE = auto()
 
+# IntEnums: int-compatible, cheap to compare and to pack into arrays. Persist by name.
+class ParentState(IntEnum):
+    CREATED = 0
+    SUBMITTING = 1
+    ACKED = 2
+    PARTIAL = 3
+    FILLED = 4
+    CANCELED = 5
+    REJECTED = 6
+    ERROR = 7
+    DONE = 8
 
-class ChildType(Enum):
-    STOP = "STOP"
-    TARGET = "TARGET"
 
+class ChildType(IntEnum):
+    STOP = 0
+    TARGET = 1
 
-@dataclass
+
+@dataclass(slots=True)
 class ChildOrder:
     child_type: ChildType
     broker_id: Optional[str] = None
@@ -61,7 +70,7 @@ class ChildOrder:
     limit_price: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParentOrder:
     client_id: str  # idempotent client order id
     broker_id: Optional[str] = None
@@ -72,28 +81,155 @@ class ParentOrder:
     filled_qty: int = 0
     avg_fill_price: Optional[float] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    updated_ns: int = field(default_factory=time.monotonic_ns)  # monotonic; see updated_at
     children: Dict[ChildType, ChildOrder] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def updated_at(self) -> datetime:
+        return mono_to_utc(self.updated_ns)
+
+    @updated_at.setter
+    def updated_at(self, value: datetime) -> None:
+        self.updated_ns = utc_to_mono(value)
 
-@dataclass
+
+@dataclass(slots=True)
 class SupervisorEvent:
     type: str
     data: Dict[str, Any]
-    ts: datetime = field(default_factory=datetime.utcnow)
+    ts_ns: int = field(default_factory=time.monotonic_ns)  # monotonic; see ts
+    seq: int = 0
+
+    @property
+    def ts(self) -> datetime:
+        return mono_to_utc(self.ts_ns)
+
+
+_LIVE = (ParentState.CREATED, ParentState.SUBMITTING, ParentState.ACKED, ParentState.PARTIAL)
+_WORKING = (ParentState.SUBMITTING, ParentState.ACKED, ParentState.PARTIAL)
+# A fill reported after a cancel/reject outcome is broker truth and still moves the order
+_FILLABLE = _WORKING + (ParentState.ERROR, ParentState.CANCELED, ParentState.REJECTED)
+
+# (current state, broker event type) -> next state. Pairs not listed are illegal for a
+# known event type; re-deliveries that cannot change anything map a state to itself.
+_TRANSITIONS: Dict[tuple, ParentState] = {
+    **{(st, "ORDER_ACK"): ParentState.ACKED for st in (ParentState.CREATED, ParentState.SUBMITTING, ParentState.ACKED)},
+    (ParentState.PARTIAL, "ORDER_ACK"): ParentState.PARTIAL,
+    **{(st, "ORDER_REJECTED"): ParentState.REJECTED for st in _LIVE},
+    (ParentState.REJECTED, "ORDER_REJECTED"): ParentState.REJECTED,
+    **{(st, "PARTIAL_FILL"): ParentState.PARTIAL for st in _FILLABLE},
+    **{(st, "FILL"): ParentState.FILLED for st in _FILLABLE},
+    (ParentState.FILLED, "FILL"): ParentState.FILLED,
+    **{(st, "CANCEL_ACK"): ParentState.CANCELED for st in _WORKING + (ParentState.ERROR,)},
+    (ParentState.CANCELED, "CANCEL_ACK"): ParentState.CANCELED,
+    **{(st, "CANCEL_REJECT"): ParentState.ERROR for st in _WORKING},
+}
+_TRANSITION_EVENTS = frozenset(et for _, et in _TRANSITIONS)
+
+
+def _order_to_dict(p: ParentOrder) -> Dict[str, Any]:
+    d = asdict(p)
+    d["state"] = p.state.name
+    d["created_at"] = p.created_at.isoformat()
+    del d["updated_ns"]  # monotonic clocks do not survive a restart; persist wall time
+    d["updated_at"] = p.updated_at.isoformat()
+    d["children"] = {ct.name: {**asdict(c), "child_type": ct.name} for ct, c in p.children.items()}
+    return d
+
+
+def _order_from_dict(d: Dict[str, Any]) -> ParentOrder:
+    d = dict(d)
+    d["state"] = ParentState[d["state"]]
+    d["created_at"] = datetime.fromisoformat(d["created_at"])
+    d["updated_ns"] = utc_to_mono(datetime.fromisoformat(d.pop("updated_at")))
+    d["children"] = {
+        ChildType[k]: ChildOrder(**{**c, "child_type": ChildType[k]}) for k, c in (d.get("children") or {}).items()
+    }
+    return ParentOrder(**d)
+
+
+class Command(NamedTuple):
+    """A supervisor method call queued for the command loop."""
+    method: str
+    args: tuple
+    future: Future
+
+
+# Methods callers may route through the command loop with post()
+_POSTABLE = frozenset({"submit_intent", "on_broker_event", "reconcile", "flatten_all", "tick", "snapshot"})
 
 
 class ExecutionSupervisor:
-    def __init__(self):
+    def __init__(
+        self,
+        max_events: int = 100_000,
+        journal_dir: Optional[str] = None,
+        run_id: Optional[str] = None,
+        dedup_capacity: int = 10_000,
+    ):
+        """`journal_dir` makes order state restart-safe: it is restored from the journal's
+        snapshot + tail here, and every later order state change is journaled."""
         self._orders: Dict[str, ParentOrder] = {}
-        self._events: List[SupervisorEvent] = []
+        self.run_id = run_id or uuid.uuid4().hex
+        self._seq = 0
+        self._journal = None
+        if journal_dir:
+            from trading_bot.log.supervisor_journal import SupervisorJournal
+
+            self._journal = SupervisorJournal(journal_dir)
+            self._seq, orders = self._journal.load()
+            self._orders = {cid: _order_from_dict(d) for cid, d in orders.items()}
+        # Bounded: if nobody drains pop_events, the oldest events are evicted
+        self._events: Deque[SupervisorEvent] = deque(maxlen=max_events)
+        # LRU set of applied broker event ids, so at-least-once redeliveries are no-ops
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._dedup_capacity = dedup_capacity
+        # Broker event type -> side effect beyond the state change (which _TRANSITIONS decides)
+        self._handlers: Dict[str, Callable[[ParentOrder, Dict[str, Any]], None]] = {
+            "PARTIAL_FILL": self._apply_fill,
+            "FILL": self._apply_fill,
+        }
+        self._inbox: "queue.SimpleQueue[Optional[Command]]" = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+
+    # --- Command loop ---
+    # Single-writer mode: once start()ed, every mutation should arrive through post(). One
+    # worker thread applies commands in arrival order, so order state needs no locks and a
+    # given command sequence always yields the same state and journal.
+    def start(self) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run_commands, name="execution-supervisor", daemon=True)
+            self._worker.start()
+
+    def stop(self) -> None:
+        """Apply everything already posted, then stop the worker."""
+        if self._worker is not None:
+            self._inbox.put(None)
+            self._worker.join()
+            self._worker = None
+
+    def post(self, method: str, *args: Any) -> Future:
+        """Queue `method(*args)` for the worker; the Future resolves to its return value."""
+        if method not in _POSTABLE:
+            raise ValueError(f"Not a supervisor command: {method}")
+        fut: Future = Future()
+        self._inbox.put(Command(method, args, fut))
+        return fut
+
+    def _run_commands(self) -> None:
+        while (cmd := self._inbox.get()) is not None:
+            if not cmd.future.set_running_or_notify_cancel():
+                continue
+            try:
+                cmd.future.set_result(getattr(self, cmd.method)(*cmd.args))
+            except Exception as e:
+                cmd.future.set_exception(e)
 
     # --- Submission path ---
     def submit_intent(self, intent: Dict[str, Any], broker_adapter) -> str:
         """Create idempotent client order id, submit via adapter, track parent."""
-        now = datetime.utcnow()
-        client_oid = intent.get("intent_id") or f"cli-{int(now.timestamp()*1000)}-{len(self._orders)+1}"
+        client_oid = intent.get("intent_id") or f"cli-{int(datetime.utcnow().timestamp()*1000)}-{len(self._orders)+1}"
         if client_oid in self._orders:
             # Idempotent: do not resubmit
             return client_oid
@@ -106,18 +242,18 @@ class ExecutionSupervisor:
         )
         self._orders[client_oid] = parent
         parent.state = ParentState.SUBMITTING
-        self._events.append(SupervisorEvent("ORDER_SUBMIT", {"client_id": client_oid}))
+        self._emit("ORDER_SUBMIT", {"client_id": client_oid}, parent)
 
         resp = broker_adapter.place_order(intent_obj=intent, last_price=intent.get("last_price"))
         # Broker adapter should be idempotent-aware, but we guard here
         status = resp.get("status") or resp.get("type")
         if status in ("ORDER_REJECTED", "REJECTED"):
             parent.state = ParentState.REJECTED
-            self._events.append(SupervisorEvent("ORDER_REJECT", {"client_id": client_oid, "reason": resp.get("reason")}))
+            self._emit("ORDER_REJECT", {"client_id": client_oid, "reason": resp.get("reason")}, parent)
             return client_oid
         parent.broker_id = resp.get("order_id")
         parent.state = ParentState.ACKED if status in ("ACCEPTED", "SUBMITTED") else parent.state
-        self._events.append(SupervisorEvent("ORDER_ACK", {"client_id": client_oid, "broker_id": parent.broker_id, "status": status}))
+        self._emit("ORDER_ACK", {"client_id": client_oid, "broker_id": parent.broker_id, "status": status}, parent)
         return client_oid
 
     # --- Event handling from broker ---
@@ -127,44 +263,80 @@ class ExecutionSupervisor:
         parent = self._orders.get(cid)
         if not parent:
             return
-        parent.updated_at = datetime.utcnow()
-        if et == "ORDER_ACK":
-            parent.state = ParentState.ACKED
-        elif et == "ORDER_REJECTED":
-            parent.state = ParentState.REJECTED
-        elif et in ("PARTIAL_FILL", "FILL"):
-            fill_qty = int(ev.get("filled", 0))
-            parent.filled_qty = max(parent.filled_qty, fill_qty)
-            parent.avg_fill_price = ev.get("avg_fill_price", parent.avg_fill_price)
-            if et == "PARTIAL_FILL":
-                parent.state = ParentState.PARTIAL
-            else:
-                parent.state = ParentState.FILLED
-        elif et == "CANCEL_ACK":
-            parent.state = ParentState.CANCELED
-        elif et == "CANCEL_REJECT":
-            parent.state = ParentState.ERROR
-        self._events.append(SupervisorEvent(et, ev))
+        # Identity: broker event_id, else (order, type, broker seq); events with neither are applied as-is
+        eid = ev.get("event_id")
+        if eid is None and ev.get("seq") is not None:
+            eid = f"{cid}:{et}:{ev['seq']}"
+        if eid is not None:
+            if eid in self._seen:
+                return
+            self._seen[eid] = None
+            if len(self._seen) > self._dedup_capacity:
+                self._seen.popitem(last=False)
+        parent.updated_ns = time.monotonic_ns()
+        # Side effects (fill qty/price) record what the broker did, whatever our state says
+        handler = self._handlers.get(et)
+        if handler is not None:
+            handler(parent, ev)
+        new_state = _TRANSITIONS.get((parent.state, et))
+        if new_state is None:
+            self._emit(et, ev, parent)
+            if et in _TRANSITION_EVENTS:
+                # Known event that is illegal from this state: leave the state as is and flag it
+                self._emit("ILLEGAL_TRANSITION", {"client_id": cid, "state": parent.state.name, "event": et})
+            return
+        parent.state = new_state
+        self._emit(et, ev, parent)
+
+    @staticmethod
+    def _apply_fill(parent: ParentOrder, ev: Dict[str, Any]) -> None:
+        parent.filled_qty = max(parent.filled_qty, int(ev.get("filled", 0)))
+        parent.avg_fill_price = ev.get("avg_fill_price", parent.avg_fill_price)
 
     # --- Reconciliation ---
     def reconcile(self, broker_positions: List[Dict[str, Any]], broker_orders: List[Dict[str, Any]]) -> None:
         """Compare broker truth to local; if mismatch, emit RECONCILE_DIFF and mark ERROR."""
         # Minimal skeleton; to be expanded with idempotent repair logic
-        self._events.append(SupervisorEvent("RECONCILE", {"positions": broker_positions, "orders": broker_orders}))
+        self._emit("RECONCILE", {"positions": broker_positions, "orders": broker_orders})
 
     # --- Flatten ---
     def flatten_all(self, broker_adapter) -> None:
-        self._events.append(SupervisorEvent("FLATTEN_ALL", {}))
+        self._emit("FLATTEN_ALL", {})
         try:
             broker_adapter.flatten_positions()
         except Exception as e:
-            self._events.append(SupervisorEvent("FLATTEN_ERROR", {"error": str(e)}))
+            self._emit("FLATTEN_ERROR", {"error": str(e)})
 
     # --- Tick / supervision loop ---
     def tick(self, now: datetime, ttl_seconds: int = 90) -> None:
         """Periodically enforce TTL, check missing children, and emit heartbeats."""
-        self._events.append(SupervisorEvent("SUPERVISOR_HEARTBEAT", {"ts": now.isoformat()}))
+        self._emit("SUPERVISOR_HEARTBEAT", {"ts": now.isoformat()})
+
+    # --- Persistence ---
+    def _emit(self, et: str, data: Dict[str, Any], parent: Optional[ParentOrder] = None) -> None:
+        """Record a supervisor event; when it touched `parent`, journal the order's new state."""
+        self._seq += 1
+        self._events.append(SupervisorEvent(et, data, seq=self._seq))
+        if parent is not None and self._journal is not None:
+            self._journal.append({"seq": self._seq, "run_id": self.run_id, "type": et, "order": _order_to_dict(parent)})
+
+    def snapshot(self) -> None:
+        """Checkpoint all orders and truncate the journal so recovery replays only what follows."""
+        if self._journal is not None:
+            orders = {cid: _order_to_dict(p) for cid, p in self._orders.items()}
+            self._journal.snapshot(self._seq, self.run_id, orders)
+
+    def close(self) -> None:
+        self.stop()
+        if self._journal is not None:
+            self._journal.close()
 
     def pop_events(self) -> List[SupervisorEvent]:
-        ev, self._events = self._events, []
-        return ev
+        """Drain buffered events; safe to call while the command worker is emitting."""
+        ev: List[SupervisorEvent] = []
+        # popleft is atomic against the worker's append, so no event falls between copy and clear
+        while True:
+            try:
+                ev.append(self._events.popleft())
+            except IndexError:
+                return ev
@@ -11,23 +11,42 @@ Captures trade outcomes, computes reliability metrics, and adjusts strategy thre
 
 from __future__ import annotations
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Deque, Dict, Any, Iterable, List, Optional, Tuple
+from collections import deque
+from operator import attrgetter
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from enum import Enum
+from enum import IntEnum
 import json
+import math
+import threading
+import time
 
+from .types import mono_to_utc
 
-class StrategyState(Enum):
-    """Strategy operational state."""
-    ACTIVE = "ACTIVE"
-    THROTTLED = "THROTTLED"
-    QUARANTINED = "QUARANTINED"
-    ARCHIVED = "ARCHIVED"
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
-@dataclass
+# Weighted PnL is accumulated exactly as an int: micro-USD x weight in millionths
+_PNL_SCALE = 1_000_000
+_WEIGHT_SCALE = 1_000_000
+_WEIGHTED_PNL_SCALE = Decimal(_PNL_SCALE * _WEIGHT_SCALE)
+
+
+class StrategyState(IntEnum):
+    """Strategy operational state (int-valued; serialized by name)."""
+    ACTIVE = 0
+    THROTTLED = 1
+    QUARANTINED = 2
+    ARCHIVED = 3
+
+
+@dataclass(slots=True)
 class TradeOutcome:
     """Captured trade outcome for learning."""
     trade_id: str
@@ -54,6 +73,13 @@ class TradeOutcome:
     slippage_expected_ticks: float = 0.5  # Model prediction for slippage
     commission_round_trip: Decimal = Decimal("2.50")  # MES round-trip commission
     win: bool = False  # True if pnl_usd > 0
+
+    def __post_init__(self) -> None:
+        # Normalize once here so update_from_trade can read data_quality as a float directly
+        if self.data_quality is None:
+            self.data_quality = 1.0
+        elif type(self.data_quality) is not float:
+            self.data_quality = float(self.data_quality)  # ValueError/TypeError for non-numeric input
     
     @property
     def actual_pnl_usd(self) -> Decimal:
@@ -65,7 +91,7 @@ class TradeOutcome:
         return self.pnl_usd - self.commission_round_trip
 
 
-@dataclass
+@dataclass(slots=True)
 class ReliabilityMetrics:
     """Reliability metrics for a strategy in a specific regime/TOD."""
     strategy_key: str  # "{template_id}_{regime}_{tod}"
@@ -79,12 +105,8 @@ class ReliabilityMetrics:
     consecutive_wins: int = 0
     consecutive_losses: int = 0
     
-    total_pnl: Decimal = Decimal("0")
-    avg_pnl: Decimal = Decimal("0")
-    expectancy: Decimal = Decimal("0")  # E[PnL] per trade
-    
-    pnl_std: Decimal = Decimal("0")  # Standard deviation of PnL
-    sharpe_ratio: float = 0.0  # Expectancy / std(PnL)
+    pnl_std: Decimal = Decimal("0")  # Standard deviation of weighted PnL
+    sharpe_ratio: float = 0.0  # Expectancy / std(weighted PnL)
     max_drawdown: Decimal = Decimal("0")
     win_rate: float = 0.0  # wins / trades_count
     loss_rate: float = 0.0
@@ -93,13 +115,42 @@ class ReliabilityMetrics:
     avg_slippage: float = 0.0  # ticks
     avg_spread: float = 0.0  # ticks
     
-    last_updated: datetime = field(default_factory=datetime.utcnow)
+    updated_ns: int = field(default_factory=time.monotonic_ns)  # monotonic; see last_updated
     
     # Throttle state
     throttle_level: int = 0  # 0 = normal, 1 = mild throttle, 2 = heavy throttle
     throttle_reason: str = ""
     state: StrategyState = StrategyState.ACTIVE
     state_change_reason: str = ""
+
+    _weighted_pnl: int = field(default=0, init=False, repr=False)
+    _peak_pnl: int = field(default=0, init=False, repr=False)  # running max of _weighted_pnl (equity starts at 0)
+    _max_dd: int = field(default=0, init=False, repr=False)
+    # Welford running count / mean / sum of squared deviations of weighted PnL (the basis
+    # expectancy uses), for pnl_std and sharpe. Own count: trades_count is restored by
+    # load_from_dict, these sums are not.
+    _pnl_n: int = field(default=0, init=False, repr=False)
+    _pnl_mean: float = field(default=0.0, init=False, repr=False)
+    _pnl_m2: float = field(default=0.0, init=False, repr=False)
+
+    @property
+    def last_updated(self) -> datetime:
+        return mono_to_utc(self.updated_ns)
+
+    @property
+    def total_pnl(self) -> Decimal:
+        return Decimal(self._weighted_pnl) / _WEIGHTED_PNL_SCALE
+
+    @property
+    def avg_pnl(self) -> Decimal:
+        if not self.trades_count:
+            return Decimal("0")
+        return self.total_pnl / Decimal(self.trades_count)
+
+    @property
+    def expectancy(self) -> Decimal:
+        """E[PnL] per trade."""
+        return self.avg_pnl
     
     def update_from_trade(self, outcome: TradeOutcome) -> None:
         """Update metrics from a single trade outcome."""
@@ -116,17 +167,27 @@ class ReliabilityMetrics:
         
         # Weight PnL contribution by data quality (repurposed as weight):
         # LIVE ~1.0, DELAYED ~0.4, HISTORICAL_ONLY ~0.0
-        try:
-            weight = float(getattr(outcome, "data_quality", 1.0) or 1.0)
-        except Exception:
-            weight = 1.0
-        self.total_pnl += (outcome.pnl_usd * Decimal(str(weight)))
-        self.avg_pnl = self.total_pnl / Decimal(self.trades_count)
-        self.expectancy = self.avg_pnl
+        weight = outcome.data_quality or 1.0
+        self._weighted_pnl += round(outcome.pnl_usd * _PNL_SCALE) * round(weight * _WEIGHT_SCALE)
+        # Max drawdown of the weighted equity curve, kept incrementally (peak - equity)
+        if self._weighted_pnl > self._peak_pnl:
+            self._peak_pnl = self._weighted_pnl
+        elif self._peak_pnl - self._weighted_pnl > self._max_dd:
+            self._max_dd = self._peak_pnl - self._weighted_pnl
+            self.max_drawdown = Decimal(self._max_dd) / _WEIGHTED_PNL_SCALE
+
+        x = float(outcome.pnl_usd) * weight
+        self._pnl_n += 1
+        delta = x - self._pnl_mean
+        self._pnl_mean += delta / self._pnl_n
+        self._pnl_m2 += delta * (x - self._pnl_mean)
+        std = math.sqrt(self._pnl_m2 / (self._pnl_n - 1)) if self._pnl_n > 1 else 0.0
+        self.pnl_std = Decimal(repr(std))
+        self.sharpe_ratio = self._pnl_mean / std if std > 0 else 0.0
         self.win_rate = float(self.wins) / self.trades_count if self.trades_count > 0 else 0.0
         self.loss_rate = float(self.losses) / self.trades_count if self.trades_count > 0 else 0.0
         
-        self.last_updated = datetime.utcnow()
+        self.updated_ns = time.monotonic_ns()
     
     def should_quarantine(self, min_acceptable_win_rate: float = 0.40) -> Tuple[bool, str]:
         """Check if strategy should be quarantined."""
@@ -135,7 +196,7 @@ class ReliabilityMetrics:
             return True, "CONSECUTIVE_LOSSES"
         
         # Quarantine if expectancy is negative after 5+ trades
-        if self.trades_count >= 5 and self.expectancy < 0:
+        if self.trades_count >= 5 and self._weighted_pnl < 0:  # expectancy < 0
             return True, "NEGATIVE_EXPECTANCY"
         
         # Quarantine if win rate drops below min_acceptable after 10+ trades
@@ -151,7 +212,7 @@ class ReliabilityMetrics:
             return True, "RECOVERY_WINS"
         
         # Re-enable on positive expectancy after reset window
-        if self.trades_count >= 3 and self.expectancy > 0:
+        if self.trades_count >= 3 and self._weighted_pnl > 0:  # expectancy > 0
             return True, "POSITIVE_EXPECTANCY"
         
         return False, ""
@@ -173,6 +234,24 @@ class ReliabilityMetrics:
         return 0
 
 
+# Serialized metric fields, in output order: name -> formatter
+_METRIC_FIELDS: Dict[str, Callable[[ReliabilityMetrics], Any]] = {
+    "strategy_key": attrgetter("strategy_key"),
+    "template_id": attrgetter("template_id"),
+    "regime": attrgetter("regime"),
+    "time_of_day": attrgetter("time_of_day"),
+    "trades_count": attrgetter("trades_count"),
+    "wins": attrgetter("wins"),
+    "losses": attrgetter("losses"),
+    "win_rate": lambda m: f"{m.win_rate:.1%}",
+    "expectancy": lambda m: f"${float(m.expectancy):.2f}",
+    "sharpe_ratio": lambda m: f"{m.sharpe_ratio:.2f}",
+    "max_drawdown": lambda m: f"${float(m.max_drawdown):.2f}",
+    "state": lambda m: m.state.name,
+    "throttle_level": attrgetter("throttle_level"),
+}
+
+
 class LearningLoop:
     """
     Manages strategy reliability tracking, calibration, and throttling.
@@ -186,10 +265,13 @@ class LearningLoop:
     6. Log learning events for audit trail
     """
     
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, lock_shards: int = 16):
         self.logger = logger
         self.metrics: Dict[str, ReliabilityMetrics] = {}  # strategy_key -> ReliabilityMetrics
-        self.trade_history: List[TradeOutcome] = []
+        # Striped locks: a strategy's update + transitions run under lock hash(key) % shards,
+        # so threads ingesting different strategies rarely contend
+        self._locks = [threading.Lock() for _ in range(max(1, lock_shards))]
+        self._key_cache: Dict[Tuple[str, str, str], str] = {}  # (template, regime, tod) -> strategy_key
         self.state_changes: List[Dict[str, Any]] = []  # Audit trail for quarantine/re-enable
         
         # Configurable thresholds
@@ -197,26 +279,82 @@ class LearningLoop:
         self.min_trades_for_metrics = 3
         self.consecutive_loss_limit = 2
         self.lookback_window = 20  # Only consider last N trades for moving metrics
+        # Last `lookback_window` trades only; cumulative stats live in ReliabilityMetrics
+        self.trade_history: Deque[TradeOutcome] = deque(maxlen=self.lookback_window)
     
+    def _strategy_key(self, template_id: str, regime: str, time_of_day: str) -> str:
+        """"{template_id}_{regime}_{time_of_day}", built once per combination."""
+        k = (template_id, regime, time_of_day)
+        key = self._key_cache.get(k)
+        if key is None:
+            key = self._key_cache[k] = f"{template_id}_{regime}_{time_of_day}"
+        return key
+
     def record_trade(self, outcome: TradeOutcome) -> Dict[str, Any]:
         """Record a completed trade and update metrics."""
         self.trade_history.append(outcome)
-        
-        # Generate strategy key
-        strategy_key = f"{outcome.template_id}_{outcome.regime}_{outcome.time_of_day}"
-        
-        # Create or retrieve metrics
-        if strategy_key not in self.metrics:
-            self.metrics[strategy_key] = ReliabilityMetrics(
+        strategy_key, metrics = self._metrics_for(outcome)
+        with self._lock_for(strategy_key):
+            metrics.update_from_trade(outcome)
+            self._apply_transitions(strategy_key, metrics)
+            serialized = self._serialize_metrics(metrics)
+        return {
+            "trade_id": outcome.trade_id,
+            "strategy_key": strategy_key,
+            "metrics": serialized,
+            "action": "UPDATED",
+        }
+
+    def record_trades(self, outcomes: Iterable[TradeOutcome]) -> List[Dict[str, Any]]:
+        """Record a batch of completed trades; one result per strategy touched, in first-seen order.
+
+        Metrics and quarantine/throttle transitions end up exactly as if each trade had gone
+        through record_trade in order (strategies are independent), but the key lookup, lock
+        and result are paid once per strategy instead of once per trade.
+        """
+        groups: Dict[str, Tuple[ReliabilityMetrics, List[TradeOutcome]]] = {}
+        for outcome in outcomes:
+            self.trade_history.append(outcome)
+            key = self._strategy_key(outcome.template_id, outcome.regime, outcome.time_of_day)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = (self._metrics_for(outcome)[1], [])
+            group[1].append(outcome)
+
+        results = []
+        for strategy_key, (metrics, group) in groups.items():
+            with self._lock_for(strategy_key):  # one acquisition per strategy per batch
+                for outcome in group:
+                    metrics.update_from_trade(outcome)
+                    self._apply_transitions(strategy_key, metrics)
+                serialized = self._serialize_metrics(metrics)  # snapshot under the lock
+            results.append({
+                "trade_ids": [o.trade_id for o in group],
+                "strategy_key": strategy_key,
+                "metrics": serialized,
+                "action": "UPDATED",
+            })
+        return results
+
+    def _metrics_for(self, outcome: TradeOutcome) -> Tuple[str, ReliabilityMetrics]:
+        """Strategy key and (created on first use) metrics for a trade."""
+        strategy_key = self._strategy_key(outcome.template_id, outcome.regime, outcome.time_of_day)
+        metrics = self.metrics.get(strategy_key)
+        if metrics is None:
+            # setdefault: if two threads race to create a strategy, both get the same instance
+            metrics = self.metrics.setdefault(strategy_key, ReliabilityMetrics(
                 strategy_key=strategy_key,
                 template_id=outcome.template_id,
                 regime=outcome.regime,
                 time_of_day=outcome.time_of_day,
-            )
-        
-        metrics = self.metrics[strategy_key]
-        metrics.update_from_trade(outcome)
-        
+            ))
+        return strategy_key, metrics
+
+    def _lock_for(self, strategy_key: str) -> threading.Lock:
+        return self._locks[hash(strategy_key) % len(self._locks)]
+
+    def _apply_transitions(self, strategy_key: str, metrics: ReliabilityMetrics) -> None:
+        """Quarantine / re-enable / throttle a strategy after its metrics were updated."""
         # Check quarantine conditions
         should_quarantine, quarantine_reason = metrics.should_quarantine(self.min_acceptable_win_rate)
         if should_quarantine and metrics.state == StrategyState.ACTIVE:
@@ -268,21 +406,12 @@ class LearningLoop:
                 metrics.throttle_reason = f"WIN_RATE_{metrics.win_rate:.1%}"
                 if self.logger:
                     self.logger.warn(f"Strategy {strategy_key} throttle level {old_level} → {throttle_level}")
-        
-        return {
-            "trade_id": outcome.trade_id,
-            "strategy_key": strategy_key,
-            "metrics": self._serialize_metrics(metrics),
-            "action": "UPDATED",
-        }
     
     def get_strategy_state(self, template_id: str, regime: str, time_of_day: str) -> Tuple[StrategyState, int]:
         """Get current state and throttle level for a strategy."""
-        strategy_key = f"{template_id}_{regime}_{time_of_day}"
-        if strategy_key not in self.metrics:
+        metrics = self.metrics.get(self._strategy_key(template_id, regime, time_of_day))
+        if metrics is None:
             return StrategyState.ACTIVE, 0
-        
-        metrics = self.metrics[strategy_key]
         return metrics.state, metrics.throttle_level
     
     def get_euc_cost_modifier(self, template_id: str, regime: str, time_of_day: str) -> float:
@@ -312,6 +441,22 @@ class LearningLoop:
         """Return all strategy metrics."""
         return self.metrics
     
+    def get_window_stats(self, strategy_key: Optional[str] = None) -> Dict[str, Any]:
+        """Win rate and expectancy over the last `lookback_window` trades (optionally one strategy)."""
+        trades = wins = 0
+        pnl = Decimal("0")
+        for o in list(self.trade_history):  # snapshot: other threads may be appending
+            if strategy_key is not None and self._strategy_key(o.template_id, o.regime, o.time_of_day) != strategy_key:
+                continue
+            trades += 1
+            wins += o.win
+            pnl += o.pnl_usd
+        return {
+            "trades": trades,
+            "win_rate": wins / trades if trades else 0.0,
+            "expectancy": pnl / trades if trades else Decimal("0"),
+        }
+
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Summary of all strategies: state, win rate, expectancy."""
         summary = {}
@@ -338,21 +483,7 @@ class LearningLoop:
     
     def _serialize_metrics(self, metrics: ReliabilityMetrics) -> Dict[str, Any]:
         """Serialize metrics for JSON logging."""
-        return {
-            "strategy_key": metrics.strategy_key,
-            "template_id": metrics.template_id,
-            "regime": metrics.regime,
-            "time_of_day": metrics.time_of_day,
-            "trades_count": metrics.trades_count,
-            "wins": metrics.wins,
-            "losses": metrics.losses,
-            "win_rate": f"{metrics.win_rate:.1%}",
-            "expectancy": f"${float(metrics.expectancy):.2f}",
-            "sharpe_ratio": f"{metrics.sharpe_ratio:.2f}",
-            "max_drawdown": f"${float(metrics.max_drawdown):.2f}",
-            "state": metrics.state.name,
-            "throttle_level": metrics.throttle_level,
-        }
+        return {k: fmt(metrics) for k, fmt in _METRIC_FIELDS.items()}
     
     def export_to_dict(self) -> Dict[str, Any]:
         """Export full learning state for persistence."""
@@ -371,6 +502,17 @@ class LearningLoop:
             }
         }
     
+    def export_json(self) -> bytes:
+        """export_to_dict() as compact JSON; orjson when installed, stdlib otherwise."""
+        state = self.export_to_dict()
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(state, default=str)
+        return json.dumps(state, separators=(",", ":"), default=str).encode()
+
+    def load_json(self, data: bytes | str) -> None:
+        """Inverse of export_json()."""
+        self.load_from_dict(orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data))
+
     def load_from_dict(self, state: Dict[str, Any]) -> None:
         """Load learning state from persistence (e.g., JSON file)."""
         # Note: This is a placeholder; full reconstruction would deserialize TradeOutcome history
@@ -398,3 +540,5 @@ class LearningLoop:
             self.min_trades_for_metrics = cfg.get("min_trades_for_metrics", 3)
             self.consecutive_loss_limit = cfg.get("consecutive_loss_limit", 2)
             self.lookback_window = cfg.get("lookback_window", 20)
+            if self.trade_history.maxlen != self.lookback_window:
+                self.trade_history = deque(self.trade_history, maxlen=self.lookback_window)
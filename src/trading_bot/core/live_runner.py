@@ -13,11 +13,16 @@ Integrates:
 from __future__ import annotations
 
 import os
+import queue
 import time
 import signal
 import logging
+import logging.handlers
+import sys
 import threading
-from typing import Dict, Any, Optional, Callable
+from collections import deque
+from operator import attrgetter
+from typing import Deque, Dict, Any, List, Optional, Callable, Tuple
 from pathlib import Path
 from decimal import Decimal
 from datetime import datetime, timezone
@@ -34,7 +39,13 @@ from trading_bot.log.event_store import EventStore
 from trading_bot.engines.signals_v2 import SignalEngineV2, ET
 from trading_bot.engines.belief_v2 import BeliefEngineV2
 from trading_bot.engines.decision_v2 import DecisionEngineV2
-from trading_bot.engines.dvs_eqs import compute_dvs, compute_eqs
+from trading_bot.engines.dvs_eqs import (
+    ScoreRules,
+    compile_dvs_rules,
+    compile_eqs_rules,
+    compute_dvs,
+    compute_eqs,
+)
 from trading_bot.core.state_store import StateStore
 from trading_bot.core.types import Event, stable_json, sha256_hex
 from trading_bot.core.config import load_yaml_contract
@@ -52,6 +63,46 @@ from trading_bot.engines.in_trade_manager import (
 
 logger = logging.getLogger(__name__)
 
+# SignalOutput fields forwarded to the belief/decision engines
+_SIGNAL_FIELDS = (
+    "vwap_z",
+    "vwap_slope",
+    "atr_14_n",
+    "range_compression",
+    "hhll_trend_strength",
+    "breakout_distance_n",
+    "rejection_wick_n",
+    "close_location_value",
+    "gap_from_prev_close_n",
+    "distance_from_poc_proxy",
+    "micro_trend_5",
+    "real_body_impulse_n",
+    "vol_z",
+    "vol_slope_20",
+    "effort_vs_result",
+    "range_expansion_on_volume",
+    "climax_bar_flag",
+    "quiet_bar_flag",
+    "consecutive_high_vol_bars",
+    "participation_expansion_index",
+    "session_phase",
+    "opening_range_break",
+    "lunch_void_gate",
+    "close_magnet_index",
+    "spread_proxy_tickiness",
+    "slippage_risk_proxy",
+    "friction_regime_index",
+    "dvs",
+)
+_read_signals = attrgetter(*_SIGNAL_FIELDS)
+
+# Data-quality inputs the live bar path feeds to compute_dvs
+_LIVE_DVS_STATE = {
+    "bar_lag_seconds": 0,
+    "missing_fields": 0,
+    "gap_detected": False,
+}
+
 
 class RunnerState(Enum):
     """Runner lifecycle states."""
@@ -62,8 +113,29 @@ class RunnerState(Enum):
     ERROR = "error"
 
 
+class IntentWrapper:
+    """Attribute view of a decision order intent, as TradovateLiveAdapter.place_order reads it."""
+
+    __slots__ = ("direction", "contracts", "entry_type", "stop_ticks", "target_ticks", "symbol", "metadata")
+
+    def __init__(self, intent: Dict[str, Any], symbol: str, metadata: Dict[str, Any]):
+        self.direction = intent.get("direction", "LONG")
+        self.contracts = intent.get("contracts", 1)
+        self.entry_type = intent.get("entry_type", "LIMIT")
+        self.stop_ticks = intent.get("stop_ticks", 8)
+        self.target_ticks = intent.get("target_ticks", 12)
+        self.symbol = symbol
+        self.metadata = metadata
+
+
 class HealthCheck:
-    """Health monitoring for live trading."""
+    """
+    Health monitoring for live trading.
+
+    Ages and gaps are measured on time.monotonic() seconds, so wall-clock steps
+    (NTP, DST) cannot fake a data gap or a stuck position. `now` arguments take
+    a monotonic reading the caller already has; omitted, one is taken here.
+    """
 
     def __init__(
         self,
@@ -82,30 +154,46 @@ class HealthCheck:
         self._bars_since_trade = 0
         self._consecutive_errors = 0
         self._last_error: Optional[str] = None
-        self._last_bar_time: Optional[datetime] = None
-        self._position_entry_time: Optional[datetime] = None
+        self._last_bar_mono: Optional[float] = None
+        self._position_entry_mono: Optional[float] = None
 
         # Stats
-        self._start_time = datetime.now(timezone.utc)
+        self._start_time = datetime.now(timezone.utc)  # display only
+        self._start_mono = time.monotonic()
         self._trades_today = 0
         self._errors_today = 0
 
-    def record_bar(self) -> None:
+        # Reused result of check(), owned by the thread calling check()
+        self._status_buf: Dict[str, Any] = {
+            "status": "healthy",
+            "issues": [],
+            "bars_processed": 0,
+            "bars_since_trade": 0,
+            "trades_today": 0,
+            "errors_today": 0,
+            "consecutive_errors": 0,
+            "started_at": self._start_time.isoformat(),
+            "uptime_minutes": 0.0,
+        }
+        # Last check() outcome for snapshot(); replaced whole, never mutated
+        self._last_check: Tuple[str, Tuple[str, ...]] = ("healthy", ())
+
+    def record_bar(self, now: Optional[float] = None) -> None:
         """Record bar processed."""
         self._bars_processed += 1
         self._bars_since_trade += 1
-        self._last_bar_time = datetime.now(timezone.utc)
+        self._last_bar_mono = time.monotonic() if now is None else now
         self._consecutive_errors = 0
 
-    def record_trade(self) -> None:
+    def record_trade(self, now: Optional[float] = None) -> None:
         """Record trade placed."""
         self._bars_since_trade = 0
         self._trades_today += 1
-        self._position_entry_time = datetime.now(timezone.utc)
+        self._position_entry_mono = time.monotonic() if now is None else now
 
     def record_exit(self) -> None:
         """Record position exit."""
-        self._position_entry_time = None
+        self._position_entry_mono = None
 
     def record_error(self, error: str) -> None:
         """Record an error."""
@@ -113,26 +201,34 @@ class HealthCheck:
         self._errors_today += 1
         self._last_error = error
 
-    def check(self, position: int) -> Dict[str, Any]:
+    def check(self, position: int, now: Optional[float] = None) -> Dict[str, Any]:
         """
         Run health checks.
 
+        Args:
+            position: Current broker position
+            now: time.monotonic() reading; taken here when not supplied
+
         Returns:
-            Dict with health status and any warnings/alerts
+            Dict with health status and any warnings/alerts. The dict is reused by
+            the next check(); copy it (or use snapshot()) to keep it.
         """
-        issues = []
+        if now is None:
+            now = time.monotonic()
+        issues = self._status_buf["issues"]
+        issues.clear()
         status = "healthy"
 
         # Check for data gaps
-        if self._last_bar_time:
-            gap = (datetime.now(timezone.utc) - self._last_bar_time).total_seconds()
+        if self._last_bar_mono is not None:
+            gap = now - self._last_bar_mono
             if gap > 120:  # 2 minutes without data
                 issues.append(f"DATA_GAP: {gap:.0f}s since last bar")
                 status = "warning"
 
         # Check for stuck position
-        if position != 0 and self._position_entry_time:
-            hold_minutes = (datetime.now(timezone.utc) - self._position_entry_time).total_seconds() / 60
+        if position != 0 and self._position_entry_mono is not None:
+            hold_minutes = (now - self._position_entry_mono) / 60
             if hold_minutes > self.max_position_age_minutes:
                 issues.append(f"STUCK_POSITION: held for {hold_minutes:.0f} minutes")
                 status = "critical"
@@ -142,22 +238,47 @@ class HealthCheck:
             issues.append(f"ERROR_THRESHOLD: {self._consecutive_errors} consecutive errors")
             status = "critical"
 
+        self._status_buf["status"] = status
+        self._last_check = (status, tuple(issues))
+
         # Send alerts
         for issue in issues:
             if self.alert_callback:
                 self.alert_callback(status, issue)
 
+        return self._refresh(now)
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Current health counters without running checks or firing alerts.
+
+        Safe to poll from status endpoints on another thread: builds a new dict and
+        never touches check()'s buffer. status/issues reflect the last check().
+        """
+        status, issues = self._last_check
         return {
             "status": status,
-            "issues": issues,
+            "issues": list(issues),
             "bars_processed": self._bars_processed,
             "bars_since_trade": self._bars_since_trade,
             "trades_today": self._trades_today,
             "errors_today": self._errors_today,
             "consecutive_errors": self._consecutive_errors,
-            "uptime_minutes": (datetime.now(timezone.utc) - self._start_time).total_seconds() / 60,
+            "started_at": self._start_time.isoformat(),
+            "uptime_minutes": ((time.monotonic() if now is None else now) - self._start_mono) / 60,
         }
 
+    def _refresh(self, now: Optional[float]) -> Dict[str, Any]:
+        """Write the current counters into the status buffer (check() only)."""
+        buf = self._status_buf
+        buf["bars_processed"] = self._bars_processed
+        buf["bars_since_trade"] = self._bars_since_trade
+        buf["trades_today"] = self._trades_today
+        buf["errors_today"] = self._errors_today
+        buf["consecutive_errors"] = self._consecutive_errors
+        buf["uptime_minutes"] = ((time.monotonic() if now is None else now) - self._start_mono) / 60
+        return buf
+
 
 class LiveRunner:
     """
@@ -171,6 +292,26 @@ class LiveRunner:
     - Health monitoring and kill switch
     """
 
+    # Run loop cadences (seconds)
+    HEALTH_INTERVAL_S = 60.0
+    RECONCILE_INTERVAL_S = 30.0
+    RECONCILE_IDLE_INTERVAL_S = 300.0  # safety-net cadence while flat with no fills
+    POLL_INTERVAL_S = 5.0  # REST fallback, only while the WebSocket is down
+
+    # MES contract economics
+    TICK_SIZE = 0.25
+    TICK_VALUE = 1.25  # $ per tick
+
+    # Max age of a reused adapter position snapshot
+    POSITION_SNAPSHOT_TTL_S = 0.5
+
+    # Bars waiting for the worker before the feed callback starts dropping them
+    BAR_QUEUE_SIZE = 64
+
+    # Event store write batching
+    EVENT_BATCH_SIZE = 64
+    EVENT_FLUSH_INTERVAL_S = 0.25
+
     def __init__(
         self,
         tradovate_config: Optional[TradovateConfig] = None,
@@ -204,11 +345,28 @@ class LiveRunner:
         self._state = RunnerState.STOPPED
         self._running = False
         self._shutdown_event = threading.Event()
+        self._shutdown_signal: Optional[int] = None
 
         # Components (initialized on start)
         self._adapter: Optional[TradovateLiveAdapter] = None
         self._data_feed: Optional[TradovateDataFeed] = None
         self._event_store: Optional[EventStore] = None
+        self._event_queue: Deque[Event] = deque()
+        self._flush_event = threading.Event()
+        self._flusher_stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+        # Bars are handed from the feed thread to a single worker
+        self._bar_queue: "queue.Queue[Optional[Bar]]" = queue.Queue(maxsize=self.BAR_QUEUE_SIZE)
+        self._bar_worker: Optional[threading.Thread] = None
+        self._bars_dropped = 0
+
+        # (monotonic time, snapshot) of the last adapter position read
+        self._pos_snap_cache: Tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+
+        # Monotonic times of the last fill and broker reconciliation
+        self._last_fill_mono = 0.0
+        self._last_recon_mono: Optional[float] = None
         self._event_publisher: Optional[EventPublisher] = None
         self._trade_publisher: Optional[TradePublisher] = None
 
@@ -228,6 +386,8 @@ class LiveRunner:
         self._current_beliefs: Dict[str, Any] = {}
         self._current_signals: Dict[str, float] = {}
         self._current_atr: float = 0.0
+        self._equity = Decimal("5000.00")  # TODO: Get from account
+        self._signals_dict: Dict[str, Any] = {}
 
         # Health monitoring
         self._health = HealthCheck(alert_callback=on_alert)
@@ -241,6 +401,10 @@ class LiveRunner:
         self._config_hash: Optional[str] = None
         self._data_contract: Optional[Dict] = None
         self._execution_contract: Optional[Dict] = None
+        self._dvs_rules: Optional[ScoreRules] = None
+        self._eqs_rules: Optional[ScoreRules] = None
+        self._dvs_val: float = 1.0
+        self._eqs_by_connection: Dict[bool, float] = {True: 1.0, False: 1.0}
 
     def _load_config_from_env(self) -> TradovateConfig:
         """Load Tradovate config from environment variables."""
@@ -271,6 +435,26 @@ class LiveRunner:
         except Exception:
             self._execution_contract = {"eqs": {"initial_value": 1.0, "degradation_events": []}}
 
+        # Reused per bar by _process_bar; keys are fixed for the session
+        self._signals_dict = dict.fromkeys(_SIGNAL_FIELDS, 0.0)
+        self._signals_dict["spread_ticks"] = 1.0
+        self._signals_dict["slippage_estimate_ticks"] = 1
+
+        # Contracts flattened once for scoring
+        self._dvs_rules = compile_dvs_rules(self._data_contract)
+        self._eqs_rules = compile_eqs_rules(self._execution_contract)
+
+        # The live feed reports a fixed data-quality state, so DVS is constant and EQS
+        # depends only on the connection; score both once instead of on every bar.
+        self._dvs_val = float(compute_dvs(_LIVE_DVS_STATE, self._dvs_rules))
+        self._eqs_by_connection = {
+            connected: float(compute_eqs(
+                {"connection_state": "OK" if connected else "DEGRADED"},
+                self._eqs_rules,
+            ))
+            for connected in (True, False)
+        }
+
         # Compute config hash
         cfg_sources = {
             "engine_version": "v2_live",
@@ -288,6 +472,7 @@ class LiveRunner:
         schema_path = Path(__file__).resolve().parent.parent / "log" / "schema.sql"
         if schema_path.exists():
             self._event_store.init_schema(str(schema_path))
+        self._start_flusher()
 
         # Supabase publisher (secondary)
         if self._supabase_url and self._supabase_key:
@@ -318,9 +503,9 @@ class LiveRunner:
         self._in_trade_manager = InTradeManager()
 
         logger.info(
-            f"Learning system initialized: "
-            f"evolution v{self._evolution.params.version}, "
-            f"meta frozen={self._meta_learner.state.learning_rates.frozen}"
+            "Learning system initialized: evolution v%s, meta frozen=%s",
+            self._evolution.params.version,
+            self._meta_learner.state.learning_rates.frozen,
         )
 
     def start(self) -> bool:
@@ -331,7 +516,7 @@ class LiveRunner:
             True if started successfully
         """
         if self._state != RunnerState.STOPPED:
-            logger.warning(f"Cannot start: current state is {self._state}")
+            logger.warning("Cannot start: current state is %s", self._state)
             return False
 
         self._state = RunnerState.STARTING
@@ -352,6 +537,9 @@ class LiveRunner:
             if not self._adapter.start():
                 raise Exception("Tradovate authentication failed")
 
+            # Start bar worker before the feed can deliver bars
+            self._start_bar_worker()
+
             # Start data feed
             self._data_feed = TradovateDataFeed(
                 access_token=self._adapter._access_token,
@@ -368,9 +556,11 @@ class LiveRunner:
             if self._event_publisher:
                 self._event_publisher.start()
 
-            # Set up signal handlers
-            signal.signal(signal.SIGINT, self._handle_shutdown)
-            signal.signal(signal.SIGTERM, self._handle_shutdown)
+            # Set up signal handlers (only possible from the main thread; embedders
+            # running start() elsewhere call stop() themselves)
+            if threading.current_thread() is threading.main_thread():
+                signal.signal(signal.SIGINT, self._handle_shutdown)
+                signal.signal(signal.SIGTERM, self._handle_shutdown)
 
             self._running = True
             self._state = RunnerState.RUNNING
@@ -380,6 +570,8 @@ class LiveRunner:
 
         except Exception as e:
             logger.exception("Failed to start live runner")
+            self._stop_bar_worker()
+            self._stop_flusher()
             self._state = RunnerState.ERROR
             return False
 
@@ -397,6 +589,7 @@ class LiveRunner:
         # Stop components
         if self._data_feed:
             self._data_feed.stop()
+        self._stop_bar_worker()
 
         if self._adapter:
             # Cancel all orders and flatten
@@ -407,87 +600,230 @@ class LiveRunner:
         if self._event_publisher:
             self._event_publisher.stop()
 
+        self._stop_flusher()
+
         self._state = RunnerState.STOPPED
         logger.info("Live runner stopped")
 
+    def _mk_event(self, kind: str, payload: Dict[str, Any], ts_iso: str) -> Event:
+        """Build an event on this runner's stream with the startup config hash."""
+        return Event.make(self.stream_id, ts_iso, kind, payload, self._config_hash)
+
+    def _append_events(self, events: List[Event]) -> None:
+        """Queue events for the flusher thread (written inline, in one transaction, when no flusher runs)."""
+        if self._flusher is None:
+            self._event_store.append_many(events)
+            return
+        self._event_queue.extend(events)
+        if len(self._event_queue) >= self.EVENT_BATCH_SIZE:
+            self._flush_event.set()
+
+    def _flush_events(self) -> None:
+        """Write all queued events in one transaction."""
+        batch = []
+        while self._event_queue:
+            batch.append(self._event_queue.popleft())
+        if not batch:
+            return
+        try:
+            self._event_store.append_many(batch)
+        except Exception as e:
+            logger.exception("Event flush failed (%d events dropped)", len(batch))
+            self._health.record_error(str(e))
+
+    def _flush_loop(self) -> None:
+        """Flush queued events every EVENT_FLUSH_INTERVAL_S or once a batch fills."""
+        while not self._flusher_stop.is_set():
+            self._flush_event.wait(timeout=self.EVENT_FLUSH_INTERVAL_S)
+            self._flush_event.clear()
+            self._flush_events()
+
+    def _start_flusher(self) -> None:
+        """Start the background thread that batches event store writes."""
+        self._flusher_stop.clear()
+        self._flusher = threading.Thread(target=self._flush_loop, name="event-flusher", daemon=True)
+        self._flusher.start()
+
+    def _stop_flusher(self) -> None:
+        """Stop the flusher thread and write whatever is still queued."""
+        if self._flusher is None:
+            return
+        self._flusher_stop.set()
+        self._flush_event.set()
+        self._flusher.join()
+        self._flusher = None
+        self._flush_events()
+
     def run(self) -> None:
         """
         Main run loop (blocking).
 
         Call this after start() to run until shutdown.
         """
+        # Computed once in _init_engines; every event emitted below reuses it verbatim
+        if self._config_hash is None:
+            raise RuntimeError("run() called before start()")
         logger.info("Entering main run loop")
 
-        while self._running and not self._shutdown_event.is_set():
+        now = time.monotonic()
+        next_health = next_recon = next_poll = now
+
+        # Sleep on the shutdown event until the earliest task is due; a signal or stop()
+        # wakes the loop immediately instead of after a fixed sleep.
+        while self._running and not self._shutdown_event.wait(
+            timeout=max(0.0, min(next_health, next_recon, next_poll) - time.monotonic())
+        ):
+            now = time.monotonic()
             try:
-                # Health check every minute
-                health = self._health.check(
-                    position=self._adapter.get_position_snapshot()["position"]
-                    if self._adapter else 0
-                )
+                if now >= next_health:
+                    next_health = now + self.HEALTH_INTERVAL_S
+                    health = self._health.check(
+                        position=self._position(),
+                        now=now,
+                    )
 
-                if health["status"] == "critical":
-                    logger.critical(f"Health critical: {health['issues']}")
-                    if self._adapter:
-                        self._adapter.set_kill_switch(True, "HEALTH_CRITICAL")
+                    if health["status"] == "critical":
+                        logger.critical("Health critical: %s", health["issues"])
+                        if self._adapter:
+                            self._adapter.set_kill_switch(True, "HEALTH_CRITICAL")
 
-                # Reconcile position
-                if self._adapter:
-                    recon = self._adapter.reconcile_position()
-                    if not recon.get("match", True):
-                        logger.error(f"Position mismatch: {recon}")
+                if now >= next_recon:
+                    next_recon = now + self.RECONCILE_INTERVAL_S
+                    if self._adapter and self._reconcile_due(now):
+                        self._last_recon_mono = now
+                        recon = self._adapter.reconcile_position()
+                        if not recon.get("match", True):
+                            logger.error("Position mismatch: %s", recon)
 
                 # Poll for updates if WebSocket not connected
-                if self._adapter and not self._adapter._ws_connected:
-                    self._adapter.poll_updates()
-
-                time.sleep(5)
+                if now >= next_poll:
+                    next_poll = now + self.POLL_INTERVAL_S
+                    if self._adapter and not self._adapter._ws_connected:
+                        self._adapter.poll_updates()
 
             except Exception as e:
-                logger.error(f"Run loop error: {e}")
+                logger.error("Run loop error: %s", e)
                 self._health.record_error(str(e))
 
+        if self._shutdown_signal is not None:
+            logger.info("Received signal %s, shutting down...", self._shutdown_signal)
         self.stop()
 
+    def _reconcile_due(self, now: float) -> bool:
+        """Reconcile while in a position or after a fill; when idle and flat, only every RECONCILE_IDLE_INTERVAL_S."""
+        if self._last_recon_mono is None or self._position() != 0:
+            return True
+        if self._last_fill_mono > self._last_recon_mono:
+            return True
+        return now - self._last_recon_mono >= self.RECONCILE_IDLE_INTERVAL_S
+
+    def _cached_position_snapshot(self) -> Dict[str, Any]:
+        """Adapter position snapshot, reused for POSITION_SNAPSHOT_TTL_S (cleared on fill).
+
+        The returned dict is shared; callers must not mutate it.
+        """
+        if not self._adapter:
+            return {}
+        taken_at, snap = self._pos_snap_cache
+        now = time.monotonic()
+        if snap is None or now - taken_at > self.POSITION_SNAPSHOT_TTL_S:
+            snap = self._adapter.get_position_snapshot()
+            self._pos_snap_cache = (now, snap)
+        return snap
+
+    def _position(self) -> int:
+        """Current net position from the cached snapshot (0 without an adapter)."""
+        return self._cached_position_snapshot().get("position", 0)
+
     def _on_bar(self, bar: Bar) -> None:
         """
         Handle completed bar from data feed.
 
+        Runs on the feed's thread, so it only queues the bar for the bar worker
+        (or processes it inline when no worker is running).
+        """
+        if self._bar_worker is None:
+            self._handle_bar(bar)
+            return
+        try:
+            self._bar_queue.put_nowait(bar)
+        except queue.Full:
+            self._bars_dropped += 1
+            logger.warning("DROPPED_BAR: %s (queue full, %d dropped)", bar.timestamp, self._bars_dropped)
+
+    def _bar_loop(self) -> None:
+        """Process queued bars in arrival order until the None sentinel."""
+        while True:
+            bar = self._bar_queue.get()
+            if bar is None:
+                return
+            if self._shutdown_event.is_set():
+                continue  # stale bar during shutdown: never trade on it
+            self._handle_bar(bar)
+
+    def _start_bar_worker(self) -> None:
+        """Start the thread that runs the trading logic for queued bars."""
+        self._bar_worker = threading.Thread(target=self._bar_loop, name="bar-worker", daemon=True)
+        self._bar_worker.start()
+
+    def _stop_bar_worker(self) -> None:
+        """Discard queued bars, let the worker finish the one in hand, then join it."""
+        if self._bar_worker is None:
+            return
+        discarded = 0
+        while True:
+            try:
+                self._bar_queue.get_nowait()
+            except queue.Empty:
+                break
+            discarded += 1
+        if discarded:
+            logger.info("Discarded %d queued bars on stop", discarded)
+        self._bar_queue.put(None)
+        self._bar_worker.join()
+        self._bar_worker = None
+
+    def _handle_bar(self, bar: Bar) -> None:
+        """
+        Process one completed bar.
+
         This is the main trading logic callback.
         """
+        # One clock read per bar, shared by health and trade bookkeeping
+        now = time.monotonic()
         try:
-            logger.info(f"Bar: {bar.timestamp} O={bar.open} H={bar.high} L={bar.low} C={bar.close} V={bar.volume}")
+            logger.info(
+                "Bar: %s O=%s H=%s L=%s C=%s V=%s",
+                bar.timestamp, bar.open, bar.high, bar.low, bar.close, bar.volume,
+            )
 
             # Record bar for health check
-            self._health.record_bar()
+            self._health.record_bar(now)
+
+            # Kill switch engaged: no decision can become an order, skip the engines
+            if self._adapter and getattr(self._adapter, "_kill_switch", False):
+                return
 
             # Process through V2 engines
-            result = self._process_bar(bar)
+            result = self._process_bar(bar, now)
 
             # Log decision
-            logger.info(f"Decision: {result.get('action')} - {result.get('reason')}")
+            logger.info("Decision: %s - %s", result.get("action"), result.get("reason"))
 
         except Exception as e:
             logger.exception("Bar processing error")
             self._health.record_error(str(e))
 
-    def _process_bar(self, bar: Bar) -> Dict[str, Any]:
+    def _process_bar(self, bar: Bar, now: Optional[float] = None) -> Dict[str, Any]:
         """Process a bar through the trading engines."""
         dt = bar.timestamp
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=ET)
+        ts_iso = dt.isoformat()
 
-        # Compute DVS/EQS
-        dvs_state = {
-            "bar_lag_seconds": 0,
-            "missing_fields": 0,
-            "gap_detected": False,
-        }
-        eqs_state = {
-            "connection_state": "OK" if self._data_feed.is_connected() else "DEGRADED",
-        }
-        dvs_val = float(compute_dvs(dvs_state, self._data_contract))
-        eqs_val = float(compute_eqs(eqs_state, self._execution_contract))
+        # DVS/EQS: precomputed in _init_engines, only the connection state varies per bar
+        dvs_val = self._dvs_val
+        eqs_val = self._eqs_by_connection[bool(self._data_feed.is_connected())]
 
         # Compute signals
         signal_output = self._signals.compute_signals(
@@ -503,40 +839,12 @@ class LiveRunner:
             eqs=eqs_val,
         )
 
-        # Build signals dict - all 28 V2 signals
-        signals_dict = {
-            "vwap_z": signal_output.vwap_z,
-            "vwap_slope": signal_output.vwap_slope,
-            "atr_14_n": signal_output.atr_14_n,
-            "range_compression": signal_output.range_compression,
-            "hhll_trend_strength": signal_output.hhll_trend_strength,
-            "breakout_distance_n": signal_output.breakout_distance_n,
-            "rejection_wick_n": signal_output.rejection_wick_n,
-            "close_location_value": signal_output.close_location_value,
-            "gap_from_prev_close_n": signal_output.gap_from_prev_close_n,
-            "distance_from_poc_proxy": signal_output.distance_from_poc_proxy,
-            "micro_trend_5": signal_output.micro_trend_5,
-            "real_body_impulse_n": signal_output.real_body_impulse_n,
-            "vol_z": signal_output.vol_z,
-            "vol_slope_20": signal_output.vol_slope_20,
-            "effort_vs_result": signal_output.effort_vs_result,
-            "range_expansion_on_volume": signal_output.range_expansion_on_volume,
-            "climax_bar_flag": signal_output.climax_bar_flag,
-            "quiet_bar_flag": signal_output.quiet_bar_flag,
-            "consecutive_high_vol_bars": signal_output.consecutive_high_vol_bars,
-            "participation_expansion_index": signal_output.participation_expansion_index,
-            "session_phase": signal_output.session_phase,
-            "opening_range_break": signal_output.opening_range_break,
-            "lunch_void_gate": signal_output.lunch_void_gate,
-            "close_magnet_index": signal_output.close_magnet_index,
-            "spread_proxy_tickiness": signal_output.spread_proxy_tickiness,
-            "slippage_risk_proxy": signal_output.slippage_risk_proxy,
-            "friction_regime_index": signal_output.friction_regime_index,
-            "dvs": signal_output.dvs,
-            # From live data feed
-            "spread_ticks": float(self._data_feed.get_spread() or 1),
-            "slippage_estimate_ticks": 1,
-        }
+        # Fill the reusable signals dict - all 28 V2 signals. The engines only read it;
+        # anything that keeps it past this bar (event payload, entry context) gets a copy.
+        signals_dict = self._signals_dict
+        signals_dict.update(zip(_SIGNAL_FIELDS, _read_signals(signal_output)))
+        # From live data feed
+        signals_dict["spread_ticks"] = float(self._data_feed.get_spread() or 1)
 
         # Compute beliefs
         beliefs = self._belief.compute_beliefs(
@@ -548,12 +856,12 @@ class LiveRunner:
 
         # Get state
         risk_state = self._state_store.get_risk_state(now=dt)
-        equity = Decimal("5000.00")  # TODO: Get from account
+        equity = self._equity
 
         state = {
             "dvs": dvs_val,
             "eqs": eqs_val,
-            "position": self._adapter.get_position_snapshot()["position"] if self._adapter else 0,
+            "position": self._position(),
             "last_price": bar.close,
             "timestamp": dt,
             "equity_usd": equity,
@@ -581,8 +889,7 @@ class LiveRunner:
         }
 
         # Log BELIEFS_1M event
-        b_event = Event.make(self.stream_id, dt.isoformat(), "BELIEFS_1M", beliefs_payload, self._config_hash)
-        self._event_store.append(b_event)
+        events = [self._mk_event("BELIEFS_1M", beliefs_payload, ts_iso)]
 
         # Log DECISION_1M event with signals and context for UI
         decision_dict = {
@@ -590,18 +897,22 @@ class LiveRunner:
             "reason": str(decision_result.reason) if decision_result.reason else None,
             "metadata": decision_result.metadata,
             # Include signals for UI display
-            "signals": signals_dict,
+            "signals": dict(signals_dict),
             "dvs": dvs_val,
             "eqs": eqs_val,
             "beliefs": {cid: b.effective_likelihood for cid, b in beliefs.items()},
         }
 
-        e = Event.make(self.stream_id, dt.isoformat(), "DECISION_1M", decision_dict, self._config_hash)
-        self._event_store.append(e)
+        events.append(self._mk_event("DECISION_1M", decision_dict, ts_iso))
 
-        # Execute if order intent
-        if decision_result.action == "ORDER_INTENT" and decision_result.order_intent:
-            self._execute_order(decision_result, bar, dt, signals_dict, beliefs)
+        # Execute if order intent; the bar's events are stored together either way
+        try:
+            if decision_result.action == "ORDER_INTENT" and decision_result.order_intent:
+                events.append(
+                    self._execute_order(decision_result, bar, dt, decision_dict["signals"], beliefs, now, ts_iso)
+                )
+        finally:
+            self._append_events(events)
 
         return decision_dict
 
@@ -612,39 +923,33 @@ class LiveRunner:
         dt: datetime,
         signals_at_entry: Dict[str, Any],
         beliefs_at_entry: Dict[str, Any],
-    ) -> None:
-        """Execute order from decision and capture context for learning."""
+        now: Optional[float] = None,
+        ts_iso: Optional[str] = None,
+    ) -> Event:
+        """Execute order from decision and capture context for learning; returns the ORDER_EVENT."""
         intent = decision_result.order_intent
         metadata = decision_result.metadata or {}
+        ts_iso = ts_iso or dt.isoformat()
 
         # Build bracket prices
-        tick_size = 0.25
         direction = intent.get("direction", "LONG")
         side = 1 if direction == "LONG" else -1
         entry_price = float(bar.close)
-        stop_ticks = intent.get("stop_ticks", 8)
-        target_ticks = intent.get("target_ticks", 12)
-        stop_price = entry_price - side * stop_ticks * tick_size
-        target_price = entry_price + side * target_ticks * tick_size
-
-        # Build intent wrapper
-        class IntentWrapper:
-            def __init__(self, d):
-                self.__dict__.update(d)
-                self.metadata = {
-                    "limit_price": entry_price,
-                    "instrument": self.symbol if hasattr(self, 'symbol') else "MESZ4",
-                    "bracket": {
-                        "stop_price": round(stop_price, 2),
-                        "target_price": round(target_price, 2),
-                    },
-                }
-
-        intent_obj = IntentWrapper(intent)
-        order_result = self._adapter.place_order(intent_obj, bar.close)
+        stop_price = entry_price - side * intent.get("stop_ticks", 8) * self.TICK_SIZE
+        target_price = entry_price + side * intent.get("target_ticks", 12) * self.TICK_SIZE
+
+        intent_obj = IntentWrapper(intent, self.symbol, {
+            "limit_price": entry_price,
+            "instrument": self.symbol,
+            "bracket": {
+                "stop_price": round(stop_price, 2),
+                "target_price": round(target_price, 2),
+            },
+        })
+        order_result = self._adapter.place_order(intent_obj, entry_price)
 
         if order_result.get("order_id"):
-            self._health.record_trade()
+            self._health.record_trade(now)
             self._state_store.record_entry(dt)
 
             # Update expected position
@@ -653,7 +958,7 @@ class LiveRunner:
 
             # Capture entry context for evolution learning
             self._entry_context = {
-                "entry_time": dt.isoformat(),
+                "entry_time": ts_iso,
                 "entry_price": entry_price,
                 "direction": direction,
                 "contracts": contracts,
@@ -666,12 +971,12 @@ class LiveRunner:
                     cid: b.effective_likelihood for cid, b in beliefs_at_entry.items()
                 },
             }
-            logger.info(f"Entry context captured for learning: template={metadata.get('template_id')}")
+            logger.info("Entry context captured for learning: template=%s", metadata.get("template_id"))
 
             # Publish to Supabase
             if self._trade_publisher:
                 self._trade_publisher.publish_trade({
-                    "timestamp": dt.isoformat(),
+                    "timestamp": ts_iso,
                     "symbol": self.symbol,
                     "direction": direction,
                     "contracts": contracts,
@@ -682,13 +987,14 @@ class LiveRunner:
                     "euc_score": metadata.get("euc_score"),
                 })
 
-        # Log order event
-        oe = Event.make(self.stream_id, dt.isoformat(), "ORDER_EVENT", order_result, self._config_hash)
-        self._event_store.append(oe)
+        # Order event, stored by the caller with the bar's other events
+        return self._mk_event("ORDER_EVENT", order_result, ts_iso)
 
     def _on_fill(self, fill: Dict[str, Any]) -> None:
         """Handle fill event from adapter and trigger comprehensive learning."""
-        logger.info(f"Fill: {fill}")
+        logger.info("Fill: %s", fill)
+        self._pos_snap_cache = (0.0, None)
+        self._last_fill_mono = time.monotonic()
 
         # Update state store
         if fill.get("position") == 0:
@@ -718,7 +1024,7 @@ class LiveRunner:
         if self._meta_learner:
             should_learn, reason = self._meta_learner.should_learn()
             if not should_learn:
-                logger.info(f"Learning skipped: {reason}")
+                logger.info("Learning skipped: %s", reason)
                 return
             learning_rates = self._meta_learner.get_learning_rates(
                 sigma_norm=self._current_atr / 6.0 if self._current_atr > 0 else 1.0
@@ -754,8 +1060,8 @@ class LiveRunner:
 
                 if result.success and result.parameters_updated > 0:
                     logger.info(
-                        f"Full trade learning: pnl=${pnl_usd:.2f}, "
-                        f"{result.parameters_updated} params updated"
+                        "Full trade learning: pnl=$%.2f, %d params updated",
+                        pnl_usd, result.parameters_updated,
                     )
 
                 # Clear in-trade manager
@@ -769,13 +1075,11 @@ class LiveRunner:
             contracts = self._entry_context.get("contracts", 1)
 
             # Calculate PnL
-            tick_size = 0.25
-            tick_value = 1.25  # $1.25 per tick for MES
             price_diff = exit_price - entry_price
             if direction == "SHORT":
                 price_diff = -price_diff
-            ticks = price_diff / tick_size
-            pnl_usd = ticks * tick_value * contracts
+            ticks = price_diff / self.TICK_SIZE
+            pnl_usd = ticks * self.TICK_VALUE * contracts
 
             # Build trade data for learning
             trade_data = {
@@ -797,8 +1101,8 @@ class LiveRunner:
 
             if result.success and result.parameters_updated > 0:
                 logger.info(
-                    f"Learned from trade: pnl=${pnl_usd:.2f}, "
-                    f"{result.parameters_updated} params updated"
+                    "Learned from trade: pnl=$%.2f, %d params updated",
+                    pnl_usd, result.parameters_updated,
                 )
 
             # Clear entry context
@@ -806,25 +1110,26 @@ class LiveRunner:
 
     def _on_adapter_error(self, error: str) -> None:
         """Handle adapter error."""
-        logger.error(f"Adapter error: {error}")
+        logger.error("Adapter error: %s", error)
         self._health.record_error(error)
 
     def _on_feed_error(self, error: str) -> None:
         """Handle data feed error."""
-        logger.error(f"Feed error: {error}")
+        logger.error("Feed error: %s", error)
         self._health.record_error(error)
 
     def _handle_shutdown(self, signum: int, frame: Any) -> None:
-        """Handle shutdown signal."""
-        logger.info(f"Received signal {signum}, shutting down...")
+        """Handle shutdown signal.
+
+        Only records the signal and sets the event, which wakes run() at once;
+        logging happens in run(), outside the interrupted frame.
+        """
+        self._shutdown_signal = signum
         self._shutdown_event.set()
 
     def get_status(self) -> Dict[str, Any]:
-        """Get runner status."""
-        health = self._health.check(
-            position=self._adapter.get_position_snapshot()["position"]
-            if self._adapter else 0
-        )
+        """Get runner status (read-only; health checks and alerts run from run())."""
+        health = self._health.snapshot()
 
         return {
             "state": self._state.value,
@@ -832,12 +1137,16 @@ class LiveRunner:
             "stream_id": self.stream_id,
             "data_feed_connected": self._data_feed.is_connected() if self._data_feed else False,
             "adapter_connected": bool(self._adapter and self._adapter._access_token),
-            "position": self._adapter.get_position_snapshot() if self._adapter else {},
+            "position": dict(self._cached_position_snapshot()),
             "health": health,
             "publisher_stats": self._event_publisher.get_stats() if self._event_publisher else {},
         }
 
 
+# HealthCheck status -> alert log level
+_ALERT_LEVELS = {"warning": logging.WARNING, "critical": logging.CRITICAL}
+
+
 def run_live(
     symbol: str = "MESZ4",
     environment: str = "demo",
@@ -860,9 +1169,21 @@ def run_live(
         print("Error: Set TRADOVATE_USERNAME and TRADOVATE_PASSWORD environment variables")
         return
 
+    # Alerts can fire on the feed/worker threads; a QueueHandler keeps the stdout
+    # write off those threads and on the listener's.
+    alert_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    alert_handler = logging.handlers.QueueHandler(alert_queue)
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+    listener = logging.handlers.QueueListener(alert_queue, stdout_handler)
+    alert_logger = logging.getLogger("trading_bot.alerts")
+    alert_logger.addHandler(alert_handler)
+    alert_logger.propagate = False
+    listener.start()
+
     # Alert callback
     def on_alert(level: str, message: str):
-        print(f"[{level.upper()}] {message}")
+        alert_logger.log(_ALERT_LEVELS.get(level, logging.WARNING), message)
         # TODO: Send to Slack/Discord/SMS
 
     runner = LiveRunner(
@@ -871,7 +1192,11 @@ def run_live(
         on_alert=on_alert,
     )
 
-    if runner.start():
-        runner.run()
-    else:
-        print("Failed to start live runner")
+    try:
+        if runner.start():
+            runner.run()
+        else:
+            print("Failed to start live runner")
+    finally:
+        listener.stop()
+        alert_logger.removeHandler(alert_handler)
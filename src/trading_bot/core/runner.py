@@ -11,7 +11,7 @@ from enum import Enum
 from trading_bot.engines.signals_v2 import SignalEngineV2 as SignalEngine, ET
 from trading_bot.engines.decision_v2 import DecisionEngineV2 as DecisionEngine
 from trading_bot.engines.belief_v2 import BeliefEngineV2
-from trading_bot.engines.dvs_eqs import compute_dvs, compute_eqs
+from trading_bot.engines.dvs_eqs import compile_dvs_rules, compile_eqs_rules, compute_dvs, compute_eqs
 from trading_bot.engines.attribution import attribute
 from trading_bot.engines.simulator import simulate_fills
 from trading_bot.core.adapter_factory import create_adapter
@@ -55,6 +55,9 @@ class BotRunner:
             execution_contract = {"eqs": {"initial_value": 1.0, "degradation_events": []}}
         self.data_contract = data_contract
         self.execution_contract = execution_contract
+        # Flattened once; run_once scores every bar against these
+        self._dvs_rules = compile_dvs_rules(data_contract)
+        self._eqs_rules = compile_eqs_rules(execution_contract)
 
         # Normalize decision engine config for hashing (avoid missing attrs on V2)
         tier_cfg = {}
@@ -112,8 +115,8 @@ class BotRunner:
             "order_state": "IDLE",
             "connection_state": "OK",
         }
-        dvs_val = Decimal(str(compute_dvs(dvs_state, self.data_contract)))
-        eqs_val = Decimal(str(compute_eqs(eqs_state, self.execution_contract)))
+        dvs_val = Decimal(str(compute_dvs(dvs_state, self._dvs_rules)))
+        eqs_val = Decimal(str(compute_eqs(eqs_state, self._eqs_rules)))
 
         # Build state snapshot
         risk_state = self.state_store.get_risk_state(now=dt)
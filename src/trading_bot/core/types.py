@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
 from typing import Any, Dict, Literal
 import json
 import hashlib
+import time
 
 EventType = Literal[
     "BAR_1M",
@@ -29,6 +31,17 @@ def stable_json(obj: Any) -> str:
 def sha256_hex(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
+# Hot paths stamp time.monotonic_ns(); these convert to/from naive-UTC datetimes
+# (as datetime.utcnow() returns) only when a timestamp is externalised.
+_BOOT_WALL = datetime.utcnow()
+_BOOT_MONO = time.monotonic_ns()
+
+def mono_to_utc(ns: int) -> datetime:
+    return _BOOT_WALL + timedelta(microseconds=(ns - _BOOT_MONO) // 1000)
+
+def utc_to_mono(dt: datetime) -> int:
+    return _BOOT_MONO + (dt - _BOOT_WALL) // timedelta(microseconds=1) * 1000
+
 @dataclass(frozen=True)
 class Event:
     event_id: str
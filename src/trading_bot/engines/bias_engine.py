@@ -11,7 +11,7 @@ from typing import Dict, Any, List
 from dataclasses import asdict
 import importlib
 
-from trading_bot.core.bias_strategy_types import BiasSpec, BiasState, BiasCategory
+from trading_bot.core.bias_strategy_types import BiasSpec, BiasState, BiasCategory, parse_bias_category
 from trading_bot.engines.detectors import get_detector
 
 
@@ -34,7 +34,7 @@ class BiasEngine:
         for bias_data in data.get("biases", []):
             spec = BiasSpec(
                 id=bias_data["id"],
-                category=BiasCategory(bias_data["category"]),
+                category=parse_bias_category(bias_data["category"]),
                 inputs=bias_data["inputs"],
                 detectors=bias_data["detectors"],
                 strength_fn=bias_data["strength_fn"],
@@ -58,6 +58,16 @@ class DataLayer:
             raise ValueError("data_contract.yaml missing 'dvs' section")
         if "degradation_events" not in self.data_contract["dvs"]:
             raise ValueError("data_contract.yaml missing 'dvs.degradation_events' list")
+
+        # Calendar lookups for per-bar gating. The contract keeps sorted lists (they
+        # feed the config hash); membership checks use these sets/maps instead.
+        self._holiday_dates = frozenset(self.calendar_contract.get("holiday_dates", []))
+        self._half_day_close: Dict[str, time] = {}
+        for hd in self.calendar_contract.get("half_days", []):
+            close_hour, close_min = hd["close_time"].split(":")[:2]
+            close = time(int(close_hour), int(close_min))
+            if close < self._half_day_close.get(hd["date"], time.max):
+                self._half_day_close[hd["date"]] = close
         
     def validate_bar(self, bar: Bar) -> DataQualityReport:
         """
@@ -230,23 +240,13 @@ class DataLayer:
         """Check if current date is a trading day."""
         date_str = current_time.strftime("%Y-%m-%d")
         
-        # Check holidays (normalized as sorted list)
-        holiday_dates = self.calendar_contract.get("holiday_dates", [])
-        if date_str in holiday_dates:
+        if date_str in self._holiday_dates:
             return False
         
-        # Check if half-day and past close
-        half_days = self.calendar_contract.get("half_days", [])
-        for hd in half_days:
-            if hd["date"] == date_str:
-                # Parse close time (format: "HH:MM")
-                close_parts = hd["close_time"].split(":")
-                close_hour = int(close_parts[0])
-                close_min = int(close_parts[1])
-                close_time = time(close_hour, close_min)
-                
-                if current_time.time() >= close_time:
-                    return False
+        # Half-day: closed from the early close time onward
+        close_time = self._half_day_close.get(date_str)
+        if close_time is not None and current_time.time() >= close_time:
+            return False
         
         return True
     
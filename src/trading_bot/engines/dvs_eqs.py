@@ -12,78 +12,128 @@ DVS:
 
 Conditions use a small explicit parser with suffix operators (`_gte`, `_lte`,
 `_gt`, `_lt`, `_eq`). Unknown shapes fail closed (do not match).
+
+Contracts are flattened into `ScoreRules` (compile_dvs_rules / compile_eqs_rules);
+per-bar callers compile once and pass the rules instead of the contract dict.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple, Union
 
+# (metric, op, threshold) with op one of "gte", "gt", "lte", "lt", "eq"
+Condition = Tuple[Tuple[str, str, Any], ...]
 
-def clamp01(x: float) -> float:
-    return max(0.0, min(1.0, x))
+# Suffix -> op, in the order suffixes are tested (`_gte` before `_gt`, `_lte` before `_lt`)
+_SUFFIX_OPS = (("_gte", "gte"), ("_gt", "gt"), ("_lte", "lte"), ("_lt", "lt"), ("_eq", "eq"))
 
 
-def _matches_condition(cond: Any, metrics: Dict[str, Any]) -> bool:
-    """Evaluate a structured condition safely; unknown shapes fail-closed (False)."""
-    if cond is None:
-        return False
-
-    if isinstance(cond, dict):
-        for key, val in cond.items():
-            if key.endswith("_gte"):
-                metric = key[:-4]
-                if metrics.get(metric) is None or float(metrics[metric]) < float(val):
-                    return False
-            elif key.endswith("_gt"):
-                metric = key[:-3]
-                if metrics.get(metric) is None or float(metrics[metric]) <= float(val):
-                    return False
-            elif key.endswith("_lte"):
-                metric = key[:-4]
-                if metrics.get(metric) is None or float(metrics[metric]) > float(val):
-                    return False
-            elif key.endswith("_lt"):
-                metric = key[:-3]
-                if metrics.get(metric) is None or float(metrics[metric]) >= float(val):
-                    return False
-            elif key.endswith("_eq"):
-                metric = key[:-3]
-                if metrics.get(metric) != val:
-                    return False
-            else:
-                return False
-        return True
-
-    # Fail-closed for any non-dict conditions
-    return False
-
+def clamp01(x: float) -> float:
+    return max(0.0, min(1.0, x))
 
-def _apply_penalty(eqs: float, ev: Dict[str, Any]) -> float:
-    """Apply immediate penalty from event; support both immediate_penalty and penalties.eqs_delta."""
-    if not isinstance(ev, dict):
-        return eqs
 
-    if "immediate_penalty" in ev:
-        delta = float(ev.get("immediate_penalty", 0.0))
-        return clamp01(eqs - delta)
+@dataclass(frozen=True)
+class ScoreRules:
+    """A `dvs`/`eqs` contract section flattened for per-bar scoring.
 
-    penalties = ev.get("penalties", {})
-    if isinstance(penalties, dict):
-        delta = float(penalties.get("eqs_delta", 0.0))
-        return clamp01(eqs + delta)
+    rules holds (condition, signed delta) pairs in contract order; events whose
+    condition can never match, or that carry no usable penalty, are dropped.
+    """
 
-    return eqs
+    initial_value: float
+    rules: Tuple[Tuple[Condition, float], ...]
+    recovery_per_bar: Optional[float] = None
+    slippage_min_expected: Any = 1e-9
+
+
+def _compile_condition(cond: Any) -> Optional[Condition]:
+    """Structured condition -> tuple form; None for shapes that fail closed (never match)."""
+    if not isinstance(cond, dict):
+        return None
+    out = []
+    for key, val in cond.items():
+        for suffix, op in _SUFFIX_OPS:
+            if key.endswith(suffix):
+                out.append((key[: -len(suffix)], op, val if op == "eq" else float(val)))
+                break
+        else:
+            return None
+    return tuple(out)
+
+
+def _compile_rules(cfg: Any, delta_key: str, recovery_key: str) -> ScoreRules:
+    cfg = cfg if isinstance(cfg, dict) else {}
+    rules = []
+    for ev in cfg.get("degradation_events", []) or []:
+        if not isinstance(ev, dict):
+            continue
+        cond = _compile_condition(ev.get("condition"))
+        if cond is None:
+            continue
+        # immediate_penalty subtracts; penalties.<delta_key> is added (negative for degradation)
+        if "immediate_penalty" in ev:
+            delta = -float(ev.get("immediate_penalty", 0.0))
+        else:
+            penalties = ev.get("penalties", {})
+            if not isinstance(penalties, dict):
+                continue
+            delta = float(penalties.get(delta_key, 0.0))
+        rules.append((cond, delta))
+    recovery = cfg.get("recovery")
+    return ScoreRules(
+        initial_value=float(cfg.get("initial_value", 1.0)),
+        rules=tuple(rules),
+        recovery_per_bar=float(recovery.get(recovery_key, 0.0)) if isinstance(recovery, dict) else None,
+        slippage_min_expected=cfg.get("slippage_min_expected", 1e-9),
+    )
+
+
+def compile_dvs_rules(data_contract: Dict[str, Any]) -> ScoreRules:
+    """Flatten data_contract.yaml's `dvs` section once; pass the result to compute_dvs."""
+    return _compile_rules((data_contract or {}).get("dvs", {}), "dvs_delta", "dvs_recovery_per_bar")
+
+
+def compile_eqs_rules(execution_contract: Dict[str, Any]) -> ScoreRules:
+    """Flatten execution_contract.yaml's `eqs` section once; pass the result to compute_eqs."""
+    return _compile_rules((execution_contract or {}).get("eqs", {}), "eqs_delta", "eqs_recovery_per_bar")
+
+
+def _matches(cond: Condition, metrics: Dict[str, Any]) -> bool:
+    for metric, op, val in cond:
+        m = metrics.get(metric)
+        if op == "eq":
+            if m != val:
+                return False
+            continue
+        if m is None:
+            return False
+        m = float(m)
+        if op == "gte":
+            if m < val:
+                return False
+        elif op == "gt":
+            if m <= val:
+                return False
+        elif op == "lte":
+            if m > val:
+                return False
+        elif m >= val:  # lt
+            return False
+    return True
 
 
-def _apply_recovery(eqs: float, recovery_cfg: Any) -> float:
-    """Simple linear recovery per step if configured."""
-    if not isinstance(recovery_cfg, dict):
-        return eqs
-    per_bar = float(recovery_cfg.get("eqs_recovery_per_bar", 0.0))
-    return clamp01(eqs + per_bar)
+def _score(value: float, rules: ScoreRules, metrics: Dict[str, Any]) -> float:
+    # Deterministic evaluation: list order is authoritative
+    for cond, delta in rules.rules:
+        if _matches(cond, metrics):
+            value = clamp01(value + delta)
+    if rules.recovery_per_bar is not None:
+        value = clamp01(value + rules.recovery_per_bar)
+    return clamp01(value)
 
 
-def compute_eqs(state: Dict[str, Any], execution_contract: Dict[str, Any]) -> float:
+def compute_eqs(state: Dict[str, Any], execution_contract: Union[Dict[str, Any], ScoreRules]) -> float:
     """
     Compute EQS given current execution state and the normalized execution contract.
 
@@ -91,16 +141,13 @@ def compute_eqs(state: Dict[str, Any], execution_contract: Dict[str, Any]) -> fl
     - Applies each triggered event once per evaluation step
     - Clamps to [0,1]
     - Recovery is optional and linear if configured
+    - Accepts compile_eqs_rules() output in place of the contract for repeated calls
     """
-
-    eqs_cfg = (execution_contract or {}).get("eqs", {})
-    events: List[Dict[str, Any]] = eqs_cfg.get("degradation_events", []) or []
+    rules = execution_contract if isinstance(execution_contract, ScoreRules) else compile_eqs_rules(execution_contract)
 
     # Start from state-provided EQS or contract initial_value
     eqs_val = state.get("eqs")
-    if eqs_val is None:
-        eqs_val = eqs_cfg.get("initial_value", 1.0)
-    eqs_val = float(eqs_val)
+    eqs_val = rules.initial_value if eqs_val is None else float(eqs_val)
 
     # Metrics snapshot; state keys should be set by the caller
     # Normalize metrics for structured conditions
@@ -108,11 +155,9 @@ def compute_eqs(state: Dict[str, Any], execution_contract: Dict[str, Any]) -> fl
     limit_price = state.get("limit_price")
     expected_slippage = state.get("expected_slippage")
     slippage_vs_expected = None
-    # Get EPS floor from contract, fallback to 1e-9
-    EPS = eqs_cfg.get("slippage_min_expected", 1e-9)
     if fill_price is not None and limit_price is not None and expected_slippage is not None:
         try:
-            denom = max(float(expected_slippage), EPS)
+            denom = max(float(expected_slippage), rules.slippage_min_expected)
             slippage_vs_expected = abs(float(fill_price) - float(limit_price)) / denom
         except Exception:
             slippage_vs_expected = None
@@ -126,42 +171,10 @@ def compute_eqs(state: Dict[str, Any], execution_contract: Dict[str, Any]) -> fl
         "slippage_ticks": state.get("slippage_ticks"),
         "slippage_vs_expected": slippage_vs_expected,
     }
-
-    # Deterministic evaluation: list order is authoritative
-    for ev in events:
-        if not isinstance(ev, dict):
-            continue
-        if _matches_condition(ev.get("condition"), metrics):
-            eqs_val = _apply_penalty(eqs_val, ev)
-
-    eqs_val = _apply_recovery(eqs_val, eqs_cfg.get("recovery"))
-    return clamp01(eqs_val)
-
-
-def _apply_dvs_penalty(dvs: float, ev: Dict[str, Any]) -> float:
-    """Apply immediate penalty from DVS event; supports immediate_penalty or penalties.dvs_delta."""
-    if not isinstance(ev, dict):
-        return dvs
-    if "immediate_penalty" in ev:
-        delta = float(ev.get("immediate_penalty", 0.0))
-        return clamp01(dvs - delta)
-    penalties = ev.get("penalties", {})
-    if isinstance(penalties, dict):
-        delta = float(penalties.get("dvs_delta", 0.0))
-        # Note: delta is expected negative for degradation; still clamp
-        return clamp01(dvs + delta)
-    return dvs
+    return _score(eqs_val, rules, metrics)
 
 
-def _apply_dvs_recovery(dvs: float, recovery_cfg: Any) -> float:
-    """Simple linear DVS recovery per step if configured."""
-    if not isinstance(recovery_cfg, dict):
-        return dvs
-    per_bar = float(recovery_cfg.get("dvs_recovery_per_bar", 0.0))
-    return clamp01(dvs + per_bar)
-
-
-def compute_dvs(state: Dict[str, Any], data_contract: Dict[str, Any]) -> float:
+def compute_dvs(state: Dict[str, Any], data_contract: Union[Dict[str, Any], ScoreRules]) -> float:
     """
     Compute DVS given current data validity state and the normalized data contract.
 
@@ -169,16 +182,13 @@ def compute_dvs(state: Dict[str, Any], data_contract: Dict[str, Any]) -> float:
     - Applies each triggered event once per evaluation step
     - Clamps to [0,1]
     - Optional linear recovery if configured
+    - Accepts compile_dvs_rules() output in place of the contract for repeated calls
     """
-
-    dvs_cfg = (data_contract or {}).get("dvs", {})
-    events: List[Dict[str, Any]] = dvs_cfg.get("degradation_events", []) or []
+    rules = data_contract if isinstance(data_contract, ScoreRules) else compile_dvs_rules(data_contract)
 
     # Start from state-provided DVS or contract initial_value
     dvs_val = state.get("dvs")
-    if dvs_val is None:
-        dvs_val = dvs_cfg.get("initial_value", 1.0)
-    dvs_val = float(dvs_val)
+    dvs_val = rules.initial_value if dvs_val is None else float(dvs_val)
 
     # Metrics snapshot; callers should populate these keys as appropriate
     metrics = {
@@ -194,13 +204,4 @@ def compute_dvs(state: Dict[str, Any], data_contract: Dict[str, Any]) -> float:
         "price_jump_pct": state.get("price_jump_pct"),
         "volume_spike_ratio": state.get("volume_spike_ratio"),
     }
-
-    # Deterministic evaluation: list order is authoritative
-    for ev in events:
-        if not isinstance(ev, dict):
-            continue
-        if _matches_condition(ev.get("condition"), metrics):
-            dvs_val = _apply_dvs_penalty(dvs_val, ev)
-
-    dvs_val = _apply_dvs_recovery(dvs_val, dvs_cfg.get("recovery"))
-    return clamp01(dvs_val)
+    return _score(dvs_val, rules, metrics)
@@ -9,7 +9,7 @@ import yaml
 from pathlib import Path
 from typing import Dict, Any, List
 
-from trading_bot.core.bias_strategy_types import StrategySpec, StrategyState, StrategyClass, BiasState
+from trading_bot.core.bias_strategy_types import StrategySpec, StrategyState, StrategyClass, BiasState, parse_strategy_class
 from trading_bot.engines.detectors import get_detector
 
 
@@ -32,7 +32,7 @@ class StrategyRecognizer:
         for strat_data in data.get("strategies", []):
             spec = StrategySpec(
                 id=strat_data["id"],
-                strategy_class=StrategyClass(strat_data["strategy_class"]),
+                strategy_class=parse_strategy_class(strat_data["strategy_class"]),
                 bias_dependencies=strat_data["bias_dependencies"],
                 signature_detectors=strat_data["signature_detectors"],
                 success_metrics=strat_data["success_metrics"],
@@ -1,12 +1,41 @@
 from __future__ import annotations
 
 import sqlite3
-from typing import Iterable, List, Optional
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from pathlib import Path
 import json
 
 from trading_bot.core.types import Event
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _decode_payload(payload_json: str) -> dict:
+    """Decode a stored payload; orjson when present, stdlib for what it rejects (NaN/Infinity)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(payload_json)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(payload_json)
+
+
+# SQL predicate mirroring Python truthiness of payload["kill_switch"] (missing/null -> false).
+_KILL_SWITCH_TRUTHY = """CASE json_type(payload_json, '$.kill_switch')
+    WHEN 'true' THEN 1
+    WHEN 'integer' THEN json_extract(payload_json, '$.kill_switch') != 0
+    WHEN 'real' THEN json_extract(payload_json, '$.kill_switch') != 0
+    WHEN 'text' THEN json_extract(payload_json, '$.kill_switch') != ''
+    WHEN 'array' THEN json_array_length(payload_json, '$.kill_switch') > 0
+    WHEN 'object' THEN json_extract(payload_json, '$.kill_switch') != '{}'
+    ELSE 0 END"""
+
+
 class EventStore:
     """Append-only, idempotent event store."""
 
@@ -18,6 +47,7 @@ class EventStore:
         con = sqlite3.connect(self.db_path)
         con.execute("PRAGMA journal_mode=WAL;")
         con.execute("PRAGMA synchronous=NORMAL;")
+        con.execute("PRAGMA temp_store=MEMORY;")
         return con
 
     def init_schema(self, schema_sql_path: str) -> None:
@@ -47,10 +77,18 @@ class EventStore:
             con.close()
 
     def append_many(self, events: Iterable[Event]) -> int:
+        """Insert events in a single transaction. Returns the number of new rows.
+
+        One BEGIN IMMEDIATE / executemany / COMMIT on the WAL connection, so a batch
+        costs a single commit however many rows it has. Already-stored ids are
+        skipped; an error part-way through rolls the whole batch back.
+        """
         con = self.connect()
         try:
             cur = con.cursor()
-            rows = [(e.event_id, e.stream_id, e.ts, e.type, e.payload_json(), e.config_hash) for e in events]
+            # Generator: executemany pulls rows lazily, so callers can stream events in
+            rows = ((e.event_id, e.stream_id, e.ts, e.type, e.payload_json(), e.config_hash) for e in events)
+            cur.execute("BEGIN IMMEDIATE")
             cur.executemany(
                 """
                 INSERT OR IGNORE INTO events (id, stream_id, ts, type, payload_json, config_hash)
@@ -64,6 +102,16 @@ class EventStore:
             con.close()
 
     def read_stream(self, stream_id: str, start_ts: Optional[str] = None, end_ts: Optional[str] = None) -> List[Event]:
+        return list(self.iter_stream(stream_id, start_ts, end_ts))
+
+    def iter_stream(
+        self,
+        stream_id: str,
+        start_ts: Optional[str] = None,
+        end_ts: Optional[str] = None,
+        chunk: int = 1024,
+    ) -> Iterator[Event]:
+        """Yield a stream's events in ts order, fetching `chunk` rows at a time."""
         con = self.connect()
         try:
             cur = con.cursor()
@@ -77,10 +125,88 @@ class EventStore:
                 args.append(end_ts)
             q += " ORDER BY ts ASC"
             cur.execute(q, args)
-            out: List[Event] = []
-            for eid, sid, ts, etype, payload_json, config_hash in cur.fetchall():
-                payload = json.loads(payload_json)
-                out.append(Event(event_id=eid, stream_id=sid, ts=ts, type=etype, payload=payload, config_hash=config_hash))
-            return out
+            while rows := cur.fetchmany(chunk):
+                for eid, sid, ts, etype, payload_json, config_hash in rows:
+                    payload = _decode_payload(payload_json)
+                    yield Event(event_id=eid, stream_id=sid, ts=ts, type=etype, payload=payload, config_hash=config_hash)
+        finally:
+            con.close()
+
+    def tail(self, n: int = 10) -> List[tuple]:
+        """Return (ts, type) for the `n` most recently inserted events, newest first."""
+        con = self.connect()
+        try:
+            return con.execute("SELECT ts, type FROM events ORDER BY rowid DESC LIMIT ?", (n,)).fetchall()
+        finally:
+            con.close()
+
+    def summarize_reconciliation(self, stream_id: str) -> Dict[str, Any]:
+        """SQL-side equivalent of log.exporters.summarize_reconciliation.
+
+        Aggregates with SQLite's JSON1 functions so only summary rows reach Python.
+        Raises sqlite3.OperationalError when JSON1 is unavailable; callers fall back
+        to streaming the events through the Python summarizer.
+        """
+        con = self.connect()
+        try:
+            cur = con.cursor()
+            cur.execute(
+                f"""
+                SELECT COUNT(*),
+                       COALESCE(SUM({_KILL_SWITCH_TRUTHY}), 0)
+                FROM events WHERE stream_id = ? AND type = 'RECONCILIATION'
+                """,
+                (stream_id,),
+            )
+            recon, desync = cur.fetchone()
+            # Histogram keys are emitted in first-seen stream order to match Counter.most_common tie-breaks.
+            cur.execute(
+                f"""
+                SELECT CASE WHEN json_type(payload_json, '$.kill_reason') IS NULL THEN 'UNKNOWN'
+                            ELSE json_extract(payload_json, '$.kill_reason') END AS reason,
+                       COUNT(*)
+                FROM events
+                WHERE stream_id = ? AND type = 'RECONCILIATION'
+                  AND {_KILL_SWITCH_TRUTHY}
+                GROUP BY reason
+                ORDER BY MIN(ts), MIN(rowid)
+                """,
+                (stream_id,),
+            )
+            kill_hist: Counter = Counter(dict(cur.fetchall()))
+            cur.execute(
+                """
+                SELECT COUNT(*)
+                FROM events, json_each(events.payload_json, '$.actions') AS a
+                WHERE events.stream_id = ? AND events.type = 'RECONCILIATION'
+                  AND json_type(events.payload_json, '$.actions') = 'array'
+                  AND CASE WHEN a.type = 'object' THEN json_extract(a.value, '$.action') END = 'CANCEL'
+                """,
+                (stream_id,),
+            )
+            (cancels,) = cur.fetchone()
+            cur.execute(
+                """
+                SELECT rc, COUNT(*)
+                FROM (
+                    SELECT json_extract(payload_json, '$.reasons.reason_code') AS rc, ts, rowid AS rid
+                    FROM events
+                    WHERE stream_id = ? AND type = 'DECISION_RECORD'
+                      AND json_type(payload_json, '$.reasons') = 'object'
+                )
+                WHERE rc IS NOT NULL AND rc != '' AND rc != 0
+                GROUP BY rc
+                ORDER BY MIN(ts), MIN(rid)
+                """,
+                (stream_id,),
+            )
+            skip_hist: Counter = Counter(dict(cur.fetchall()))
+            return {
+                "reconciliations": recon,
+                "desync_kills": desync,
+                "ttl_cancels": cancels,
+                "skip_reasons": skip_hist,
+                "kill_causes": kill_hist,
+            }
         finally:
             con.close()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import Counter
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any
 from trading_bot.core.types import Event
 
 def summarize_no_trade_reasons(events: List[Event]) -> Dict[str, Any]:
@@ -15,3 +15,37 @@ def summarize_no_trade_reasons(events: List[Event]) -> Dict[str, Any]:
         "no_trade_reasons": dict(reasons),
         "total_decisions": sum(reasons.values()),
     }
+
+def summarize_reconciliation(events: Iterable[Event]) -> Dict[str, Any]:
+    """Single pass over a stream: reconciliation counts plus skip/kill histograms."""
+    recon = 0
+    desync = 0
+    cancels = 0
+    skip_hist: Counter[str] = Counter()
+    kill_hist: Counter[str] = Counter()
+    for e in events:
+        etype = e.type
+        if etype == "RECONCILIATION":
+            get = e.payload.get
+            recon += 1
+            if get("kill_switch"):
+                desync += 1
+                kill_hist[get("kill_reason", "UNKNOWN")] += 1
+            actions = get("actions")
+            if actions:
+                for a in actions:
+                    if a.get("action") == "CANCEL":
+                        cancels += 1
+        elif etype == "DECISION_RECORD":
+            reasons = e.payload.get("reasons")
+            if reasons:
+                rc = reasons.get("reason_code")
+                if rc:
+                    skip_hist[rc] += 1
+    return {
+        "reconciliations": recon,
+        "desync_kills": desync,
+        "ttl_cancels": cancels,
+        "skip_reasons": skip_hist,
+        "kill_causes": kill_hist,
+    }
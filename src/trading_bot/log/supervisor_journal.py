@@ -0,0 +1,164 @@
+"""Append-only journal + snapshot for ExecutionSupervisor order state.
+
+Layout under `journal_dir`:
+  journal.jsonl  one JSON record per order state change: {"seq", "run_id", "type", "order"}
+  snapshot.json  {"seq", "run_id", "orders": {client_id: order}} written atomically
+
+Recovery loads the snapshot, then applies journal records with seq > snapshot seq;
+the last record per client_id wins, so replaying a record twice is harmless.
+
+Appends only queue the encoded line; a background flusher writes and fsyncs them in
+batches. A batch goes out once it reaches the current batch size or `max_delay` after
+its first record, and the batch size follows recent event velocity: bursts get large
+batches (few fsyncs), quiet periods flush each record within `max_delay`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+JOURNAL_FILE = "journal.jsonl"
+SNAPSHOT_FILE = "snapshot.json"
+VELOCITY_SAMPLES_CAP = 1024
+
+
+@dataclass(frozen=True)
+class BatchConfig:
+    min_size: int = 64
+    max_size: int = 8192
+    max_delay: float = 0.010  # seconds from first queued record to its fsync
+    velocity_window: float = 0.100  # seconds of flush history used to estimate event rate
+
+
+def _dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+class SupervisorJournal:
+    def __init__(self, journal_dir: str, batch: Optional[BatchConfig] = None):
+        self.dir = Path(journal_dir)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.journal_path = self.dir / JOURNAL_FILE
+        self.snapshot_path = self.dir / SNAPSHOT_FILE
+        self.batch = batch or BatchConfig()
+        self._batch_size = self.batch.min_size
+        self._velocity: Deque[Tuple[float, int]] = deque(maxlen=VELOCITY_SAMPLES_CAP)
+
+        self._pending: List[str] = []
+        self._first_pending_at = 0.0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()  # serializes file writes with snapshot truncation
+        self._fh = open(self.journal_path, "a", encoding="utf-8")
+        self._thread = threading.Thread(target=self._flush_loop, name="supervisor-journal", daemon=True)
+        self._thread.start()
+
+    def append(self, record: Dict[str, Any]) -> None:
+        line = _dumps(record) + "\n"
+        with self._cond:
+            if not self._pending:
+                self._first_pending_at = time.monotonic()
+                self._cond.notify()
+            self._pending.append(line)
+            if len(self._pending) >= self._batch_size:
+                self._cond.notify()
+
+    def sync(self) -> None:
+        """Write and fsync everything appended so far, without waiting for the flusher."""
+        self._write_pending()
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._closed or self._pending)
+                if self._closed:
+                    return  # close() writes whatever is left
+                deadline = self._first_pending_at + self.batch.max_delay
+                self._cond.wait_for(
+                    lambda: self._closed or len(self._pending) >= self._batch_size,
+                    timeout=max(0.0, deadline - time.monotonic()),
+                )
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        with self._io_lock:
+            self._write_batch(self._take_pending())
+
+    def _take_pending(self) -> List[str]:
+        with self._cond:
+            batch, self._pending = self._pending, []
+        return batch
+
+    def _write_batch(self, batch: List[str]) -> None:
+        if not batch or self._fh.closed:
+            return
+        self._fh.write("".join(batch))
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._adapt(len(batch))
+
+    def _adapt(self, flushed: int) -> None:
+        """Size the next batch to the records expected within one max_delay at the recent rate."""
+        now = time.monotonic()
+        self._velocity.append((now, flushed))
+        horizon = now - self.batch.velocity_window
+        recent = sum(n for t, n in self._velocity if t >= horizon)
+        rate = recent / self.batch.velocity_window
+        self._batch_size = min(self.batch.max_size, max(self.batch.min_size, int(rate * self.batch.max_delay)))
+
+    def load(self) -> Tuple[int, Dict[str, Dict[str, Any]]]:
+        """Return (last seq, {client_id: order dict}) from snapshot + journal tail."""
+        seq = 0
+        orders: Dict[str, Dict[str, Any]] = {}
+        if self.snapshot_path.exists():
+            snap = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+            seq = int(snap.get("seq", 0))
+            orders = dict(snap.get("orders") or {})
+        snap_seq = seq
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    break  # torn final write from a crash; everything before it is intact
+                rseq = int(rec.get("seq", 0))
+                if rseq <= snap_seq:
+                    continue
+                order = rec.get("order")
+                if order is not None:
+                    orders[order["client_id"]] = order
+                seq = max(seq, rseq)
+        return seq, orders
+
+    def snapshot(self, seq: int, run_id: str, orders: Dict[str, Dict[str, Any]]) -> None:
+        """Persist full order state at `seq`, then truncate the journal prefix it covers."""
+        with self._io_lock:
+            tmp = self.snapshot_path.with_suffix(".json.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(_dumps({"seq": seq, "run_id": run_id, "orders": orders}))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.snapshot_path)
+            # A crash before this truncate is fine: load() skips records with seq <= snapshot seq.
+            # Still-queued records go to the fresh journal, for the same reason.
+            self._fh.close()
+            self._fh = open(self.journal_path, "w", encoding="utf-8")
+            self._write_batch(self._take_pending())
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self._write_pending()
+        with self._io_lock:
+            self._fh.close()
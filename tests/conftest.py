@@ -1,7 +1,15 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_config_hash_cache(tmp_path, monkeypatch):
+    """Keep the on-disk config-hash cache out of the user's home during tests."""
+    monkeypatch.setenv("TRADING_BOT_CACHE_DIR", str(tmp_path / "cache"))
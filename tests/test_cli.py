@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from trading_bot import cli
+from trading_bot.core.types import Event
+from trading_bot.log.event_store import EventStore
+from trading_bot.log.exporters import summarize_reconciliation
+
+SCHEMA = Path(__file__).resolve().parents[1] / "src" / "trading_bot" / "log" / "schema.sql"
+
+
+def _run(*argv: str) -> None:
+    cli.main(list(argv))
+
+
+def test_seed_demo_bars_is_idempotent(tmp_path: Path, capsys):
+    db = tmp_path / "events.db"
+    EventStore(str(db)).init_schema(str(SCHEMA))
+
+    _run("seed-demo-bars", "--db", str(db), "--stream", "S", "--count", "5")
+    _run("seed-demo-bars", "--db", str(db), "--stream", "S", "--count", "7")
+    out = capsys.readouterr().out
+    assert "Seeded 5 BAR_1M events" in out
+    assert "Seeded 2 BAR_1M events" in out
+
+    events = EventStore(str(db)).read_stream("S")
+    assert len(events) == 7
+    assert events[0].ts == "2025-12-18T09:31:00-05:00"
+    assert events[1].ts == "2025-12-18T09:32:00-05:00"
+    assert events[0].payload == {"o": 4995.0, "h": 4998.0, "l": 4991.5, "c": 4994.0, "v": 1000}
+
+
+def test_seed_demo_bars_warns_and_defaults_on_bad_start_iso(tmp_path: Path, capsys):
+    db = tmp_path / "events.db"
+    EventStore(str(db)).init_schema(str(SCHEMA))
+
+    _run("seed-demo-bars", "--db", str(db), "--stream", "S", "--count", "1", "--start-iso", "not-a-date")
+    assert "bad --start-iso 'not-a-date'" in capsys.readouterr().err
+    assert EventStore(str(db)).read_stream("S")[0].ts == "2025-12-18T09:31:00-05:00"
+
+
+def test_minute_isoformats_matches_datetime_arithmetic_across_dst():
+    et = ZoneInfo("America/New_York")
+    starts = [
+        datetime(2025, 11, 1, 22, 0, tzinfo=et),  # fall back
+        datetime(2025, 3, 8, 23, 17, 12, 5, tzinfo=et),  # spring forward, sub-minute start
+        datetime.fromisoformat("2025-03-09T01:59:30-05:00"),  # fixed offset
+    ]
+    for start in starts:
+        for count in (0, 1, 43, 3000):
+            expected = [(start + k * timedelta(minutes=1)).isoformat() for k in range(count)]
+            assert cli._minute_isoformats(start, count) == expected
+
+
+def test_status_lists_most_recent_events_first(tmp_path: Path, capsys, monkeypatch):
+    monkeypatch.delenv("SUPABASE_URL", raising=False)
+    db = tmp_path / "events.db"
+    EventStore(str(db)).init_schema(str(SCHEMA))
+    _run("seed-demo-bars", "--db", str(db), "--stream", "S", "--count", "12")
+    capsys.readouterr()
+
+    _run("status", "--db", str(db))
+    lines = capsys.readouterr().out.splitlines()
+
+    assert "Last 10 events:" in lines
+    first = lines.index("Last 10 events:") + 1
+    assert lines[first] == "  2025-12-18T09:42:00-05:00 | BAR_1M"
+    assert lines[first + 9] == "  2025-12-18T09:33:00-05:00 | BAR_1M"
+
+
+def _seed_report_stream(db: Path) -> EventStore:
+    store = EventStore(str(db))
+    store.init_schema(str(SCHEMA))
+    ts = "2025-12-18T09:{:02d}:00-05:00"
+    events = [
+        Event.make("S", ts.format(31), "RECONCILIATION", {
+            "kill_switch": True, "kill_reason": "DESYNC",
+            "actions": [{"action": "CANCEL"}, {"action": "REPLACE"}],
+        }, "cfg"),
+        Event.make("S", ts.format(32), "RECONCILIATION", {"actions": [{"action": "CANCEL"}]}, "cfg"),
+        Event.make("S", ts.format(33), "RECONCILIATION", {"actions": None}, "cfg"),
+        Event.make("S", ts.format(34), "RECONCILIATION", {"kill_switch": False, "kill_reason": "IGNORED"}, "cfg"),
+    ]
+    for minute in range(35, 47):
+        events.append(Event.make("S", ts.format(minute), "DECISION_RECORD", {"reasons": {"reason_code": f"R{minute % 12:02d}"}}, "cfg"))
+    events.append(Event.make("S", ts.format(47), "DECISION_RECORD", {"reasons": {"reason_code": "R11"}}, "cfg"))
+    events.append(Event.make("S", ts.format(48), "DECISION_RECORD", {"reasons": None}, "cfg"))
+    events.append(Event.make("S", ts.format(49), "DECISION_RECORD", {"reasons": {"reason_code": ""}}, "cfg"))
+    events.append(Event.make("S", ts.format(50), "RECONCILIATION", {"kill_switch": 1}, "cfg"))
+    events.append(Event.make("OTHER", ts.format(51), "RECONCILIATION", {"kill_switch": True}, "cfg"))
+    store.append_many(events)
+    return store
+
+
+def test_report_summarizes_reconciliation_and_skip_reasons(tmp_path: Path, capsys):
+    db = tmp_path / "events.db"
+    _seed_report_stream(db)
+
+    _run("report", "--db", str(db), "--stream", "S")
+    lines = capsys.readouterr().out.splitlines()
+
+    assert lines[:4] == [
+        "Reconciliation summary:",
+        "  events: 5",
+        "  desync_kills: 2",
+        "  ttl_cancels: 2",
+    ]
+    skip_start = lines.index("Skip reasons (top 10):")
+    kill_start = lines.index("Kill causes:")
+    skip_lines = lines[skip_start + 1:kill_start]
+    assert len(skip_lines) == 10
+    assert skip_lines[0] == "  R11: 2"
+    assert lines[kill_start + 1:] == ["  DESYNC: 1", "  UNKNOWN: 1"]
+
+
+def test_sql_report_summary_matches_python_scan(tmp_path: Path):
+    store = _seed_report_stream(tmp_path / "events.db")
+
+    sql = store.summarize_reconciliation("S")
+    py = summarize_reconciliation(store.iter_stream("S"))
+
+    assert sql == py
+    assert sql["skip_reasons"].most_common() == py["skip_reasons"].most_common()
+    assert sql["kill_causes"].most_common() == py["kill_causes"].most_common()
+
+
+def test_known_subcommand_builds_only_its_subparser():
+    sub_action = next(a for a in cli._build_parser("status")._actions if a.dest == "cmd")
+    assert list(sub_action.choices) == ["status"]
+
+    full = next(a for a in cli._build_parser(None)._actions if a.dest == "cmd")
+    assert list(full.choices) == list(cli._COMMANDS)
+    # The top-level listing registers names and help only, not each command's options
+    assert [a.dest for a in full.choices["run-once"]._actions] == ["help"]
+    assert "Start live trading" in cli._build_parser(None).format_help()
+
+
+def test_completion_script_lists_commands_and_their_options(capsys):
+    _run("completion")
+    out = capsys.readouterr().out
+
+    assert "complete -o default -F _trading_bot trading-bot" in out
+    assert " ".join(cli._COMMANDS) in out
+    run_once = next(line for line in out.splitlines() if line.strip().startswith("run-once)"))
+    assert "--bar-json" in run_once and "--fill-mode" in run_once
+
+
+def test_live_log_file_is_flushed_periodically(tmp_path: Path, monkeypatch):
+    import logging
+    import time
+    from types import SimpleNamespace
+
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])  # let basicConfig install the queue handler
+    monkeypatch.setattr(root, "level", root.level)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    monkeypatch.setattr(cli, "LOG_FLUSH_INTERVAL_S", 0.01)
+    seen = []
+
+    def run_live(args):
+        logging.getLogger("trading_bot.core.live_runner").info("bar line")
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline and not seen:
+            if "bar line" in (tmp_path / "data" / "trading.log").read_text():
+                seen.append(True)
+            time.sleep(0.01)
+
+    monkeypatch.setattr(cli, "_run_live", run_live)
+    cli._cmd_live(SimpleNamespace(verbose=False))
+
+    assert seen  # INFO reached the file while the runner was still live
+
+
+def test_loads_accepts_stdlib_json_extensions_with_or_without_orjson(monkeypatch):
+    import math
+
+    import pytest
+
+    text = '{"open": NaN, "high": Infinity, "low": -Infinity}'
+    for available in (True, False):
+        monkeypatch.setattr(cli, "ORJSON_AVAILABLE", available and hasattr(cli, "orjson"))
+        for data in (text, text.encode()):
+            bar = cli._loads(data)
+            assert math.isnan(bar["open"]) and bar["high"] == math.inf and bar["low"] == -math.inf
+
+        with pytest.raises(ValueError):
+            cli._loads("{not json")
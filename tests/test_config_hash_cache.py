@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from trading_bot.core import config_hash_cache
+
+
+def test_get_hash_persists_until_a_source_file_changes(tmp_path: Path):
+    src = tmp_path / "a.yaml"
+    src.write_text("x: 1\n")
+    calls = []
+
+    def compute() -> str:
+        calls.append(1)
+        return f"h{len(calls)}"
+
+    fp = config_hash_cache.fingerprint([str(src)])
+    assert config_hash_cache.get_hash("ns", fp, compute) == "h1"
+    assert config_hash_cache.get_hash("ns", fp, compute) == "h1"
+    assert config_hash_cache.get_hash("other", fp, compute) == "h2"
+    assert config_hash_cache.cache_path().exists()
+
+    st = os.stat(src)
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    fp2 = config_hash_cache.fingerprint([str(src)])
+    assert fp2 != fp
+    assert config_hash_cache.get_hash("ns", fp2, compute) == "h3"
+    assert config_hash_cache.fingerprint([str(tmp_path / "missing.yaml")]) == (None,)
+
+
+def test_get_hash_computes_when_cache_dir_is_unusable(tmp_path: Path, monkeypatch):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setenv("TRADING_BOT_CACHE_DIR", str(blocker / "cache"))
+
+    assert config_hash_cache.get_hash("ns", (), lambda: "fresh") == "fresh"
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from pathlib import Path
-from trading_bot.core.config import load_contracts
+import os
+
+from trading_bot.core.config import load_contracts, load_yaml_contract
 
 
 def test_all_contracts_load_and_normalize():
@@ -31,3 +33,67 @@ def test_all_contracts_load_and_normalize():
     # Check config hash is computed
     assert contracts.config_hash is not None
     assert len(contracts.config_hash) > 0
+
+
+def test_load_yaml_contract_cache_returns_copies_and_tracks_mtime(tmp_path: Path):
+    contract = tmp_path / "risk_model.yaml"
+    contract.write_text("limits:\n  max_contracts: 1\n", encoding="utf-8")
+
+    first = load_yaml_contract(str(tmp_path), "risk_model.yaml")
+    first["limits"]["max_contracts"] = 99
+    second = load_yaml_contract(str(tmp_path), "risk_model.yaml")
+    assert second["limits"]["max_contracts"] == 1
+
+    contract.write_text("limits:\n  max_contracts: 2\n", encoding="utf-8")
+    st = contract.stat()
+    os.utime(contract, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_yaml_contract(str(tmp_path), "risk_model.yaml")["limits"]["max_contracts"] == 2
+
+
+def test_load_contracts_cache_returns_copies_and_tracks_mtime(tmp_path: Path):
+    import shutil
+
+    contracts_dir = tmp_path / "contracts"
+    shutil.copytree("src/trading_bot/contracts", contracts_dir)
+
+    first = load_contracts(str(contracts_dir))
+    first.docs["risk_model.yaml"]["mutated"] = True
+    second = load_contracts(str(contracts_dir))
+    assert "mutated" not in second.docs["risk_model.yaml"]
+    assert second.config_hash == first.config_hash
+
+    risk = contracts_dir / "risk_model.yaml"
+    risk.write_text(risk.read_text(encoding="utf-8") + "\n# edited\nextra_key: 1\n", encoding="utf-8")
+    st = risk.stat()
+    os.utime(risk, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_contracts(str(contracts_dir)).config_hash != first.config_hash
+
+
+def test_compute_config_hash_is_stable_and_tracks_seed_contracts(tmp_path: Path):
+    import shutil
+
+    from trading_bot.core.config import compute_config_hash
+
+    assert compute_config_hash("src/trading_bot/contracts") == (
+        "a6e83b294161f0900bc22584eda048bb88bcbbb5f44aab2e956a2e6e286dc929"
+    )
+    contracts_dir = tmp_path / "contracts"
+    shutil.copytree("src/trading_bot/contracts", contracts_dir)
+    before = compute_config_hash(str(contracts_dir))
+
+    session = contracts_dir / "session.yaml"
+    session.write_text(session.read_text(encoding="utf-8") + "\nextra_key: 1\n", encoding="utf-8")
+    st = session.stat()
+    os.utime(session, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert compute_config_hash(str(contracts_dir)) != before
+
+
+def test_normalizers_reject_non_string_and_duplicate_ids():
+    import pytest
+
+    from trading_bot.core.config import normalize_risk_model, normalize_strategy_templates
+
+    with pytest.raises(ValueError, match=r"strategy_templates\[0\] missing non-empty 'id'"):
+        normalize_strategy_templates({"strategy_templates": [{"id": 7}]})
+    with pytest.raises(ValueError, match="duplicate kill_switch trigger id: DD"):
+        normalize_risk_model({"kill_switch": {"triggers": [{"id": "DD"}, {"id": " DD "}]}})
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from trading_bot.engines.dvs_eqs import compute_eqs
+from trading_bot.engines.dvs_eqs import compile_dvs_rules, compile_eqs_rules, compute_dvs, compute_eqs
 
 
 def test_eqs_degrades_on_slippage_ratio_rule():
@@ -48,3 +48,38 @@ def test_eqs_slippage_ratio_handles_zero_expected_slippage():
     }
     eqs = compute_eqs(state, contract)
     assert abs(eqs - 0.9) < 1e-9
+
+
+def test_compiled_and_dict_contracts_match_baseline_scores():
+    contract = {
+        "eqs": {
+            "initial_value": 1.0,
+            "degradation_events": [
+                {"id": "reject", "condition": {"order_rejected_eq": True}, "immediate_penalty": 0.3},
+                {"id": "slow", "condition": {"fill_time_minus_order_time_seconds_gte": 2}, "penalties": {"eqs_delta": -0.2}},
+                {"id": "unknown_op", "condition": {"order_rejected_is": True}, "immediate_penalty": 1.0},
+                {"id": "no_condition", "immediate_penalty": 1.0},
+            ],
+            "recovery": {"eqs_recovery_per_bar": 0.05},
+        }
+    }
+    rules = compile_eqs_rules(contract)
+    assert [delta for _, delta in rules.rules] == [-0.3, -0.2]  # fail-closed rules dropped
+
+    # Expected scores recorded from the pre-compilation dvs_eqs implementation
+    for state, expected in (
+        ({}, 1.0),
+        ({"order_rejected": True}, 0.75),
+        ({"order_rejected": True, "fill_time_minus_order_time_seconds": 3}, 0.55),
+        ({"eqs": 0.1, "fill_time_minus_order_time_seconds": 1}, 0.15),
+    ):
+        assert abs(compute_eqs(state, rules) - expected) < 1e-9
+        assert abs(compute_eqs(state, contract) - expected) < 1e-9
+
+    dvs_contract = {"dvs": {"initial_value": 0.9, "degradation_events": [
+        {"id": "lag", "condition": {"bar_lag_seconds_gt": 5}, "penalties": {"dvs_delta": -0.5}},
+    ]}}
+    dvs_rules = compile_dvs_rules(dvs_contract)
+    for state, expected in (({"bar_lag_seconds": 6}, 0.4), ({"bar_lag_seconds": 5}, 0.9)):
+        assert abs(compute_dvs(state, dvs_rules) - expected) < 1e-9
+        assert abs(compute_dvs(state, dvs_contract) - expected) < 1e-9
@@ -22,3 +22,43 @@ def test_event_store_idempotent_insert(tmp_path: Path):
 
     events = store.read_stream("STREAM")
     assert len(events) == 1
+
+
+def test_iter_stream_matches_read_stream_across_chunks(tmp_path: Path):
+    db = tmp_path / "events.db"
+    schema = Path(__file__).resolve().parents[1] / "src" / "trading_bot" / "log" / "schema.sql"
+    store = EventStore(str(db))
+    store.init_schema(str(schema))
+
+    events = [
+        Event.make("STREAM", f"2025-12-18T09:{31 + i:02d}:00-05:00", "BAR_1M", {"c": 100.0 + i}, "cfg")
+        for i in range(5)
+    ]
+    assert store.append_many(reversed(events)) == 5
+
+    streamed = list(store.iter_stream("STREAM", chunk=2))
+    assert [e.event_id for e in streamed] == [e.event_id for e in events]
+    assert streamed == store.read_stream("STREAM")
+
+
+def test_append_many_commits_once_and_skips_duplicates(tmp_path: Path, monkeypatch):
+    db = tmp_path / "events.db"
+    schema = Path(__file__).resolve().parents[1] / "src" / "trading_bot" / "log" / "schema.sql"
+    store = EventStore(str(db))
+    store.init_schema(str(schema))
+    store.append(Event.make("S", "2025-12-18T09:31:00-05:00", "BAR_1M", {"i": 0}, "cfg"))
+
+    statements = []
+    connect = store.connect
+
+    def traced_connect():
+        con = connect()
+        con.set_trace_callback(statements.append)
+        return con
+
+    monkeypatch.setattr(store, "connect", traced_connect)
+    events = (Event.make("S", f"2025-12-18T09:{31 + i:02d}:00-05:00", "BAR_1M", {"i": i}, "cfg") for i in range(50))
+
+    assert store.append_many(events) == 49
+    assert [s for s in statements if s.split()[0].upper() in ("BEGIN", "COMMIT")] == ["BEGIN IMMEDIATE", "COMMIT"]
+    assert len(store.read_stream("S")) == 50
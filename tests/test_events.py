@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import pytest
+
+from trading_bot.core.events import MarketBarClosed, MarketSessionState, OrderIntentCreated, to_dict
+
+
+def _bar(**overrides):
+    fields = dict(
+        timestamp="2025-12-18T09:31:00-05:00", symbol="MES", timeframe="1m",
+        open=5000.0, high=5003.0, low=4996.5, close=5001.0, volume=1000, dvs=0.9,
+    )
+    fields.update(overrides)
+    return MarketBarClosed(**fields)
+
+
+def test_market_bar_validates_dvs_and_serializes():
+    bar = _bar()
+    assert to_dict(bar)["dvs_penalties"] == []
+    assert not hasattr(bar, "__dict__")
+    with pytest.raises(ValueError):
+        _bar(dvs=1.5)
+
+
+def test_session_state_and_optional_fields():
+    with pytest.raises(ValueError):
+        MarketSessionState(state="HALTED", timestamp="t")
+    intent = OrderIntentCreated(
+        intent_id="i1", direction="LONG", quantity=1, entry_type="MARKET",
+        stop_loss=4990.0, take_profit=5010.0, template_id="K1", reason_vector={},
+    )
+    assert intent.limit_price is None
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from trading_bot.core.execution_supervisor import ExecutionSupervisor, ParentState, _order_to_dict
+
+
+class _Adapter:
+    def place_order(self, intent_obj, last_price=None):
+        return {"status": "ACCEPTED", "order_id": "B1"}
+
+
+def _submitted(intent_id: str = "I1") -> ExecutionSupervisor:
+    sup = ExecutionSupervisor()
+    sup.submit_intent({"intent_id": intent_id, "contracts": 2, "limit_price": 5000.0}, _Adapter())
+    return sup
+
+
+def test_broker_events_drive_parent_state():
+    sup = _submitted()
+    parent = sup._orders["I1"]
+    assert parent.state is ParentState.ACKED
+
+    sup.on_broker_event({"type": "PARTIAL_FILL", "client_id": "I1", "filled": 1, "avg_fill_price": 5000.25})
+    assert (parent.state, parent.filled_qty, parent.avg_fill_price) == (ParentState.PARTIAL, 1, 5000.25)
+
+    sup.on_broker_event({"type": "FILL", "order_id": "I1", "filled": 2})
+    assert abs(parent.updated_at - datetime.utcnow()) < timedelta(seconds=5)
+    assert (parent.state, parent.filled_qty, parent.avg_fill_price) == (ParentState.FILLED, 2, 5000.25)
+
+    sup.on_broker_event({"type": "UNKNOWN", "client_id": "I1"})
+    sup.on_broker_event({"type": "FILL", "client_id": "nope", "filled": 9})
+    assert parent.state is ParentState.FILLED
+    assert [e.type for e in sup.pop_events()] == ["ORDER_SUBMIT", "ORDER_ACK", "PARTIAL_FILL", "FILL", "UNKNOWN"]
+
+
+def test_event_buffer_is_bounded_and_drained_by_pop():
+    sup = ExecutionSupervisor(max_events=3)
+    for _ in range(5):
+        sup.flatten_all(_Adapter())  # no flatten_positions -> FLATTEN_ALL + FLATTEN_ERROR
+    events = sup.pop_events()
+    assert [e.type for e in events] == ["FLATTEN_ERROR", "FLATTEN_ALL", "FLATTEN_ERROR"]
+    assert sup.pop_events() == []
+
+
+def test_journal_restores_orders_after_restart_and_snapshot(tmp_path):
+    journal_dir = str(tmp_path / "journal")
+    sup = ExecutionSupervisor(journal_dir=journal_dir, run_id="r1")
+    sup.submit_intent({"intent_id": "I1", "contracts": 2, "metadata": {"template_id": "K1"}}, _Adapter())
+    sup.on_broker_event({"type": "PARTIAL_FILL", "client_id": "I1", "filled": 1, "avg_fill_price": 5000.25})
+    sup.snapshot()
+    sup.submit_intent({"intent_id": "I2"}, _Adapter())
+    sup.on_broker_event({"type": "FILL", "client_id": "I1", "filled": 2})
+    sup.close()
+
+    restored = ExecutionSupervisor(journal_dir=journal_dir, run_id="r2")
+    # Compared in persisted form: updated_at round-trips at microsecond resolution
+    assert {k: _order_to_dict(p) for k, p in restored._orders.items()} == {
+        k: _order_to_dict(p) for k, p in sup._orders.items()
+    }
+    assert restored._orders["I1"].state is ParentState.FILLED
+    assert restored._orders["I1"].metadata == {"template_id": "K1"}
+    # Sequence numbers continue after recovery instead of restarting at 1
+    restored.submit_intent({"intent_id": "I1"}, _Adapter())
+    restored.on_broker_event({"type": "CANCEL_ACK", "client_id": "I2"})
+    assert restored.pop_events()[0].seq == sup._seq + 1
+    restored.close()
+
+
+def test_redelivered_broker_events_are_applied_once():
+    sup = _submitted()
+    parent = sup._orders["I1"]
+    sup.pop_events()
+
+    sup.on_broker_event({"type": "PARTIAL_FILL", "client_id": "I1", "filled": 1, "event_id": "e1"})
+    sup.on_broker_event({"type": "CANCEL_REJECT", "client_id": "I1", "seq": 7})
+    sup.on_broker_event({"type": "CANCEL_REJECT", "client_id": "I1", "seq": 7})
+    sup.on_broker_event({"type": "PARTIAL_FILL", "client_id": "I1", "filled": 1, "event_id": "e1"})
+
+    assert (parent.state, parent.filled_qty) == (ParentState.ERROR, 1)
+    assert [e.type for e in sup.pop_events()] == ["PARTIAL_FILL", "CANCEL_REJECT"]
+
+
+def test_fill_after_cancel_reject_is_applied():
+    sup = _submitted()
+    parent = sup._orders["I1"]
+    sup.pop_events()
+
+    sup.on_broker_event({"type": "PARTIAL_FILL", "client_id": "I1", "filled": 1, "avg_fill_price": 5000.25})
+    sup.on_broker_event({"type": "CANCEL_REJECT", "client_id": "I1"})
+    assert parent.state is ParentState.ERROR
+    sup.on_broker_event({"type": "FILL", "client_id": "I1", "filled": 2, "avg_fill_price": 5000.5})
+
+    assert (parent.state, parent.filled_qty, parent.avg_fill_price) == (ParentState.FILLED, 2, 5000.5)
+    assert [e.type for e in sup.pop_events()] == ["PARTIAL_FILL", "CANCEL_REJECT", "FILL"]
+
+
+def test_fill_after_cancel_ack_or_reject_moves_order_to_filled():
+    for terminal in ("CANCEL_ACK", "ORDER_REJECTED"):
+        sup = _submitted()
+        parent = sup._orders["I1"]
+        sup.on_broker_event({"type": terminal, "client_id": "I1"})
+        sup.on_broker_event({"type": "FILL", "client_id": "I1", "filled": 2})
+        assert (parent.state, parent.filled_qty) == (ParentState.FILLED, 2)
+        assert "ILLEGAL_TRANSITION" not in [e.type for e in sup.pop_events()]
+
+
+def test_journal_flushes_small_batches_after_max_delay(tmp_path):
+    import json
+    import time
+
+    from trading_bot.log.supervisor_journal import BatchConfig, SupervisorJournal
+
+    journal = SupervisorJournal(str(tmp_path), BatchConfig(min_size=1000, max_delay=0.01))
+    journal.append({"seq": 1, "order": {"client_id": "A"}})
+    deadline = time.monotonic() + 2.0
+    while not journal.journal_path.read_text() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert json.loads(journal.journal_path.read_text()) == {"seq": 1, "order": {"client_id": "A"}}
+
+    for seq in range(2, 2002):
+        journal.append({"seq": seq, "order": {"client_id": f"O{seq % 7}"}})
+    journal.close()
+    reopened = SupervisorJournal(str(tmp_path))
+    seq, orders = reopened.load()
+    reopened.close()
+    assert seq == 2001 and len(orders) == 8
+
+
+def test_illegal_transitions_are_flagged_and_leave_state_unchanged():
+    sup = _submitted()
+    parent = sup._orders["I1"]
+    sup.on_broker_event({"type": "FILL", "client_id": "I1", "filled": 2})
+    sup.pop_events()
+
+    sup.on_broker_event({"type": "CANCEL_REJECT", "client_id": "I1"})  # cancel lost the race with the fill
+    sup.on_broker_event({"type": "PARTIAL_FILL", "client_id": "I1", "filled": 1})
+
+    assert (parent.state, parent.filled_qty) == (ParentState.FILLED, 2)
+    events = sup.pop_events()
+    assert [e.type for e in events] == ["CANCEL_REJECT", "ILLEGAL_TRANSITION", "PARTIAL_FILL", "ILLEGAL_TRANSITION"]
+    assert events[1].data == {"client_id": "I1", "state": "FILLED", "event": "CANCEL_REJECT"}
+
+
+def test_posted_commands_are_applied_in_order_by_one_worker():
+    import pytest
+
+    sup = ExecutionSupervisor()
+    sup.start()
+    intent_ids = [sup.post("submit_intent", {"intent_id": f"I{i}"}, _Adapter()) for i in range(50)]
+    fills = [sup.post("on_broker_event", {"type": "FILL", "client_id": f"I{i}", "filled": 1}) for i in range(50)]
+    with pytest.raises(ValueError):
+        sup.post("pop_events")
+    sup.close()
+
+    assert [f.result() for f in intent_ids] == [f"I{i}" for i in range(50)]
+    assert all(f.done() for f in fills)
+    assert all(p.state is ParentState.FILLED for p in sup._orders.values())
+    assert [e.seq for e in sup.pop_events()] == list(range(1, 151))
+
+
+def test_pop_events_while_worker_emits_loses_nothing():
+    sup = ExecutionSupervisor()
+    sup.start()
+    futures = [sup.post("submit_intent", {"intent_id": f"I{i}"}, _Adapter()) for i in range(2000)]
+    popped = []
+    while not futures[-1].done():
+        popped.extend(sup.pop_events())
+    sup.close()
+    popped.extend(sup.pop_events())
+
+    assert [e.seq for e in popped] == list(range(1, 4001))
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+from datetime import datetime
+from decimal import Decimal
+
+from trading_bot.core.learning_loop import LearningLoop, StrategyState, TradeOutcome
+
+
+def _outcome(i: int, pnl: str, template_id: str = "K1", regime: str = "trending", tod: str = "open", **kw) -> TradeOutcome:
+    fields = dict(
+        trade_id=f"t{i}",
+        template_id=template_id,
+        regime=regime,
+        time_of_day=tod,
+        entry_price=Decimal("5950.00"),
+        exit_price=Decimal("5950.00") + Decimal(pnl) / 5,
+        qty=1,
+        entry_time=datetime(2025, 12, 18, 9, 31),
+        exit_time=datetime(2025, 12, 18, 9, 36),
+        pnl_usd=Decimal(pnl),
+        pnl_pct=Decimal("0.01"),
+        duration_seconds=300,
+        reason_exit="TARGET" if Decimal(pnl) > 0 else "STOP",
+        beliefs_at_entry={},
+        signals_at_entry={},
+        setup_scores={},
+        euc_score=0.75,
+        data_quality=1.0,
+        execution_quality=0.85,
+        slippage_ticks=0.5,
+        spread_ticks=0.25,
+        win=Decimal(pnl) > 0,
+    )
+    fields.update(kw)
+    return TradeOutcome(**fields)
+
+
+def test_strategy_keys_are_shared_between_record_and_lookup():
+    loop = LearningLoop()
+    assert loop.get_strategy_state("K1", "trending", "open") == (StrategyState.ACTIVE, 0)
+
+    loop.record_trade(_outcome(1, "-50"))
+    result = loop.record_trade(_outcome(2, "-50"))
+
+    assert result["strategy_key"] == "K1_trending_open"
+    assert result["strategy_key"] is loop._strategy_key("K1", "trending", "open")
+    assert loop.get_strategy_state("K1", "trending", "open") == (StrategyState.QUARANTINED, 0)
+    assert loop.get_euc_cost_modifier("K1", "trending", "open") == 10.0
+
+
+def test_weighted_pnl_matches_decimal_arithmetic():
+    loop = LearningLoop()
+    trades = [("12.50", 0.9), ("-7.25", 0.4), ("3.75", 1.0), ("-0.01", 0.35)]
+    expected = Decimal("0")
+    for i, (pnl, dq) in enumerate(trades):
+        loop.record_trade(_outcome(i, pnl, data_quality=dq))
+        expected += Decimal(pnl) * Decimal(str(dq))
+
+    m = loop.metrics["K1_trending_open"]
+    assert m.total_pnl == expected
+    assert m.expectancy == m.avg_pnl == expected / 4
+
+
+def test_pnl_std_and_sharpe_track_sample_statistics():
+    import statistics
+
+    loop = LearningLoop()
+    pnls = ["12.50", "-7.25", "3.75", "-0.01", "20.00"]
+    loop.record_trade(_outcome(0, pnls[0]))
+    m = loop.metrics["K1_trending_open"]
+    assert (m.pnl_std, m.sharpe_ratio) == (Decimal("0.0"), 0.0)
+
+    for i, pnl in enumerate(pnls[1:], start=1):
+        loop.record_trade(_outcome(i, pnl))
+    xs = [float(p) for p in pnls]
+    std = statistics.stdev(xs)
+    assert abs(float(m.pnl_std) - std) < 1e-9
+    assert abs(m.sharpe_ratio - statistics.fmean(xs) / std) < 1e-9
+
+
+def test_trade_history_keeps_only_the_lookback_window():
+    loop = LearningLoop()
+    loop.load_from_dict({"config": {"lookback_window": 3}})
+    for i, pnl in enumerate(["10", "-5", "20", "-4", "8"]):
+        loop.record_trade(_outcome(i, pnl, regime="range" if i == 4 else "trending"))
+
+    assert [o.trade_id for o in loop.trade_history] == ["t2", "t3", "t4"]
+    assert loop.get_window_stats() == {"trades": 3, "win_rate": 2 / 3, "expectancy": Decimal("8")}
+    assert loop.get_window_stats("K1_trending_open") == {"trades": 2, "win_rate": 0.5, "expectancy": Decimal("8")}
+    assert loop.metrics["K1_trending_open"].trades_count == 4
+
+
+def test_max_drawdown_is_largest_peak_to_trough_of_weighted_equity():
+    from itertools import accumulate
+
+    loop = LearningLoop()
+    pnls = ["-5", "10", "-3", "-8", "4", "15", "-12", "2"]
+    for i, pnl in enumerate(pnls):
+        loop.record_trade(_outcome(i, pnl, data_quality=0.5))
+
+    equity = [Decimal("0")] + list(accumulate(Decimal(p) * Decimal("0.5") for p in pnls))
+    expected = max(peak - eq for peak, eq in zip(accumulate(equity, max), equity))
+    assert loop.metrics["K1_trending_open"].max_drawdown == expected == Decimal("6.0")
+
+
+def test_export_json_round_trips_metrics_and_audit_trail():
+    loop = LearningLoop()
+    loop.lookback_window = 7
+    for i in range(2):
+        loop.record_trade(_outcome(i, "-5"))
+
+    restored = LearningLoop()
+    restored.load_json(loop.export_json())
+
+    m = restored.metrics["K1_trending_open"]
+    assert (m.trades_count, m.wins, m.losses) == (2, 0, 2)
+    assert restored.state_changes == loop.state_changes
+    assert restored.state_changes[0]["action"] == "QUARANTINE"
+    assert restored.trade_history.maxlen == 7
+
+
+def test_record_trades_matches_one_at_a_time_recording():
+    pnls = ["-5", "-6", "10", "12", "-1", "3", "4", "-2", "-2", "9"]
+    outcomes = [_outcome(i, p, regime="range" if i % 3 == 0 else "trending") for i, p in enumerate(pnls)]
+
+    one = LearningLoop()
+    for o in outcomes:
+        one.record_trade(o)
+    batch = LearningLoop()
+    results = batch.record_trades(iter(outcomes))
+
+    assert [r["strategy_key"] for r in results] == ["K1_range_open", "K1_trending_open"]
+    assert results[0]["trade_ids"] == ["t0", "t3", "t6", "t9"]
+
+    def snapshot(loop):
+        return {k: {**asdict(m), "updated_ns": None} for k, m in loop.metrics.items()}
+
+    def changes(loop, key):
+        return [(c["action"], c["reason"]) for c in loop.state_changes if c["strategy_key"] == key]
+
+    assert snapshot(batch) == snapshot(one)
+    for key in one.metrics:
+        assert changes(batch, key) == changes(one, key)
+    assert [a for a, _ in changes(one, "K1_trending_open")][:2] == ["QUARANTINE", "RE_ENABLE"]
+    assert list(batch.trade_history) == list(one.trade_history)
+
+
+def test_concurrent_ingestion_counts_every_trade():
+    import threading
+
+    loop = LearningLoop(lock_shards=4)
+    regimes = ["trending", "range", "volatile"]
+
+    def ingest(worker: int) -> None:
+        for i in range(200):
+            o = _outcome(worker * 1000 + i, "5" if i % 2 else "-4", regime=regimes[i % 3])
+            if i % 10 == 0:
+                loop.record_trades([o])
+            else:
+                loop.record_trade(o)
+
+    threads = [threading.Thread(target=ingest, args=(w,)) for w in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sum(m.trades_count for m in loop.metrics.values()) == 800
+    assert sum(m.wins for m in loop.metrics.values()) == 400
+
+
+def test_data_quality_is_normalized_at_construction():
+    import pytest
+
+    assert _outcome(1, "5", data_quality=None).data_quality == 1.0
+    assert _outcome(2, "5", data_quality=Decimal("0.4")).data_quality == 0.4
+    with pytest.raises(ValueError):
+        _outcome(3, "5", data_quality="live")
+
+
+def test_record_trade_returns_a_json_ready_metrics_snapshot():
+    import json
+
+    loop = LearningLoop()
+    result = loop.record_trade(_outcome(1, "12.5"))
+    metrics = result["metrics"]
+
+    assert metrics["win_rate"] == "100.0%"
+    assert metrics == loop.export_to_dict()["metrics"]["K1_trending_open"]
+    assert list(metrics)[:2] == ["strategy_key", "template_id"]
+    json.dumps(result)
+    loop.record_trade(_outcome(2, "-2.5"))
+    assert metrics["trades_count"] == 1
+
+
+def test_pnl_std_after_reload_uses_only_trades_seen_since():
+    import statistics
+
+    loop = LearningLoop()
+    for i, pnl in enumerate(["10", "10", "10", "10"]):
+        loop.record_trade(_outcome(i, pnl))
+    restored = LearningLoop()
+    restored.load_json(loop.export_json())
+
+    restored.record_trade(_outcome(4, "5"))
+    m = restored.metrics["K1_trending_open"]
+    assert m.trades_count == 5
+    assert (m.pnl_std, m.sharpe_ratio) == (Decimal("0.0"), 0.0)
+
+    restored.record_trade(_outcome(5, "-3"))
+    std = statistics.stdev([5.0, -3.0])
+    assert abs(float(m.pnl_std) - std) < 1e-9
+    assert abs(m.sharpe_ratio - 1.0 / std) < 1e-9
+
+
+def test_pnl_std_and_sharpe_use_the_weighted_pnl_of_expectancy():
+    import statistics
+
+    loop = LearningLoop()
+    loop.record_trade(_outcome(0, "10", data_quality=0.5))
+    loop.record_trade(_outcome(1, "-4"))
+    loop.record_trade(_outcome(2, "6", data_quality=0.5))
+    m = loop.metrics["K1_trending_open"]
+
+    weighted = [5.0, -4.0, 3.0]
+    std = statistics.stdev(weighted)
+    assert m.expectancy == Decimal(4) / Decimal(3)
+    assert abs(float(m.pnl_std) - std) < 1e-9
+    assert abs(m.sharpe_ratio - statistics.mean(weighted) / std) < 1e-9
+    assert abs(m.sharpe_ratio - float(m.expectancy) / std) < 1e-9
@@ -0,0 +1,415 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+
+from trading_bot.adapters.tradovate_live import TradovateConfig
+from trading_bot.core.live_runner import HealthCheck, LiveRunner, RunnerState
+
+
+class _Adapter:
+    _ws_connected = True
+
+    def __init__(self):
+        self.reconciles = 0
+        self.checks = 0
+        self.checked = threading.Event()
+        self.reconciled_twice = threading.Event()
+
+    def get_position_snapshot(self):
+        self.checks += 1
+        self.checked.set()
+        return {"position": 0}
+
+    def reconcile_position(self):
+        self.reconciles += 1
+        if self.reconciles >= 2:
+            self.reconciled_twice.set()
+        return {"match": True}
+
+
+def _runner() -> LiveRunner:
+    runner = LiveRunner(tradovate_config=TradovateConfig(username="u", password="p"))
+    runner._adapter = _Adapter()
+    runner._running = True
+    runner._config_hash = "cfg"
+    return runner
+
+
+def test_run_loop_dispatches_due_tasks_and_wakes_on_shutdown():
+    runner = _runner()
+    runner.HEALTH_INTERVAL_S = 60.0
+    runner.RECONCILE_INTERVAL_S = 0.01
+    runner.RECONCILE_IDLE_INTERVAL_S = 0.0
+    adapter = runner._adapter
+
+    t = threading.Thread(target=runner.run)
+    t.start()
+    assert adapter.reconciled_twice.wait(timeout=2)
+    started = time.monotonic()
+    runner._shutdown_event.set()
+    t.join(timeout=2)
+
+    assert not t.is_alive()
+    assert time.monotonic() - started < 1.0
+    assert adapter.checks == 1  # health not yet due again
+    assert adapter.reconciles > 1
+    assert runner._state is RunnerState.STOPPED
+
+
+def test_health_check_uses_supplied_clock():
+    alerts = []
+    health = HealthCheck(max_position_age_minutes=30, alert_callback=lambda lvl, msg: alerts.append(lvl))
+    t0 = 1000.0
+    health.record_bar(t0)
+    health.record_trade(t0)
+
+    assert health.check(position=1, now=t0 + 60)["status"] == "healthy"
+    result = health.check(position=1, now=t0 + 31 * 60)
+    assert result["status"] == "critical"
+    assert [i.split(":")[0] for i in result["issues"]] == ["DATA_GAP", "STUCK_POSITION"]
+    assert alerts == ["critical", "critical"]
+
+
+def test_init_engines_precomputes_dvs_and_eqs_per_connection_state():
+    from trading_bot.engines.dvs_eqs import compute_eqs
+
+    runner = _runner()
+    runner._init_engines()
+
+    assert runner._dvs_val == 1.0
+    assert runner._eqs_by_connection[True] == compute_eqs({"connection_state": "OK"}, runner._execution_contract)
+    assert runner._eqs_by_connection[False] == compute_eqs(
+        {"connection_state": "DEGRADED"}, runner._execution_contract
+    )
+    assert len(runner._config_hash) == 64
+
+
+class _Feed:
+    def is_connected(self):
+        return True
+
+    def get_spread(self):
+        return 1
+
+
+def _processing_runner(tmp_path) -> LiveRunner:
+    from pathlib import Path
+
+    from trading_bot.log.event_store import EventStore
+
+    runner = _runner()
+    runner._adapter = None
+    runner._init_engines()
+    runner._data_feed = _Feed()
+    runner._event_store = EventStore(str(tmp_path / "events.sqlite"))
+    runner._event_store.init_schema(str(Path("src/trading_bot/log/schema.sql")))
+    return runner
+
+
+def _bar(minute: int, close: str):
+    from decimal import Decimal
+
+    from trading_bot.adapters.data_feed import Bar
+    from trading_bot.engines.signals_v2 import ET
+
+    c = Decimal(close)
+    return Bar(datetime(2025, 1, 2, 10, minute, tzinfo=ET), c, c + 1, c - 1, c, 100)
+
+
+def test_process_bar_reuses_signals_dict_but_snapshots_payload(tmp_path):
+    runner = _processing_runner(tmp_path)
+    first = runner._process_bar(_bar(0, "5000.00"))
+    snapshot = dict(first["signals"])
+    second = runner._process_bar(_bar(1, "5010.00"))
+
+    assert first["signals"] == snapshot
+    assert first["signals"] is not second["signals"]
+    assert second["signals"] == runner._signals_dict
+    assert len(snapshot) == 30
+
+
+def test_execute_order_passes_intent_attributes_and_bracket_to_adapter(tmp_path):
+    from types import SimpleNamespace
+
+    runner = _processing_runner(tmp_path)
+    placed = []
+
+    class _OrderAdapter:
+        def place_order(self, intent_obj, last_price):
+            placed.append(intent_obj)
+            assert last_price == 5000.0 and isinstance(last_price, float)
+            return {"status": "REJECTED"}
+
+    runner._adapter = _OrderAdapter()
+    decision = SimpleNamespace(
+        order_intent={"direction": "SHORT", "contracts": 2, "stop_ticks": 8, "target_ticks": 12},
+        metadata={},
+    )
+    event = runner._execute_order(
+        decision, _bar(0, "5000.00"), datetime(2025, 1, 2, 15, tzinfo=timezone.utc), {}, {}
+    )
+    assert (event.type, event.payload, event.ts) == ("ORDER_EVENT", {"status": "REJECTED"}, "2025-01-02T15:00:00+00:00")
+
+    (intent,) = placed
+    assert (intent.direction, intent.contracts, intent.entry_type, intent.symbol) == ("SHORT", 2, "LIMIT", "MESZ4")
+    assert intent.metadata == {
+        "limit_price": 5000.0,
+        "instrument": "MESZ4",
+        "bracket": {"stop_price": 5002.0, "target_price": 4997.0},
+    }
+
+
+def test_events_are_batched_through_the_flusher(tmp_path):
+    runner = _processing_runner(tmp_path)
+    runner.EVENT_FLUSH_INTERVAL_S = 60.0
+    runner._start_flusher()
+    try:
+        runner._process_bar(_bar(0, "5000.00"))
+        runner._process_bar(_bar(1, "5001.00"))
+        assert runner._event_store.read_stream(runner.stream_id) == []
+    finally:
+        runner._stop_flusher()
+
+    events = runner._event_store.read_stream(runner.stream_id)
+    assert [e.type for e in events] == ["BELIEFS_1M", "DECISION_1M"] * 2
+    assert runner._flusher is None and not runner._event_queue
+
+
+def test_on_bar_hands_bars_to_worker_and_drops_when_full():
+    runner = _runner()
+    handled = []
+    picked_up = threading.Event()
+    release = threading.Event()
+    all_handled = threading.Event()
+
+    def handle(bar):
+        picked_up.set()
+        release.wait(timeout=2)
+        handled.append(bar)
+        if len(handled) == 3:
+            all_handled.set()
+
+    runner._handle_bar = handle
+    runner._bar_queue = type(runner._bar_queue)(maxsize=2)
+    runner._start_bar_worker()
+    bars = [_bar(i, "5000.00") for i in range(5)]
+    runner._on_bar(bars[0])
+    assert picked_up.wait(timeout=2)  # worker holds bar 0, so the queue fills at bar 3
+    for bar in bars[1:]:
+        runner._on_bar(bar)
+    release.set()
+    assert all_handled.wait(timeout=2)
+    runner._stop_bar_worker()
+
+    assert handled == bars[:3]
+    assert runner._bars_dropped == 2
+
+
+def test_health_snapshot_reports_last_check_without_alerting():
+    alerts = []
+    health = HealthCheck(max_consecutive_errors=1, alert_callback=lambda lvl, msg: alerts.append(msg))
+    assert health.snapshot()["status"] == "healthy"
+
+    health.record_error("boom")
+    assert health.snapshot()["errors_today"] == 1
+    assert alerts == []
+
+    checked = health.check(position=0)
+    assert alerts == checked["issues"] == ["ERROR_THRESHOLD: 1 consecutive errors"]
+    snap = health.snapshot()
+    assert (snap["status"], snap["issues"]) == ("critical", checked["issues"])
+    assert len(alerts) == 1
+
+    health.record_bar()  # resets consecutive errors
+    assert health.check(position=0) is checked  # pooled buffer, refreshed in place
+    assert (checked["status"], checked["issues"]) == ("healthy", [])
+    assert snap["issues"] == ["ERROR_THRESHOLD: 1 consecutive errors"]
+
+    health.record_bar()
+    assert health.snapshot()["bars_processed"] == 2
+    assert checked["bars_processed"] == 1  # snapshot() never writes check()'s buffer
+
+
+def test_position_snapshot_is_cached_until_ttl_or_fill():
+    runner = _runner()
+    adapter = runner._adapter
+    runner.POSITION_SNAPSHOT_TTL_S = 60.0
+
+    assert runner._position() == 0
+    assert runner._position() == 0
+    assert adapter.checks == 1
+
+    runner._on_fill({"position": 1})
+    runner._position()
+    assert adapter.checks == 2
+
+
+def test_reconcile_skipped_while_flat_without_new_fills():
+    runner = _runner()
+    runner.POSITION_SNAPSHOT_TTL_S = 0.0
+
+    assert runner._reconcile_due(100.0)  # first reconcile always runs
+    runner._last_recon_mono = 100.0
+    assert not runner._reconcile_due(130.0)
+    assert runner._reconcile_due(100.0 + runner.RECONCILE_IDLE_INTERVAL_S)
+
+    runner._last_fill_mono = 120.0
+    assert runner._reconcile_due(130.0)
+
+    runner._last_fill_mono = 0.0
+    runner._adapter.get_position_snapshot = lambda: {"position": 1}
+    assert runner._reconcile_due(130.0)
+
+
+def test_bars_skip_engines_while_kill_switch_is_engaged():
+    runner = _runner()
+    runner._adapter._kill_switch = True
+    runner._process_bar = lambda bar, now=None: (_ for _ in ()).throw(AssertionError("engines ran"))
+
+    runner._on_bar(_bar(0, "5000.00"))
+
+    snap = runner._health.snapshot()
+    assert (snap["bars_processed"], snap["errors_today"]) == (1, 0)
+
+
+def test_shutdown_signal_wakes_run_loop_immediately(caplog):
+    import logging
+    import signal
+
+    runner = _runner()
+    t = threading.Thread(target=runner.run)
+    with caplog.at_level(logging.INFO, logger="trading_bot.core.live_runner"):
+        t.start()
+        assert runner._adapter.checked.wait(timeout=2)  # loop has run its first tick
+        started = time.monotonic()
+        runner._handle_shutdown(signal.SIGTERM, None)
+        t.join(timeout=2)
+
+    assert not t.is_alive() and time.monotonic() - started < 1.0
+    assert f"Received signal {signal.SIGTERM}" in caplog.text
+
+
+def test_entry_bracket_and_flatten_orders_share_the_runner_symbol(tmp_path):
+    from types import SimpleNamespace
+
+    from trading_bot.adapters.tradovate_live import TradovateLiveAdapter
+
+    adapter = TradovateLiveAdapter(config=TradovateConfig(username="u", password="p"))
+    posted = []
+
+    def post(path, payload):
+        posted.append(payload)
+        return {"orderId": len(posted)}
+
+    adapter._post = post
+    runner = _processing_runner(tmp_path)
+    runner.symbol = "MESH5"
+    runner._adapter = adapter
+    decision = SimpleNamespace(
+        order_intent={"direction": "LONG", "contracts": 1, "stop_ticks": 8, "target_ticks": 12},
+        metadata={},
+    )
+    runner._execute_order(decision, _bar(0, "5000.00"), datetime(2025, 1, 2, 15, tzinfo=timezone.utc), {}, {})
+    adapter._position = 1
+    adapter.flatten_positions()
+
+    assert [p["orderType"] for p in posted] == ["Limit", "Stop", "Limit", "Market"]
+    assert {p["symbol"] for p in posted} == {"MESH5"}
+
+
+def _failing_start_runner(tmp_path, monkeypatch, adapter_ok: bool = False) -> LiveRunner:
+    import trading_bot.core.live_runner as live_runner
+
+    class _StartAdapter:
+        _access_token = "token"
+
+        def __init__(self, **kwargs):
+            pass
+
+        def start(self):
+            return adapter_ok
+
+    class _DeadFeed:
+        def __init__(self, **kwargs):
+            pass
+
+        def start(self):
+            return False
+
+    monkeypatch.setattr(live_runner, "TradovateLiveAdapter", _StartAdapter)
+    monkeypatch.setattr(live_runner, "TradovateDataFeed", _DeadFeed)
+    # EvolutionEngine persists default params under data/ on first use
+    monkeypatch.setattr(live_runner, "EvolutionEngine", lambda **kwargs: None)
+    return LiveRunner(
+        tradovate_config=TradovateConfig(username="u", password="p"),
+        db_path=str(tmp_path / "events.sqlite"),
+    )
+
+
+def test_failed_start_stops_the_flusher(tmp_path, monkeypatch):
+    runner = _failing_start_runner(tmp_path, monkeypatch)
+
+    assert runner.start() is False
+    assert runner._state is RunnerState.ERROR
+    assert runner._flusher is None
+    assert not any(t.name == "event-flusher" for t in threading.enumerate())
+
+
+def test_failed_feed_start_stops_the_bar_worker(tmp_path, monkeypatch):
+    runner = _failing_start_runner(tmp_path, monkeypatch, adapter_ok=True)
+
+    assert runner.start() is False
+    assert runner._state is RunnerState.ERROR
+    assert runner._bar_worker is None and runner._flusher is None
+    assert not any(t.name in ("bar-worker", "event-flusher") for t in threading.enumerate())
+
+
+def test_run_before_start_raises():
+    import pytest
+
+    runner = LiveRunner(tradovate_config=TradovateConfig(username="u", password="p"))
+    with pytest.raises(RuntimeError, match="before start"):
+        runner.run()
+
+
+def test_stop_discards_queued_bars_before_flattening():
+    runner = _runner()
+    runner._state = RunnerState.RUNNING
+    calls = []
+    picked_up = threading.Event()
+    release = threading.Event()
+
+    class _StopFeed:
+        def stop(self):
+            release.set()  # the in-flight bar finishes while stop() proceeds
+
+    class _StopAdapter:
+        def cancel_all(self):
+            calls.append("cancel_all")
+
+        def flatten_positions(self):
+            calls.append("flatten_positions")
+
+        def stop(self):
+            calls.append("stop")
+
+    def handle(bar):
+        picked_up.set()
+        release.wait(timeout=2)
+        calls.append(f"bar {bar.timestamp.minute}")
+
+    runner._handle_bar = handle
+    runner._data_feed = _StopFeed()
+    runner._adapter = _StopAdapter()
+    runner._start_bar_worker()
+    runner._on_bar(_bar(0, "5000.00"))
+    assert picked_up.wait(timeout=2)
+    for i in range(1, 4):
+        runner._on_bar(_bar(i, "5000.00"))
+
+    runner.stop()
+
+    assert calls == ["bar 0", "cancel_all", "flatten_positions", "stop"]
+    assert runner._bar_worker is None and runner._bar_queue.empty()